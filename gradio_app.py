@@ -38,7 +38,7 @@ def main():
             with gr.TabItem("📄 단일 파일 번역기"):
                 create_file_translator_ui(config_state)
             with gr.TabItem("🛠️ 번역 업데이트"):
-                create_update_modpack_ui()
+                create_update_modpack_ui(config_state)
             with gr.TabItem("⚙️ 모델 설정"):
                 create_model_settings_ui(config_state)
 
@@ -1,24 +1,41 @@
 import json
 import logging
 import os
+import shutil
+import time
 import traceback
 import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from glob import escape as glob_escape
 from glob import glob
 
+from gradio_modules.jar_scanner import collect_jars_dictionary_pairs, scan_jars
+from gradio_modules.modpack_index import ModpackIndex
 from gradio_modules.utils import extract_lang_content
+from minecraft_modpack_auto_translator import vfs
 from minecraft_modpack_auto_translator.config import (
+    ARCHIVE_COMPRESS_LEVEL,
+    DICTIONARY_BUILD_PARALLEL_MIN,
+    DICTIONARY_BUILD_WORKERS,
     DICTIONARY_PREFIX_WHITELIST,
+    DICTIONARY_SOURCE_WEIGHTS,
     DICTIONARY_SUFFIX_BLACKLIST,
-    DIR_FILTER_WHITELIST,
-    OFFICIAL_EN_LANG_FILE,
-    OFFICIAL_KO_LANG_FILE,
 )
-from minecraft_modpack_auto_translator.finger_print import fingerprint_file
+from minecraft_modpack_auto_translator.glossary import get_official_glossary
 from minecraft_modpack_auto_translator.parsers.base_parser import BaseParser
+from minecraft_modpack_auto_translator.zip_utils import ParallelZipWriter
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# Linux의 reflink(copy-on-write 복제) ioctl 번호
+_FICLONE = 0x40049409
+
 
 def add_to_dictionary(
     en_value, ko_value, translation_dictionary, translation_dictionary_lowercase
@@ -43,32 +60,82 @@ def add_to_dictionary(
     return translation_dictionary, translation_dictionary_lowercase
 
 
-def initialize_translation_dictionary(source_lang_code, target_lang_code):
-    """공식 번역 및 커스텀 사전으로 번역 사전을 초기화합니다."""
+def tag_dictionary_sources(dictionary_sources, pairs, source):
+    """
+    사전 항목의 출처와 등장 횟수를 기록합니다. 후보 순위는 이 통계를 사용합니다.
+
+    같은 후보가 나올 때마다 등장 횟수가 오르고 점수는 출처 가중치만큼 오릅니다.
+
+    Args:
+        dictionary_sources: {소문자 영어: {한국어 후보: [점수, 등장 횟수, 출처 집합]}}
+            (None이면 기록하지 않음)
+        pairs: (영어, 한국어) 목록
+        source: 출처 ("custom", "official", "existing", "llm" 등)
+    """
+    if dictionary_sources is None:
+        return
+    weight = DICTIONARY_SOURCE_WEIGHTS.get(source, 1)
+    for en_value, ko_value in pairs:
+        candidates = dictionary_sources.setdefault(en_value.lower(), {})
+        stats = candidates.get(ko_value)
+        if stats is None:
+            candidates[ko_value] = [weight, 1, {source}]
+        else:
+            stats[0] += weight
+            stats[1] += 1
+            stats[2].add(source)
+
+
+def iter_dictionary_pairs(translation_dictionary):
+    """번역 사전의 (영어, 한국어) 항목을 후보 목록을 펼쳐 반환합니다."""
+    for en_value, ko_value in translation_dictionary.items():
+        for value in ko_value if isinstance(ko_value, list) else [ko_value]:
+            yield en_value, value
+
+
+def initialize_translation_dictionary(
+    source_lang_code, target_lang_code, dictionary_sources=None
+):
+    """
+    공식 번역 및 커스텀 사전으로 번역 사전을 초기화합니다.
+
+    dictionary_sources가 주어지면 공식 용어집 항목을 "official"로 기록합니다.
+    """
     translation_dictionary = {}
     translation_dictionary_lowercase = {}
     # 공식 마인크래프트 번역 파일에서 사전 구축 (en_us -> ko_kr)
+    # 미리 빌드된 용어집 인덱스를 사용하여 매 작업마다 사전을 다시 만들지 않습니다.
     if source_lang_code == "en_us" and target_lang_code == "ko_kr":
-        for key, en_val in OFFICIAL_EN_LANG_FILE.items():
-            if key in OFFICIAL_KO_LANG_FILE:
-                ko_val = OFFICIAL_KO_LANG_FILE[key]
-                if en_val and ko_val:
-                    add_to_dictionary(
-                        en_val,
-                        ko_val,
-                        translation_dictionary,
-                        translation_dictionary_lowercase,
-                    )
+        glossary = get_official_glossary(source_lang_code, target_lang_code)
+        if glossary is not None:
+            translation_dictionary, translation_dictionary_lowercase = (
+                glossary.to_dictionary()
+            )
+            tag_dictionary_sources(
+                dictionary_sources,
+                iter_dictionary_pairs(translation_dictionary),
+                "official",
+            )
     return translation_dictionary, translation_dictionary_lowercase
 
 
 def load_custom_dictionary(
-    custom_dict_file, translation_dictionary, translation_dictionary_lowercase
+    custom_dict_file,
+    translation_dictionary,
+    translation_dictionary_lowercase,
+    dictionary_sources=None,
 ):
-    """업로드된 커스텀 사전 파일을 로드하고 기존 사전에 병합합니다."""
+    """
+    업로드된 커스텀 사전 파일을 로드하고 기존 사전에 병합합니다.
+
+    dictionary_sources가 주어지면 커스텀 사전 항목을 "custom"으로 기록합니다.
+    """
     if custom_dict_file is not None:
         with open(custom_dict_file, "r", encoding="utf-8") as f:
             data = json.load(f)
+        tag_dictionary_sources(
+            dictionary_sources, iter_dictionary_pairs(data), "custom"
+        )
         for en, ko in data.items():
             if isinstance(ko, list):
                 for k in ko:
@@ -104,107 +171,72 @@ def process_modpack_directory(
     translate_kubejs=True,
     translate_mods=True,
     translate_patchouli_books=True,
+    jar_workers=None,
 ):
-    """모드팩 디렉토리에서 번역 대상 파일을 찾습니다."""
+    """
+    모드팩 디렉토리에서 번역 대상 파일을 찾습니다.
+
+    Args:
+        jar_workers: JAR 처리 프로세스 수 (None이면 JAR_SCAN_WORKERS 설정 사용)
+    """
     from gradio_modules.utils import get_supported_extensions
 
+    # 디렉토리는 한 번만 순회하고 이후 단계는 색인을 사용
+    index = ModpackIndex.build(modpack_path)
+
     try:
-        extact_all_zip_files(modpack_path)
+        extact_all_zip_files(modpack_path, index)
     except Exception:
         logger.error(f"데이터팩, 리소스팩 zip 파일 추출 실패: {modpack_path}")
 
     supported_exts = get_supported_extensions()
-    src_lower = source_lang_code.lower()
     files = []
     # config
     if translate_config:
-        cfg_pattern = normalize_glob_path(os.path.join(modpack_path, "config/**/*.*"))
-        for f in glob(cfg_pattern, recursive=True):
-            f = f.replace("\\", "/")
-            ext = os.path.splitext(f)[1]
-            if ext in supported_exts and any(d in f for d in DIR_FILTER_WHITELIST):
-                if "lang/" in f:
-                    if ext in supported_exts and src_lower in f.lower():
-                        files.append(f)
-                else:
-                    files.append(f)
-            elif ext in supported_exts and src_lower in f.lower():
-                files.append(f)
+        files.extend(
+            index.select_translation_files("config", supported_exts, source_lang_code)
+        )
 
     logger.info(f"찾은 파일: {len(files)}개 (config 처리)")
     # kubejs
     if translate_kubejs:
-        kjs_pattern = normalize_glob_path(os.path.join(modpack_path, "kubejs/**/*.*"))
-        for f in glob(kjs_pattern, recursive=True):
-            f = f.replace("\\", "/")
-            ext = os.path.splitext(f)[1]
-            if ext in supported_exts and any(d in f for d in DIR_FILTER_WHITELIST):
-                if "lang/" in f:
-                    if ext in supported_exts and src_lower in f.lower():
-                        files.append(f)
-                else:
-                    files.append(f)
-            elif ext in supported_exts and src_lower in f.lower():
-                files.append(f)
+        files.extend(
+            index.select_translation_files("kubejs", supported_exts, source_lang_code)
+        )
 
     logger.info(f"찾은 파일: {len(files)}개 (kubejs 처리)")
     # patchouli
     if translate_patchouli_books:
-        patchouli_pattern = normalize_glob_path(
-            os.path.join(modpack_path, "patchouli_books/**/*.*")
+        files.extend(
+            index.select_translation_files(
+                "patchouli_books", supported_exts, source_lang_code
+            )
         )
-        for f in glob(patchouli_pattern, recursive=True):
-            f = f.replace("\\", "/")
-            ext = os.path.splitext(f)[1]
-            if ext in supported_exts and any(d in f for d in DIR_FILTER_WHITELIST):
-                if "lang/" in f:
-                    if ext in supported_exts and src_lower in f.lower():
-                        files.append(f)
-                else:
-                    files.append(f)
-            elif ext in supported_exts and src_lower in f.lower():
-                files.append(f)
 
     logger.info(f"찾은 파일: {len(files)}개 (patchouli 책 처리)")
     # mods
     jar_files = []
     fingerprints = {}
     if translate_mods:
-        jar_pattern = normalize_glob_path(os.path.join(modpack_path, "mods/*.jar"))
-        for jar in glob(jar_pattern):
-            fingerprints[os.path.basename(jar)] = fingerprint_file(jar)
-            with zipfile.ZipFile(jar, "r") as zf:
-                logger.info(f"Jar 압축 해제중: {jar}")
-                out_dir = os.path.join(
-                    modpack_path,
-                    "mods",
-                    "extracted",
-                    os.path.basename(jar),
-                )
-                os.makedirs(out_dir, exist_ok=True)
-                is_extracted = False
-                for entry in zf.namelist():
-                    if os.path.splitext(entry)[1].lower() in (
-                        ".sbnt",
-                        ".txt",
-                        ".json",
-                        ".zip",
-                        ".lang",
-                        ".md",
-                    ) or any(d in entry for d in DIR_FILTER_WHITELIST):
-                        try:
-                            zf.extract(entry, out_dir)
-                            is_extracted = True
-                        except Exception:
-                            logger.error(f"JAR 파일에서 추출 실패: {entry} ({jar})")
-                if is_extracted:
-                    for entry in zf.namelist():
-                        if os.path.splitext(entry)[1] in supported_exts and (
-                            any(d in entry for d in DIR_FILTER_WHITELIST)
-                            or src_lower in entry.lower()
-                        ):
-                            files.append(os.path.join(out_dir, entry))
-            jar_files.append(jar)
+        # mods/*.jar (하위 폴더 제외)
+        jar_paths = [
+            item.path
+            for item in index.in_category("mods")
+            if item.ext == ".jar" and item.rel.count("/") == 1
+        ]
+        # JAR별 핑거프린트 계산과 추출은 프로세스 풀에서 병렬로 처리하고 JAR 경로 순으로 합침
+        for result in scan_jars(
+            jar_paths,
+            os.path.join(modpack_path, "mods", "extracted"),
+            supported_exts,
+            source_lang_code,
+            jar_workers,
+        ):
+            if result["error"]:
+                continue
+            fingerprints[os.path.basename(result["jar"])] = result["fingerprint"]
+            files.extend(result["files"])
+            jar_files.append(result["jar"])
 
     logger.info(f"찾은 파일: {len(files)}개 (mods 처리)")
     return files, jar_files, fingerprints
@@ -215,208 +247,418 @@ def build_dictionary_from_jar(
     translation_dictionary,
     translation_dictionary_lowercase,
     source_lang_code,
+    max_workers=None,
+    dictionary_sources=None,
 ):
-    """JAR 파일 내부의 언어 파일에서 번역 사전을 구축합니다."""
-
+    """
+    JAR 파일 내부의 언어 파일에서 번역 사전을 구축합니다.
+
+    JAR마다 항목 이름을 한 번만 훑어 언어별로 색인하고, 원본/한글 파일 쌍을 해시 조회로
+    찾습니다. JAR은 프로세스 풀에서 병렬로 처리하고 결과를 사전에 합칩니다.
+    dictionary_sources가 주어지면 항목을 "existing"으로 기록합니다.
+    """
+    started = time.perf_counter()
     count, added = 0, 0
-    for jar in jar_files:
-        with zipfile.ZipFile(jar, "r") as zf:
-            for f in zf.namelist():
-                if source_lang_code.lower() in f.lower():
-                    target = f.replace(source_lang_code, "ko_kr").replace(
-                        source_lang_code.split("_")[0]
-                        + "_"
-                        + source_lang_code.split("_")[1].upper(),
-                        "ko_KR",
-                    )
-                    if target in zf.namelist():
-                        en_c = zf.read(f).decode("utf-8", errors="ignore")
-                        ko_c = zf.read(target).decode("utf-8", errors="ignore")
-                        parser = BaseParser.get_parser_by_extension(
-                            os.path.splitext(f)[1]
-                        )
-                        en_data = parser.load(en_c)
-                        ko_data = parser.load(ko_c)
-                        for k, v in en_data.items():
-                            if (
-                                k in ko_data
-                                and isinstance(v, str)
-                                and isinstance(ko_data[k], str)
-                            ):
-                                clean_e = v.replace("_", "")
-                                clean_k = ko_data[k].replace("_", "")
-                                (
-                                    translation_dictionary,
-                                    translation_dictionary_lowercase,
-                                ) = add_to_dictionary(
-                                    clean_e,
-                                    clean_k,
-                                    translation_dictionary,
-                                    translation_dictionary_lowercase,
-                                )
-                                added += 1
-                        count += 1
+    results = collect_jars_dictionary_pairs(jar_files, source_lang_code, max_workers)
+    for result in results:
+        if result["error"]:
+            logger.error(f"JAR 사전 구축 실패: {result['jar']} ({result['error']})")
+            continue
+        added += add_pairs_to_dictionary(
+            result["pairs"], translation_dictionary, translation_dictionary_lowercase
+        )
+        tag_dictionary_sources(dictionary_sources, result["pairs"], "existing")
+        count += result["files"]
+    logger.info(
+        f"JAR 사전 구축: JAR {len(results)}개, 언어 파일 {count}개, "
+        f"항목 {added}개, {time.perf_counter() - started:.2f}초 "
+        f"(작업 시간 합계 {sum(r['elapsed'] for r in results):.2f}초)"
+    )
     return translation_dictionary, translation_dictionary_lowercase, count, added
 
 
+# 사전에 넣을 키의 앞/뒤 구성 요소 (키마다 목록을 순회하지 않도록 집합으로 둠)
+_PREFIX_WHITELIST = frozenset(DICTIONARY_PREFIX_WHITELIST)
+_SUFFIX_BLACKLIST = frozenset(DICTIONARY_SUFFIX_BLACKLIST)
+
+
+def add_pairs_to_dictionary(
+    pairs, translation_dictionary, translation_dictionary_lowercase
+):
+    """
+    (영어, 한국어) 목록을 한 번에 사전에 추가합니다.
+
+    add_to_dictionary()와 같은 규칙으로 중복을 처리하되, 항목마다 함수를 호출하지 않습니다.
+
+    Returns:
+        추가한 항목 수
+    """
+    for en_value, ko_value in pairs:
+        key_lower = en_value.lower()
+        orig_key = translation_dictionary_lowercase.get(key_lower)
+        if orig_key is None:
+            translation_dictionary[en_value] = ko_value
+            translation_dictionary_lowercase[key_lower] = en_value
+            continue
+        target = translation_dictionary[orig_key]
+        if isinstance(target, list):
+            if ko_value not in target:
+                target.append(ko_value)
+        elif isinstance(target, str) and target != ko_value:
+            translation_dictionary[orig_key] = [target, ko_value]
+    return len(pairs)
+
+
+def extract_dictionary_pairs(en_file, ko_file):
+    """
+    원본/한글 언어 파일 한 쌍에서 사전 항목을 모읍니다.
+
+    프로세스 풀 작업자에서 실행되므로 모듈 최상위 함수로 두고,
+    사전에 바로 넣지 않고 (영어, 한국어) 목록을 반환합니다.
+
+    Returns:
+        {"file", "counted", "pairs", "error"}
+    """
+    result = {"file": en_file, "counted": False, "pairs": [], "error": None}
+    try:
+        en_data = extract_lang_content(en_file)
+        ko_data = extract_lang_content(ko_file)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+    if not isinstance(en_data, dict) or not isinstance(ko_data, dict):
+        return result
+
+    pairs = result["pairs"]
+    for key, en_value in en_data.items():
+        ko_value = ko_data.get(key)
+        if (
+            not isinstance(ko_value, str)
+            or not isinstance(en_value, str)
+            or en_value == ko_value
+        ):
+            continue
+        if (
+            key.partition(".")[0] in _PREFIX_WHITELIST
+            and key.rpartition(".")[2] not in _SUFFIX_BLACKLIST
+        ):
+            pairs.append((en_value.replace("_", ""), ko_value.replace("_", "")))
+    result["counted"] = True
+    return result
+
+
 def build_dictionary_from_files(
     en_us_files,
     modpack_path,
     translation_dictionary,
     translation_dictionary_lowercase,
     source_lang_code,
+    max_workers=None,
+    dictionary_sources=None,
 ):
-    """파일 시스템 내 언어 파일에서 번역 사전을 구축합니다."""
-    count, added = 0, 0
+    """
+    파일 시스템 내 언어 파일에서 번역 사전을 구축합니다.
+
+    파일 쌍마다 읽기와 파싱은 프로세스 풀에서 병렬로 처리하고,
+    모은 항목은 파일 순서대로 사전에 합칩니다.
+
+    Args:
+        max_workers: 작업자 수 (0 또는 None이면 DICTIONARY_BUILD_WORKERS, 1이면 순차 처리)
+        dictionary_sources: 항목을 "existing"으로 기록할 출처 사전 (선택)
+    """
+    started = time.perf_counter()
+    file_pairs = []
     for en_file in en_us_files:
-        rel = en_file
-        target = rel.replace(
-            source_lang_code,
-            "ko_kr",
-        ).replace(
-            source_lang_code.split("_")[0]
-            + "_"
-            + source_lang_code.split("_")[1].upper(),
-            "ko_KR",
-        )
+        target = get_korean_lang_path(en_file, source_lang_code)
+        if target != en_file and vfs.exists(target):
+            file_pairs.append((en_file, target))
+
+    if not max_workers:
+        max_workers = DICTIONARY_BUILD_WORKERS or os.cpu_count() or 1
+    if len(file_pairs) < DICTIONARY_BUILD_PARALLEL_MIN:
+        max_workers = 1
+
+    if max_workers == 1:
+        results = [extract_dictionary_pairs(*pair) for pair in file_pairs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    extract_dictionary_pairs,
+                    *zip(*file_pairs),
+                    chunksize=max(1, len(file_pairs) // (max_workers * 4)),
+                )
+            )
 
-        if os.path.exists(target) and target != en_file:
-            try:
-                en_data = extract_lang_content(en_file)
-                ko_data = extract_lang_content(target)
-                if isinstance(en_data, dict) and isinstance(ko_data, dict):
-                    for key, ev in en_data.items():
-                        if (
-                            key in ko_data
-                            and isinstance(ev, str)
-                            and isinstance(ko_data[key], str)
-                        ):
-                            if ev == ko_data[key]:
-                                continue
-                            if (
-                                key.split(".")[0] in DICTIONARY_PREFIX_WHITELIST
-                                and key.split(".")[-1]
-                                not in DICTIONARY_SUFFIX_BLACKLIST
-                            ):
-                                clean_e = ev.replace("_", "")
-                                clean_k = ko_data[key].replace("_", "")
-                                (
-                                    translation_dictionary,
-                                    translation_dictionary_lowercase,
-                                ) = add_to_dictionary(
-                                    clean_e,
-                                    clean_k,
-                                    translation_dictionary,
-                                    translation_dictionary_lowercase,
-                                )
-                                added += 1
-                    count += 1
-            except Exception:
-                logger.error(f"기존 번역에서 파일 읽기 실패: {en_file}")
+    count, added = 0, 0
+    for result in results:
+        if result["error"]:
+            logger.error(f"기존 번역에서 파일 읽기 실패: {result['file']}")
+            continue
+        added += add_pairs_to_dictionary(
+            result["pairs"], translation_dictionary, translation_dictionary_lowercase
+        )
+        tag_dictionary_sources(dictionary_sources, result["pairs"], "existing")
+        count += result["counted"]
+    logger.info(
+        f"기존 번역 사전 구축: 언어 파일 {count}개, 항목 {added}개, "
+        f"{time.perf_counter() - started:.2f}초 (작업자 {max_workers}개)"
+    )
     return translation_dictionary, translation_dictionary_lowercase, count, added
 
 
+def get_korean_lang_path(input_path, source_lang_code):
+    """원본 언어 파일 경로에 대응하는 한글 번역 파일 경로를 반환합니다."""
+    return input_path.replace(source_lang_code, "ko_kr").replace(
+        source_lang_code.split("_")[0] + "_" + source_lang_code.split("_")[1].upper(),
+        "ko_KR",
+    )
+
+
 def filter_korean_lang_files(files, source_lang_code):
-    """한글 번역 파일을 필터링합니다."""
+    """
+    각 파일에 대응하는 한글 번역 파일 경로를 찾아 붙입니다.
+
+    한글 번역 내용은 여기서 읽지 않습니다. 작업이 실제로 시작될 때
+    load_korean_lang_data()로 읽어 전체 파일을 한꺼번에 메모리에 올리지 않습니다.
+    """
     filtered_files = []
 
     for f in files:
-        ko_path = (
-            f["input"]
-            .replace(source_lang_code, "ko_kr")
-            .replace(
-                source_lang_code.split("_")[0]
-                + "_"
-                + source_lang_code.split("_")[1].upper(),
-                "ko_KR",
-            )
+        ko_path = get_korean_lang_path(f["input"], source_lang_code)
+        if ko_path == f["input"] or not vfs.exists(ko_path):
+            ko_path = None
+        filtered_files.append(
+            {
+                "input": f["input"],
+                "output": f["output"],
+                "ko_path": ko_path,
+            }
         )
-        added = False
-        if os.path.exists(ko_path):
-            if ko_path != f["input"]:
-                with open(ko_path, "r", encoding="utf-8") as file:
-                    parser = BaseParser.get_parser_by_extension(
-                        os.path.splitext(f["input"])[1]
-                    )
-                    try:
-                        ko_data = parser.load(file.read())
-                    except Exception:
-                        ko_data = {}
-                    if ko_data:
-                        added = True
-                        filtered_files.append(
-                            {
-                                "input": f["input"],
-                                "output": f["output"],
-                                "data": ko_data,
-                            }
-                        )
-        if not added:
-            filtered_files.append(
-                {
-                    "input": f["input"],
-                    "output": f["output"],
-                    "data": {},
-                }
-            )
     return filtered_files
 
 
-def extact_all_zip_files(modpack_path):
-    zip_files = glob(
-        normalize_glob_path(os.path.join(modpack_path, "**", "*.zip")), recursive=True
-    )
+def load_korean_lang_data(pair, original=None):
+    """
+    파일 쌍의 한글 번역 데이터를 읽습니다. 없거나 파싱할 수 없으면 빈 사전을 반환합니다.
+
+    original(원본 데이터)이 주어지면 번역을 건너뛰는 데 필요한 키만 남깁니다.
+    원본과 다른 한글 번역이 있는 키만 확인하므로 나머지는 메모리에 두지 않습니다.
+
+    Args:
+        pair: filter_korean_lang_files()가 만든 파일 쌍
+        original: 원본 언어 파일의 파싱된 데이터
+    """
+    if "data" in pair:
+        return pair["data"]
+    ko_path = pair.get("ko_path")
+    if not ko_path:
+        return {}
+    # patchouli 책은 한글 번역이 있어도 다시 번역하므로 읽을 필요가 없음
+    if original is not None and "patchouli_books" in pair["input"]:
+        return {}
+    parser = BaseParser.get_parser_by_extension(os.path.splitext(pair["input"])[1])
+    try:
+        ko_data = parser.load(vfs.read_text(ko_path)) or {}
+    except Exception:
+        return {}
+    if original is None:
+        return ko_data
+    return {
+        key: value
+        for key, value in ko_data.items()
+        if value is not None and key in original and original[key] != value
+    }
+
+
+def _clone_file(src, dst):
+    """
+    파일을 하드 링크, 가능하면 reflink(copy-on-write), 안 되면 복사로 만듭니다.
+
+    번역 결과는 임시 파일을 만든 뒤 교체하는 방식으로 저장되므로,
+    링크된 출력 파일을 덮어써도 입력 파일은 바뀌지 않습니다.
+
+    Returns:
+        "link", "reflink", "copy" 중 사용한 방식
+    """
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+        return "link"
+    except OSError:
+        pass
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return "reflink"
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def _clone_tree(src_dir, dst_dir):
+    """src_dir 아래의 파일을 dst_dir에 같은 구조로 링크하거나 복사합니다."""
+    methods = {}
+    for root, _, files in os.walk(src_dir):
+        target_root = os.path.join(dst_dir, os.path.relpath(root, src_dir))
+        os.makedirs(target_root, exist_ok=True)
+        for file in files:
+            method = _clone_file(
+                os.path.join(root, file), os.path.join(target_root, file)
+            )
+            methods[method] = methods.get(method, 0) + 1
+    return methods
+
+
+def extact_all_zip_files(modpack_path, index=None):
+    """
+    paxi/openloader의 zip 파일을 .zip_extracted 폴더로 추출합니다.
+
+    압축은 입력 폴더에 한 번만 풀고, 출력 폴더(/input/ -> /output/)에는 같은 파일을
+    하드 링크(또는 reflink/복사)로 만듭니다.
+    색인이 주어지면 색인에서 zip 파일을 찾고, 새로 추출한 폴더를 색인에 추가합니다.
+    """
+    if index is None:
+        index = ModpackIndex.build(modpack_path)
+    zip_files = [
+        item.path for item in index.with_extension(".zip") if item.ext == ".zip"
+    ]
     for zip_file in zip_files:
-        with zipfile.ZipFile(zip_file, "r") as zf:
-            if "paxi" in zip_file or "openloader" in zip_file:
-                zip_file_edited = zip_file.replace("\\", "/") + ".zip_extracted"
-                zip_file_edited_output = zip_file_edited.replace("/input/", "/output/")
+        if "paxi" not in zip_file and "openloader" not in zip_file:
+            continue
+        zip_file_edited = zip_file.replace("\\", "/") + ".zip_extracted"
+        zip_file_edited_output = zip_file_edited.replace("/input/", "/output/")
+
+        if os.path.exists(zip_file_edited):
+            logger.info(f"이미 추출된 파일: {zip_file}")
+            continue
+
+        os.makedirs(zip_file_edited, exist_ok=True)
+        os.makedirs(zip_file_edited_output, exist_ok=True)
+
+        logger.info(f"'{zip_file}' 파일을 '{zip_file_edited}' 폴더로 추출 준비 중...")
+        try:
+            with zipfile.ZipFile(zip_file, "r") as zf:
+                zf.extractall(zip_file_edited)
+            if zip_file_edited_output != zip_file_edited:
+                methods = _clone_tree(zip_file_edited, zip_file_edited_output)
+                logger.debug(f"출력 폴더 구성: {zip_file_edited_output} {methods}")
+        except Exception:
+            logger.error(f"zip 파일 추출 실패: {zip_file}")
+        index.add_directory(zip_file_edited)
+    return zip_files
 
-                if os.path.exists(zip_file_edited):
-                    logger.info(f"이미 추출된 파일: {zip_file}")
-                    continue
 
-                os.makedirs(zip_file_edited, exist_ok=True)
-                os.makedirs(zip_file_edited_output, exist_ok=True)
+def _find_source_zip(zip_path):
+    """복구할 zip의 원본 zip을 찾습니다. (출력 폴더라면 입력 폴더의 같은 zip)"""
+    if os.path.isfile(zip_path):
+        return zip_path
+    source = zip_path.replace("/output/", "/input/")
+    if source != zip_path and os.path.isfile(source):
+        return source
+    return None
 
-                logger.info(
-                    f"'{zip_file}' 파일을 '{zip_file_edited}' 폴더로 추출 준비 중..."
-                )
-                try:
-                    zf.extractall(zip_file_edited)
-                    zf.extractall(zip_file_edited_output)
-                except Exception:
-                    logger.error(f"zip 파일 추출 실패: {zip_file}")
-    return zip_files
 
+def _is_unchanged_entry(file_path, info, source_file):
+    """
+    추출한 뒤 바뀌지 않은 파일인지 확인합니다.
 
-def restore_zip_files(modpack_path, source_lang="en_us"):
-    """.zip_extracted 폴더들을 찾아 원본 zip 파일로 복구합니다."""
+    입력 폴더의 파일과 링크로 연결되어 있으면 바로 판단하고,
+    아니면 크기와 CRC를 원본 항목과 비교합니다.
+    """
+    try:
+        if source_file is not None and os.path.samefile(file_path, source_file):
+            return True
+        if os.path.getsize(file_path) != info.file_size:
+            return False
+        with open(file_path, "rb") as f:
+            crc = 0
+            while chunk := f.read(1024 * 1024):
+                crc = zlib.crc32(chunk, crc)
+        return crc == info.CRC
+    except OSError:
+        return False
+
+
+def restore_zip_files(
+    modpack_path, source_lang="en_us", compresslevel=ARCHIVE_COMPRESS_LEVEL
+):
+    """
+    .zip_extracted 폴더들을 찾아 원본 zip 파일로 복구합니다.
+
+    번역되지 않은 파일은 원본 zip의 압축된 항목을 그대로 복사하고,
+    바뀐 파일만 다시 압축합니다.
+
+    Args:
+        compresslevel: 압축 수준 (다시 다른 ZIP에 담긴다면 0(무압축)으로 한 번만 압축)
+    """
     extracted_dirs = glob(
         normalize_glob_path(os.path.join(modpack_path, "**", "*.zip_extracted")),
         recursive=True,
     )
     for extracted_dir in extracted_dirs:
-        zip_path = extracted_dir.replace(".zip_extracted", "")  # .zip_extracted 제거
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for root, _, files in os.walk(extracted_dir):
-                for file in files:
-                    if (
-                        file.endswith(".tmp")
-                        or ".zip_extracted" in file
-                        or file.endswith(".converted")
-                    ):
-                        continue
-                    file_path = os.path.join(root, file)
-                    arcname = (
-                        os.path.relpath(file_path, extracted_dir)
-                        .replace(source_lang, "ko_kr")
-                        .replace(
+        # .zip_extracted 제거
+        zip_path = extracted_dir.replace(".zip_extracted", "").replace("\\", "/")
+        source_zip_path = _find_source_zip(zip_path)
+        source_dir = None
+        if source_zip_path is not None and source_zip_path != zip_path:
+            source_dir = source_zip_path + ".zip_extracted"
+        source_zip = None
+        raw_copied = 0
+        # 원본 zip과 같은 경로일 수 있으므로 임시 파일에 쓴 뒤 교체
+        part_path = zip_path + ".part"
+        try:
+            if source_zip_path is not None:
+                try:
+                    source_zip = zipfile.ZipFile(source_zip_path, "r")
+                except (OSError, zipfile.BadZipFile) as e:
+                    logger.warning(
+                        f"원본 zip을 열 수 없습니다: {source_zip_path} ({e})"
+                    )
+            with ParallelZipWriter(part_path, compresslevel) as zf:
+                for root, _, files in os.walk(extracted_dir):
+                    for file in files:
+                        if (
+                            file.endswith(".tmp")
+                            or ".zip_extracted" in file
+                            or file.endswith(".converted")
+                        ):
+                            continue
+                        file_path = os.path.join(root, file)
+                        rel = os.path.relpath(file_path, extracted_dir)
+                        arcname = rel.replace(source_lang, "ko_kr").replace(
                             source_lang.split("_")[0]
                             + "_"
                             + source_lang.split("_")[1].upper(),
                             "ko_KR",
                         )
-                    )
-                    zf.write(file_path, arcname)
+                        info = None
+                        if source_zip is not None:
+                            info = source_zip.NameToInfo.get(rel.replace(os.sep, "/"))
+                        if (
+                            info is not None
+                            and not info.is_dir()
+                            and _is_unchanged_entry(
+                                file_path,
+                                info,
+                                os.path.join(source_dir, rel) if source_dir else None,
+                            )
+                        ):
+                            zf.copy_raw_entry(source_zip, info, arcname)
+                            raw_copied += 1
+                        else:
+                            zf.write(file_path, arcname)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        finally:
+            if source_zip is not None:
+                source_zip.close()
+        os.replace(part_path, zip_path)
+        logger.debug(f"zip 복구: {zip_path} (원본 복사 {raw_copied}개)")
     return extracted_dirs
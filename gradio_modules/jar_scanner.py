@@ -0,0 +1,234 @@
+import logging
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from minecraft_modpack_auto_translator.config import (
+    DIR_FILTER_WHITELIST,
+    JAR_SCAN_WORKERS,
+)
+from minecraft_modpack_auto_translator.finger_print import fingerprint_files
+from minecraft_modpack_auto_translator.parsers.base_parser import BaseParser
+
+logger = logging.getLogger(__name__)
+
+
+def scan_jar(jar, out_dir, supported_exts, source_lang_code):
+    """
+    JAR 하나에서 번역 대상 항목을 찾습니다.
+
+    항목은 압축 해제하지 않고 `<out_dir>/<항목 경로>` 형태의 가상 경로로 반환합니다.
+    번역 단계에서는 vfs 모듈이 이 경로를 JAR 내부 항목으로 읽습니다.
+    프로세스 풀 작업자에서 실행되므로 모듈 최상위 함수로 두고 결과는 사전으로 반환합니다.
+    핑거프린트는 scan_jars()가 캐시와 함께 따로 계산하여 채웁니다.
+
+    Returns:
+        {"jar", "fingerprint", "files", "elapsed", "error"}
+    """
+    started = time.perf_counter()
+    src_lower = source_lang_code.lower()
+    result = {
+        "jar": jar,
+        "fingerprint": None,
+        "files": [],
+        "elapsed": 0.0,
+        "error": None,
+    }
+    try:
+        with zipfile.ZipFile(jar, "r") as zf:
+            for entry in zf.namelist():
+                if os.path.splitext(entry)[1] in supported_exts and (
+                    any(d in entry for d in DIR_FILTER_WHITELIST)
+                    or src_lower in entry.lower()
+                ):
+                    result["files"].append(os.path.join(out_dir, entry))
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def scan_jars(jar_paths, out_root, supported_exts, source_lang_code, max_workers=None):
+    """
+    여러 JAR을 병렬로 처리합니다.
+
+    핑거프린트는 캐시를 확인한 뒤 스레드 풀에서 계산하고,
+    항목 검색은 프로세스 풀에서 실행합니다.
+
+    Args:
+        jar_paths: JAR 파일 경로 목록
+        out_root: 가상 경로의 상위 경로 (<out_root>/<jar 이름>/<항목 경로>)
+        supported_exts: 번역 가능한 확장자 목록
+        source_lang_code: 원본 언어 코드
+        max_workers: 작업자 수 (0 또는 None이면 JAR_SCAN_WORKERS, 1이면 순차 처리)
+
+    Returns:
+        JAR 경로 순으로 정렬된 scan_jar() 결과 목록
+    """
+    jar_paths = sorted(jar_paths)
+    if not max_workers:
+        max_workers = JAR_SCAN_WORKERS or os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(jar_paths) or 1))
+    supported_exts = list(supported_exts)
+
+    started = time.perf_counter()
+    fingerprints, fingerprint_errors = fingerprint_files(jar_paths, max_workers)
+    args = [
+        (
+            jar,
+            os.path.join(out_root, os.path.basename(jar)),
+            supported_exts,
+            source_lang_code,
+        )
+        for jar in jar_paths
+    ]
+    if max_workers == 1:
+        results = [scan_jar(*arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(scan_jar, *zip(*args))) if args else []
+    elapsed = time.perf_counter() - started
+
+    for result in results:
+        result["fingerprint"] = fingerprints.get(result["jar"])
+        if result["jar"] in fingerprint_errors and not result["error"]:
+            result["error"] = fingerprint_errors[result["jar"]]
+        if result["error"]:
+            logger.error(f"JAR 처리 실패: {result['jar']} ({result['error']})")
+        else:
+            logger.debug(
+                f"JAR 처리: {os.path.basename(result['jar'])} "
+                f"{result['elapsed']:.2f}초, {len(result['files'])}개 파일"
+            )
+    slowest = sorted(results, key=lambda r: r["elapsed"], reverse=True)[:5]
+    if slowest:
+        logger.info(
+            "가장 오래 걸린 JAR: "
+            + ", ".join(
+                f"{os.path.basename(r['jar'])} {r['elapsed']:.2f}초" for r in slowest
+            )
+        )
+    logger.info(
+        f"JAR {len(results)}개 처리 완료: {elapsed:.2f}초 "
+        f"(작업 시간 합계 {sum(r['elapsed'] for r in results):.2f}초, 작업자 {max_workers}개)"
+    )
+    return results
+
+
+def index_locale_entries(names, locales):
+    """
+    JAR 항목 이름을 한 번 훑어 언어별 항목을 색인합니다.
+
+    경로에서 마지막 언어 코드 구성 요소(파일 이름 또는 폴더)를 빈칸으로 바꾼 값을
+    위치 키로 사용합니다. 같은 위치 키의 언어별 항목이 서로 대응하는 번역 파일입니다.
+    (예: assets/mod/lang/en_us.json 과 assets/mod/lang/ko_kr.json)
+    raw_ore.json 같은 이름을 언어 코드로 오인하지 않도록 요청한 언어 코드만 확인합니다.
+
+    Args:
+        names: JAR 항목 이름 목록
+        locales: 찾을 언어 코드 목록 (대소문자 무시)
+
+    Returns:
+        {위치 키: {소문자 언어 코드: 항목 이름}}
+    """
+    locales = {locale.lower() for locale in locales}
+    index = {}
+    for name in names:
+        # 언어 코드에는 항상 _가 들어가므로 대부분의 항목(클래스 파일 등)은 바로 건너뜀
+        if "_" not in name or name.endswith("/"):
+            continue
+        parts = name.split("/")
+        for position in range(len(parts) - 1, -1, -1):
+            stem, dot, ext = parts[position].partition(".")
+            if stem.lower() in locales:
+                key = (
+                    tuple(parts[:position])
+                    + ("\0" + dot + ext,)
+                    + tuple(parts[position + 1 :])
+                )
+                index.setdefault(key, {})[stem.lower()] = name
+                break
+    return index
+
+
+def collect_jar_dictionary_pairs(jar, source_lang_code, target_lang_code="ko_kr"):
+    """
+    JAR 안의 원본/한글 언어 파일 쌍에서 사전 항목을 모읍니다.
+
+    프로세스 풀 작업자에서 실행되며, 사전에 바로 넣지 않고 (영어, 한국어) 목록을 반환합니다.
+
+    Returns:
+        {"jar", "files", "pairs", "elapsed", "error"}
+    """
+    started = time.perf_counter()
+    source = source_lang_code.lower()
+    target = target_lang_code.lower()
+    result = {"jar": jar, "files": 0, "pairs": [], "elapsed": 0.0, "error": None}
+    try:
+        with zipfile.ZipFile(jar, "r") as zf:
+            for locales in index_locale_entries(
+                zf.namelist(), (source, target)
+            ).values():
+                source_name = locales.get(source)
+                target_name = locales.get(target)
+                if source_name is None or target_name is None:
+                    continue
+                parser = BaseParser.get_parser_by_extension(
+                    os.path.splitext(source_name)[1]
+                )
+                if parser is None:
+                    continue
+                try:
+                    en_data = parser.load(
+                        zf.read(source_name).decode("utf-8", errors="ignore")
+                    )
+                    ko_data = parser.load(
+                        zf.read(target_name).decode("utf-8", errors="ignore")
+                    )
+                except Exception as e:
+                    logger.debug(f"언어 파일 읽기 실패: {source_name} ({jar}) {e}")
+                    continue
+                for key, en_value in en_data.items():
+                    ko_value = ko_data.get(key)
+                    if isinstance(en_value, str) and isinstance(ko_value, str):
+                        result["pairs"].append(
+                            (en_value.replace("_", ""), ko_value.replace("_", ""))
+                        )
+                result["files"] += 1
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def collect_jars_dictionary_pairs(jar_paths, source_lang_code, max_workers=None):
+    """
+    여러 JAR의 사전 항목을 프로세스 풀에서 병렬로 모읍니다.
+
+    Args:
+        jar_paths: JAR 파일 경로 목록
+        source_lang_code: 원본 언어 코드
+        max_workers: 작업자 수 (0 또는 None이면 JAR_SCAN_WORKERS, 1이면 순차 처리)
+
+    Returns:
+        JAR 경로 순으로 정렬된 collect_jar_dictionary_pairs() 결과 목록
+    """
+    jar_paths = sorted(jar_paths)
+    if not max_workers:
+        max_workers = JAR_SCAN_WORKERS or os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(jar_paths) or 1))
+
+    if max_workers == 1:
+        return [
+            collect_jar_dictionary_pairs(jar, source_lang_code) for jar in jar_paths
+        ]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                collect_jar_dictionary_pairs,
+                jar_paths,
+                [source_lang_code] * len(jar_paths),
+                chunksize=max(1, len(jar_paths) // (max_workers * 4)),
+            )
+        )
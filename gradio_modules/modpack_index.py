@@ -0,0 +1,118 @@
+import logging
+import os
+
+from minecraft_modpack_auto_translator.config import DIR_FILTER_WHITELIST
+
+logger = logging.getLogger(__name__)
+
+
+class IndexedFile:
+    """색인된 파일 하나의 정보 (경로 비교에 쓰는 값은 한 번만 계산)"""
+
+    __slots__ = ("path", "rel", "category", "ext", "lower", "whitelisted")
+
+    def __init__(self, path, rel):
+        self.path = path
+        self.rel = rel
+        self.category = rel.split("/", 1)[0] if "/" in rel else ""
+        self.ext = os.path.splitext(path)[1]
+        self.lower = path.lower()
+        self.whitelisted = any(d in path for d in DIR_FILTER_WHITELIST)
+
+    def __repr__(self):
+        return f"IndexedFile({self.path!r})"
+
+
+class ModpackIndex:
+    """
+    모드팩 디렉토리 파일 색인
+
+    os.scandir로 디렉토리를 한 번만 순회하여 최상위 폴더(category), 확장자별로
+    파일을 분류합니다. 이후 단계는 다시 디렉토리를 검색하지 않고 이 색인을 사용합니다.
+    glob과 같이 숨김 파일/폴더(.으로 시작)는 제외합니다.
+    """
+
+    def __init__(self, root):
+        self.root = root.replace("\\", "/").rstrip("/") or "/"
+        self.files = []
+        self.by_category = {}
+        self.by_ext = {}
+        self._scanned_dirs = set()
+
+    @classmethod
+    def build(cls, root):
+        """디렉토리를 순회하여 색인을 만듭니다."""
+        index = cls(root)
+        index.add_directory(root)
+        logger.info(f"모드팩 색인 완료: {len(index.files)}개 파일 ({root})")
+        return index
+
+    def add_directory(self, directory):
+        """
+        디렉토리 아래의 파일을 색인에 추가합니다. (압축 해제된 폴더 등 증분 추가용)
+
+        Returns:
+            추가된 파일 수
+        """
+        directory = directory.replace("\\", "/").rstrip("/") or "/"
+        if directory in self._scanned_dirs:
+            return 0
+
+        prefix_len = len(self.root) + 1
+        added = 0
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            self._scanned_dirs.add(current)
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.warning(f"디렉토리 읽기 실패: {current} ({e})")
+                continue
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                path = f"{current}/{entry.name}"
+                try:
+                    if entry.is_dir():
+                        if path not in self._scanned_dirs:
+                            stack.append(path)
+                        continue
+                except OSError:
+                    continue
+                self._add_file(IndexedFile(path, path[prefix_len:]))
+                added += 1
+        return added
+
+    def _add_file(self, item):
+        self.files.append(item)
+        self.by_category.setdefault(item.category, []).append(item)
+        self.by_ext.setdefault(item.ext.lower(), []).append(item)
+
+    def in_category(self, category):
+        """최상위 폴더가 category인 파일 목록 (config, kubejs, mods 등)"""
+        return self.by_category.get(category, [])
+
+    def with_extension(self, ext):
+        """확장자가 ext인 파일 목록 (대소문자 무시)"""
+        return self.by_ext.get(ext.lower(), [])
+
+    def select_translation_files(self, category, supported_exts, source_lang_code):
+        """
+        category 아래에서 번역 대상 파일 경로를 고릅니다.
+
+        화이트리스트 경로의 파일은 lang 폴더가 아니면 모두 포함하고,
+        그 외에는 원본 언어 코드가 경로에 들어간 파일만 포함합니다.
+        """
+        src_lower = source_lang_code.lower()
+        files = []
+        for item in self.in_category(category):
+            if item.ext not in supported_exts:
+                continue
+            if item.whitelisted:
+                if "lang/" not in item.path or src_lower in item.lower:
+                    files.append(item.path)
+            elif src_lower in item.lower:
+                files.append(item.path)
+        return files
@@ -5,6 +5,7 @@ import os
 import zipfile
 
 from minecraft_modpack_auto_translator.resourcepack import create_resourcepack
+from minecraft_modpack_auto_translator.zip_utils import ParallelZipWriter
 
 logger = logging.getLogger(__name__)
 
@@ -73,11 +74,15 @@ def assemble_final_zip(
 ):
     """생성된 리소스팩, 사전, Fingerprint, 실패 목록 파일을 ZIP으로 묶어 반환합니다."""
     buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        # 리소스팩 추가
+    with ParallelZipWriter(buf) as zf:
+        # 리소스팩 추가 (이미 압축된 ZIP이므로 다시 압축하지 않음)
         for pack in created_packs:
             if os.path.exists(pack["path"]):
-                zf.write(pack["path"], arcname=os.path.basename(pack["path"]))
+                zf.write(
+                    pack["path"],
+                    arcname=os.path.basename(pack["path"]),
+                    compress_type=zipfile.ZIP_STORED,
+                )
         # 번역 사전 추가
         if translation_dict_path and os.path.exists(translation_dict_path):
             zf.write(
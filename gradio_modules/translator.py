@@ -1,24 +1,54 @@
 import asyncio
 import itertools
-import json
 import os
 import time
 
 from langchain_core.rate_limiters import InMemoryRateLimiter
 
-from minecraft_modpack_auto_translator import translate_json_file
+from minecraft_modpack_auto_translator import translate_mapping
+from minecraft_modpack_auto_translator.async_io import (
+    EventLoopLagMonitor,
+    WriteBehindBuffer,
+    read_bytes,
+    run_io,
+    write_json,
+)
+from minecraft_modpack_auto_translator.config import (
+    DIR_FILTER_WHITELIST,
+    PREPROCESS_MODE,
+)
 from minecraft_modpack_auto_translator.delay_manager import DelayManager
+from minecraft_modpack_auto_translator.dictionary_store import (
+    DEFAULT_DICTIONARY_STORE_PATH,
+    DictionaryStore,
+)
 from minecraft_modpack_auto_translator.graph import create_translation_graph, registry
 from minecraft_modpack_auto_translator.loaders.context import TranslationContext
 from minecraft_modpack_auto_translator.parsers.base_parser import BaseParser
+from minecraft_modpack_auto_translator.preprocess import PreprocessPool
+from minecraft_modpack_auto_translator.scheduling import (
+    MakespanTracker,
+    estimate_cost,
+    estimate_file_cost,
+    plan_work_units,
+    split_items,
+)
+from minecraft_modpack_auto_translator.translation_store import (
+    DEFAULT_TRANSLATION_STORE_PATH,
+    TranslationStore,
+    resolve_jar_entry,
+)
 from minecraft_modpack_auto_translator.translator import get_translator
 
 from .dictionary_builder import (
-    DIR_FILTER_WHITELIST,
+    add_to_dictionary,
     build_dictionary_from_files,
     filter_korean_lang_files,
     initialize_translation_dictionary,
+    iter_dictionary_pairs,
     load_custom_dictionary,
+    load_korean_lang_data,
+    tag_dictionary_sources,
 )
 
 
@@ -35,8 +65,15 @@ async def run_json_translation(
     progress_callback=None,
     logger_client=None,
     force_keep_line_break=False,
+    jar_fingerprints=None,
 ):
-    """여러 JSON 파일을 비동기 큐로 번역하고 결과 경로 목록을 반환합니다."""
+    """
+    여러 JSON 파일을 비동기 큐로 번역하고 결과 경로 목록을 반환합니다.
+
+    jar_fingerprints(JAR 파일 이름 -> 핑거프린트)가 주어지면 JAR 내부 파일은
+    번역 결과 저장소를 먼저 확인하고, 이전에 번역한 결과가 있으면 그대로 사용합니다.
+    파일 쌍에 "previous"(키 -> 이전 번역)가 있으면 해당 키는 번역하지 않고 그대로 씁니다.
+    """
     total = len(file_pairs)
     completed_count = 0
     provider = config["provider"]
@@ -72,9 +109,10 @@ async def run_json_translation(
         logger_client.write(f"요청 지연 활성화: {request_delay}초")
     # --- 설정 로드 끝 --- #
 
-    # 사전 초기화
+    # 사전 초기화 (후보 순위에 쓰도록 항목마다 출처를 함께 기록)
+    dict_sources = {}
     dict_init, dict_lower = initialize_translation_dictionary(
-        source_lang, os.getenv("LANG_CODE", "ko_kr")
+        source_lang, os.getenv("LANG_CODE", "ko_kr"), dict_sources
     )
     if build_dict:
         dict_init, dict_lower, count, added = build_dictionary_from_files(
@@ -83,19 +121,34 @@ async def run_json_translation(
             dict_init,
             dict_lower,
             source_lang,
+            dictionary_sources=dict_sources,
         )
         logger_client.write(
             f"기존 번역에서 추가된 사전 항목: {added}개 ({count}개의 파일에서)"
         )
     if custom_dictionary_path:
         dict_init, dict_lower = load_custom_dictionary(
-            custom_dictionary_path, dict_init, dict_lower
+            custom_dictionary_path, dict_init, dict_lower, dict_sources
         )
         logger_client.write("커스텀 사전 추가 완료")
 
-    pre_len = len(file_pairs)
+    # 작업 중 새로 추가되는 사전 항목은 영구 저장소에 즉시 기록됩니다.
+    # 저장소의 항목은 reuse_dictionary_store를 켠 경우에만 이 작업의 사전에 더합니다.
+    dictionary_store = DictionaryStore(
+        config.get("dictionary_store_path", DEFAULT_DICTIONARY_STORE_PATH)
+    )
+    if config.get("reuse_dictionary_store", False):
+        stored_dict, _ = dictionary_store.load()
+        for en, ko in stored_dict.items():
+            for k in ko if isinstance(ko, list) else [ko]:
+                add_to_dictionary(en, k, dict_init, dict_lower)
+        tag_dictionary_sources(dict_sources, iter_dictionary_pairs(stored_dict), "llm")
+        logger_client.write(f"사전 저장소에서 {len(stored_dict)}개 항목 불러옴")
+
     file_pairs = filter_korean_lang_files(file_pairs, source_lang)
-    logger_client.write(f"{pre_len - len(file_pairs)}개의 한글 번역 파일 건너뜀")
+    logger_client.write(
+        f"한글 번역 파일이 있는 파일: {sum(1 for fp in file_pairs if fp['ko_path'])}개"
+    )
     # 워커들이 순환하며 사용할 API 키 이터레이터 생성
     key_cycle = itertools.cycle(api_keys)
 
@@ -114,66 +167,230 @@ async def run_json_translation(
             # --- 전달 끝 --- #
         )
 
+    # 특수 형식 추출/사전 검색을 이벤트 루프 밖에서 실행할 풀 (inline이면 사용 안 함)
+    preprocess_mode = config.get("preprocess_mode", PREPROCESS_MODE)
+    preprocess_pool = (
+        PreprocessPool(preprocess_mode) if preprocess_mode != "inline" else None
+    )
+
     # 사전 컨텍스트 초기화 (LLM 인스턴스 생성 전에 수행)
     context = TranslationContext(
         create_translation_graph(),
         dict_init,
         registry,
         force_keep_line_break=force_keep_line_break,
+        dictionary_store=dictionary_store,
+        preprocess_pool=preprocess_pool,
+        dictionary_sources=dict_sources,
     )
     context.initialize_dictionaries()
 
     results = []
-    queue = asyncio.Queue()
-    lock = asyncio.Lock()
-    for pair in file_pairs:
-        queue.put_nowait(pair)
-
-    last_save_time = time.time()
     total_error_list = []
 
-    async def process_file(pair):
-        nonlocal last_save_time, total_error_list
-        in_path = pair["input"]
-        out_path = pair["output"]
-        ko_data = pair["data"]
+    # 파일 쓰기는 백그라운드 입출력 스레드에서 처리하고, 이벤트 루프 지연을 측정
+    write_buffer = WriteBehindBuffer()
+    lag_monitor = EventLoopLagMonitor().start()
 
+    # 이미 번역된 파일 건너뛰기
+    pending_pairs = []
+    for pair in file_pairs:
+        out_path = pair["output"]
         if (
             skip_translated
             and os.path.exists(out_path)
             and not any(d in out_path for d in DIR_FILTER_WHITELIST)
         ):
             results.append(out_path)
+            completed_count += 1
             if logger_client:
-                await logger_client.awrite(f"이미 번역된 파일 건너뛰기: {out_path}")
-            return
+                logger_client.write(f"이미 번역된 파일 건너뛰기: {out_path}")
+            continue
+        pending_pairs.append(pair)
 
-        # 임시 JSON 파일로 번역
-        temp_json_out = out_path + ".tmp"
-        temp_json_in = in_path + ".converted"
-        llm_instance = await get_llm_instance_for_worker()
+    # 이전 작업에서 번역한 JAR 파일은 번역 결과 저장소에서 바로 가져옴
+    translation_store = None
+    store_lang = f"{source_lang}:{os.getenv('LANG_CODE', 'ko_kr')}"
+    if jar_fingerprints and config.get("use_translation_store", True):
+        translation_store = TranslationStore(
+            config.get("translation_store_path", DEFAULT_TRANSLATION_STORE_PATH)
+        )
+        for pair in pending_pairs:
+            pair["store_key"] = resolve_jar_entry(pair["input"], jar_fingerprints)
+        stored_results = await run_io(
+            translation_store.get_many,
+            [pair["store_key"] for pair in pending_pairs if pair["store_key"]],
+            store_lang,
+        )
+        remaining_pairs = []
+        for pair in pending_pairs:
+            content = stored_results.get(pair["store_key"])
+            if content is None:
+                remaining_pairs.append(pair)
+                continue
+            await write_buffer.submit(pair["output"], content)
+            results.append(pair["output"])
+            completed_count += 1
+        if logger_client and stored_results:
+            logger_client.write(
+                f"번역 결과 저장소에서 {len(stored_results)}개 파일을 재사용합니다."
+            )
+        pending_pairs = remaining_pairs
+
+    if completed_count and progress_callback:
+        await progress_callback((completed_count, total))
 
-        ext = os.path.splitext(in_path)[1]
-        parser = BaseParser.get_parser_by_extension(ext)
-        with open(in_path, "rb") as f:
-            content_bytes = f.read()
+    # 파일별 비용(항목 수, 글자 수)을 추정해 큰 작업부터 처리하고, 큰 파일은 조각으로 나눔
+    file_costs = await asyncio.gather(
+        *(run_io(estimate_file_cost, pair["input"]) for pair in pending_pairs)
+    )
+    work_units = plan_work_units(
+        [estimate_cost(units, chars) for units, chars in file_costs],
+        max_workers,
+        max_shards=[units for units, _ in file_costs],
+    )
+    if logger_client:
+        logger_client.write(
+            f"작업 계획: 파일 {len(pending_pairs)}개, 작업 단위 {len(work_units)}개"
+        )
+    makespan_tracker = MakespanTracker(max_workers)
+
+    # 작업 큐는 크기를 제한하고, 생산자가 자리가 날 때마다 작업을 채웁니다
+    queue = asyncio.Queue(maxsize=max_workers * 2)
+    lock = asyncio.Lock()
+    # 파일 인덱스 -> 조각 번역 결과를 모으는 상태
+    file_states = {}
+
+    async def load_file(index, shards):
+        pair = pending_pairs[index]
+        in_path = pair["input"]
+        parser = BaseParser.get_parser_by_extension(os.path.splitext(in_path)[1])
+        content_bytes = await read_bytes(in_path)
         try:
             content_str = content_bytes.decode("utf-8")
         except UnicodeDecodeError:
             content_str = content_bytes.decode("utf-8", errors="ignore")
-        original_data = parser.load(content_str)
-        json_input = json.dumps(original_data, ensure_ascii=False, indent=4)
+        # 저장할 때 번역된 값만 원본에 바꿔 넣을 수 있도록 값 위치를 함께 기록
+        original_data, spans = await run_io(parser.load_with_spans, content_str)
+        # 한글 번역 데이터는 작업을 큐에 넣을 때 읽고, 건너뛸 키만 남김 (파일 완료 시 해제)
+        ko_data = await run_io(load_korean_lang_data, pair, original_data)
+        # 이전 번역에서 그대로 가져올 항목(업데이트)은 번역하지 않고 결과에 바로 넣음
+        previous = pair.get("previous") or {}
+        translated = {k: previous[k] for k in original_data if k in previous}
+        items = (
+            {k: v for k, v in original_data.items() if k not in translated}
+            if translated
+            else original_data
+        )
+        pieces = split_items(items, shards) if items else []
+        return {
+            "pair": pair,
+            "parser": parser,
+            "original": original_data,
+            "source": content_str,
+            "spans": spans,
+            "ko_data": ko_data,
+            "pieces": pieces,
+            "remaining": len(pieces),
+            "translated": translated,
+            "errors": 0,
+        }
 
-        with open(temp_json_in, "w", encoding="utf-8") as of:
-            of.write(json_input)
+    async def finish_file(state):
+        nonlocal completed_count
+        pair = state["pair"]
+        out_path = pair["output"]
+        try:
+            translated = state["translated"]
+            # 조각 결과를 원본 키 순서로 합침
+            data = {k: translated[k] for k in state["original"] if k in translated}
+            if len(data) > 0:
+                content = await run_io(
+                    state["parser"].save_preserving,
+                    data,
+                    state["original"],
+                    state["source"],
+                    state["spans"],
+                )
+                # 최종 파일 저장 (백그라운드 쓰기)
+                await write_buffer.submit(out_path, content)
+                # 오류 없이 번역된 JAR 파일은 다음 작업을 위해 저장
+                store_key = pair.get("store_key")
+                if translation_store and store_key and not state.get("errors"):
+                    await run_io(
+                        translation_store.put,
+                        *store_key,
+                        store_lang,
+                        content.encode("utf-8")
+                        if isinstance(content, str)
+                        else content,
+                    )
+
+                results.append(out_path)
+            if logger_client:
+                await logger_client.awrite(f"번역 완료: {out_path}")
+        except Exception as e:
+            if logger_client:
+                await logger_client.awrite(f"Error processing {pair['input']}: {e}")
+        finally:
+            state.clear()
+            async with lock:
+                completed_count += 1
+                if progress_callback:
+                    await progress_callback((completed_count, total))
+
+    async def producer():
+        try:
+            for index, shard, shards, _ in work_units:
+                state = file_states.get(index)
+                if state is None:
+                    try:
+                        state = await load_file(index, shards)
+                    except Exception as e:
+                        if logger_client:
+                            await logger_client.awrite(
+                                f"Error processing {pending_pairs[index]['input']}: {e}"
+                            )
+                        state = {
+                            "pair": pending_pairs[index],
+                            "pieces": [],
+                            "original": {},
+                            "translated": {},
+                        }
+                        file_states[index] = state
+                        await finish_file(state)
+                        continue
+                    file_states[index] = state
+                    if len(state["pieces"]) == 0:
+                        await finish_file(state)
+                if shard >= len(state.get("pieces", [])):
+                    continue
+                items = state["pieces"][shard]
+                # 큐에 넣은 조각은 상태에서 해제
+                state["pieces"][shard] = None
+                await queue.put((state, shard, items))
+        finally:
+            # 워커 종료 신호
+            for _ in range(max_workers):
+                await queue.put(None)
+
+    async def process_unit(state, shard, items):
+        nonlocal total_error_list
+        in_path = state["pair"]["input"]
+        shards = len(state["pieces"])
+
+        llm_instance = await get_llm_instance_for_worker()
 
         if logger_client:
-            logger_client.write(f"번역 시작: {in_path}")
+            shard_info = f" ({shard + 1}/{shards})" if shards > 1 else ""
+            await logger_client.awrite(f"번역 시작: {in_path}{shard_info}")
 
-        error_list = await translate_json_file(
-            input_path=temp_json_in,
-            output_path=temp_json_out,
-            ko_data=ko_data,
+        started = time.perf_counter()
+        # 파싱된 데이터를 중간 파일 없이 바로 번역
+        data, error_list = await translate_mapping(
+            items,
+            in_path,
+            ko_data=state["ko_data"],
             custom_dictionary_dict=context.get_dictionary(),
             llm=llm_instance,
             max_workers=int(file_split_number),
@@ -182,68 +399,75 @@ async def run_json_translation(
             delay_manager=delay_manager,
             force_keep_line_break=force_keep_line_break,
         )
+        makespan_tracker.record(time.perf_counter() - started)
         total_error_list.extend(error_list)
-        try:
-            current_time = time.time()
-            if current_time - last_save_time >= 300:  # 5분(300초)마다 저장
-                os.makedirs("./temp/", exist_ok=True)
-                path_for_shared_dict = os.path.join("./temp/last_shared_dict.json")
-                with open(path_for_shared_dict, "w", encoding="utf-8") as jf:
-                    json.dump(
-                        context.get_dictionary(), jf, ensure_ascii=False, indent=4
-                    )
-                last_save_time = current_time  # 마지막 저장 시간 업데이트
-        except Exception as e:
-            if logger_client:
-                logger_client.write(f"Error for save shared dict: {e}")
-            return
-
-        with open(temp_json_out, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if len(data) > 0:
-            content = parser.save(data)
-            # 최종 파일 저장
-            with open(out_path, "w", encoding="utf-8") as of:
-                of.write(content)
-
-            results.append(out_path)
-        if logger_client:
-            logger_client.write(f"번역 완료: {out_path}")
+        state["errors"] += len(error_list)
+        state["translated"].update(data)
 
     async def worker():
-        nonlocal completed_count
-        while not queue.empty():
-            pair = await queue.get()
+        while True:
+            unit = await queue.get()
+            if unit is None:
+                queue.task_done()
+                break
 
+            state, shard, items = unit
             try:
-                await process_file(pair)
+                await process_unit(state, shard, items)
             except Exception as e:
+                state["errors"] += 1
                 if logger_client:
-                    logger_client.write(f"Error processing {pair}: {e}")
+                    await logger_client.awrite(
+                        f"Error processing {state['pair']['input']}: {e}"
+                    )
             finally:
-                async with lock:
-                    completed_count += 1
-                    if progress_callback:
-                        await progress_callback((completed_count, total))
+                state["remaining"] -= 1
+                if state["remaining"] == 0:
+                    await finish_file(state)
                 queue.task_done()
 
+    # 워커 태스크 실행
+    producer_task = asyncio.create_task(producer())
+    workers = [asyncio.create_task(worker()) for _ in range(max_workers)]
+    await asyncio.gather(producer_task, *workers, return_exceptions=True)
+    makespan_tracker.finish()
+
+    # 남은 파일 쓰기 완료 대기
+    await write_buffer.flush()
+    for path, e in write_buffer.errors:
+        if logger_client:
+            logger_client.write(f"파일 저장 실패: {path} / {e}")
+        if path in results:
+            results.remove(path)
+
     if len(total_error_list) > 0:
         logger_client.write("\n\n" + "=" * 10)
         logger_client.write(f"번역 오류가 {len(total_error_list)}개 발생했습니다.")
         logger_client.write("오류 목록을 ./temp/error_list.json 에 저장했습니다.")
         logger_client.write("오류 목록을 확인하고 오류 수정 후 다시 번역해주세요.")
-        with open("./temp/error_list.json", "w", encoding="utf-8") as f:
-            json.dump(total_error_list, f, ensure_ascii=False, indent=4)
+        await write_json("./temp/error_list.json", total_error_list)
         logger_client.write("=" * 10 + "\n\n")
 
-    # 워커 태스크 실행
-    workers = [asyncio.create_task(worker()) for _ in range(max_workers)]
-    await queue.join()
-
-    # 워커 태스크 취소
-    for task in workers:
-        task.cancel()
+    await lag_monitor.stop()
+    if logger_client:
+        logger_client.write(makespan_tracker.summary())
+        logger_client.write(lag_monitor.summary())
+    if preprocess_pool is not None:
+        preprocess_pool.close()
+    if translation_store is not None:
+        if logger_client:
+            logger_client.write(
+                f"번역 결과 저장소: 재사용 {translation_store.hits}개, "
+                f"새로 저장 {translation_store.stored}개"
+            )
+        await run_io(translation_store.close)
 
-    # 취소된 태스크 처리 완료 대기
-    await asyncio.gather(*workers, return_exceptions=True)
+    try:
+        # 이 작업의 사전만 내보냄 (저장소 전체는 export_json()으로 따로 내보낼 수 있음)
+        await write_json("./temp/last_shared_dict.json", context.get_dictionary())
+    except Exception as e:
+        if logger_client:
+            logger_client.write(f"Error for save shared dict: {e}")
+    finally:
+        dictionary_store.close()
     return results, dict_init
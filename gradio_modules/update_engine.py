@@ -0,0 +1,258 @@
+import hashlib
+import json
+import logging
+import os
+
+from minecraft_modpack_auto_translator import vfs
+from minecraft_modpack_auto_translator.async_io import write_bytes_atomic
+from minecraft_modpack_auto_translator.parsers.base_parser import BaseParser
+
+logger = logging.getLogger(__name__)
+
+# 번역 결과와 함께 저장하는 원본 정보 파일 (다음 업데이트에서 바뀐 키를 찾는 데 사용)
+MANIFEST_NAME = "translation_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def hash_bytes(data):
+    """파일 내용 해시"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_value(value):
+    """원본 값 하나의 짧은 해시 (문자열이 아닌 값은 JSON으로 직렬화)"""
+    if not isinstance(value, str):
+        value = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def rename_lang_code(path, source_lang):
+    """경로의 원본 언어 코드를 ko_kr로 바꿉니다. (리소스팩/복구 zip과 같은 규칙)"""
+    return path.replace(source_lang, "ko_kr").replace(
+        source_lang.split("_")[0] + "_" + source_lang.split("_")[1].upper(),
+        "ko_KR",
+    )
+
+
+def manifest_key(path, modpack_dir):
+    """
+    원본 파일의 매니페스트 키를 만듭니다.
+
+    JAR 항목은 버전이 바뀌면 JAR 이름도 바뀌므로 JAR 내부 경로(assets/...)를,
+    그 외 파일은 모드팩 기준 상대 경로를 사용합니다.
+
+    Returns:
+        (키, JAR 이름 또는 None)
+    """
+    resolved = vfs.resolve(path)
+    if resolved is not None:
+        return resolved[1], os.path.basename(resolved[0])
+    return os.path.relpath(path, modpack_dir).replace("\\", "/"), None
+
+
+def build_file_entry(path):
+    """
+    원본 파일 하나의 매니페스트 항목을 만듭니다.
+
+    Returns:
+        {"sha256", "keys": {키: 원본 값 해시}}
+    """
+    content = vfs.read_bytes(path)
+    parser = BaseParser.get_parser_by_extension(os.path.splitext(path)[1])
+    data = parser.load(content.decode("utf-8", errors="ignore")) if parser else {}
+    return {
+        "sha256": hash_bytes(content),
+        "keys": {key: hash_value(value) for key, value in (data or {}).items()},
+    }
+
+
+def build_manifest(files, modpack_dir, source_lang, jar_fingerprints=None, base=None):
+    """
+    번역 대상 원본 파일의 매니페스트를 만듭니다.
+
+    JAR 핑거프린트가 base(이전 매니페스트)와 같은 JAR 항목은 파일을 읽지 않고
+    이전 항목을 그대로 사용합니다.
+
+    Args:
+        files: 원본 파일 경로 목록 (JAR 항목은 가상 경로)
+        modpack_dir: 모드팩 폴더
+        source_lang: 원본 언어 코드
+        jar_fingerprints: JAR 파일 이름 -> 핑거프린트
+        base: 이전 매니페스트
+
+    Returns:
+        {"version", "source_lang", "jars", "files": {키: 항목}}
+    """
+    jar_fingerprints = jar_fingerprints or {}
+    base_files = (base or {}).get("files", {})
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "source_lang": source_lang,
+        "jars": {name: fp for name, fp in jar_fingerprints.items() if fp is not None},
+        "files": {},
+    }
+    reused = 0
+    for path in files:
+        key, jar_name = manifest_key(path, modpack_dir)
+        fingerprint = jar_fingerprints.get(jar_name) if jar_name else None
+        previous = base_files.get(key)
+        if (
+            fingerprint is not None
+            and previous is not None
+            and previous.get("jar") == fingerprint
+        ):
+            manifest["files"][key] = previous
+            reused += 1
+            continue
+        try:
+            entry = build_file_entry(path)
+        except Exception as e:
+            logger.warning(f"매니페스트 항목 생성 실패: {path} ({e})")
+            continue
+        if fingerprint is not None:
+            entry["jar"] = fingerprint
+        manifest["files"][key] = entry
+    logger.info(
+        f"매니페스트 생성: 파일 {len(manifest['files'])}개 (JAR 핑거프린트로 재사용 {reused}개)"
+    )
+    return manifest
+
+
+def load_manifest(*directories):
+    """폴더들에서 매니페스트를 찾아 읽습니다. 없거나 읽을 수 없으면 None"""
+    for directory in directories:
+        path = os.path.join(directory, MANIFEST_NAME)
+        if not os.path.isfile(path):
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"매니페스트를 읽을 수 없습니다: {path} ({e})")
+            continue
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    return None
+
+
+def save_manifest(manifest, path):
+    """매니페스트를 JSON으로 저장합니다."""
+    write_bytes_atomic(
+        path, json.dumps(manifest, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    )
+
+
+def changed_keys(old_entry, new_entry):
+    """
+    이전 매니페스트 항목과 비교하여 추가되거나 원본 값이 바뀐 키를 구합니다.
+
+    Returns:
+        바뀐 키 집합 (이전 항목이 없으면 모든 키)
+    """
+    if old_entry is None:
+        return set(new_entry["keys"])
+    old_keys = old_entry.get("keys", {})
+    return {key for key, h in new_entry["keys"].items() if old_keys.get(key) != h}
+
+
+def _previous_translation_candidates(
+    key, jar_name, modpack_dir, resourcepack_dir, source_lang
+):
+    """이전 번역 파일이 있을 수 있는 경로 (앞의 것이 우선)"""
+    renamed = rename_lang_code(key, source_lang)
+    if jar_name is not None:
+        return [os.path.join(resourcepack_dir, renamed)]
+    candidates = [os.path.join(modpack_dir, key), os.path.join(modpack_dir, renamed)]
+    if "assets" in key:
+        candidates.append(
+            os.path.join(resourcepack_dir, renamed[renamed.find("assets") :])
+        )
+    return candidates
+
+
+def plan_update(
+    files,
+    modpack_dir,
+    new_manifest,
+    old_manifest,
+    old_modpack_dir,
+    resourcepack_dir,
+    source_lang,
+):
+    """
+    업데이트에서 번역할 파일과 키를 정합니다.
+
+    원본 파일 해시가 이전과 같고 이전 번역이 있는 파일은 건너뜁니다.
+    나머지 파일은 원본 값이 바뀌지 않은 키의 이전 번역을 "previous"로 넘겨,
+    추가되거나 바뀐 키만 번역하도록 합니다. 매니페스트가 없는 이전 번역본은
+    이전 번역에 없는 키만 번역합니다.
+
+    Args:
+        files: 새 모드팩의 원본 파일 경로 목록
+        modpack_dir: 새 모드팩 폴더
+        new_manifest: 새 모드팩의 매니페스트
+        old_manifest: 이전 번역본의 매니페스트 (없으면 None)
+        old_modpack_dir: 이전 번역본 모드팩 설정 폴더
+        resourcepack_dir: 이전 번역본 리소스팩 폴더
+        source_lang: 원본 언어 코드
+
+    Returns:
+        (run_json_translation()에 넘길 파일 쌍 목록, 통계)
+    """
+    old_files = (old_manifest or {}).get("files", {})
+    pairs = []
+    stats = {"unchanged": 0, "files": 0, "translate": 0, "carried": 0}
+    for path in files:
+        key, jar_name = manifest_key(path, modpack_dir)
+        new_entry = new_manifest["files"].get(key)
+        if new_entry is None:
+            continue
+        old_entry = old_files.get(key)
+
+        candidates = _previous_translation_candidates(
+            key, jar_name, old_modpack_dir, resourcepack_dir, source_lang
+        )
+        previous_path = next((c for c in candidates if os.path.isfile(c)), None)
+        if (
+            previous_path is not None
+            and old_entry is not None
+            and old_entry.get("sha256") == new_entry["sha256"]
+        ):
+            stats["unchanged"] += 1
+            continue
+
+        previous = {}
+        if previous_path is not None:
+            parser = BaseParser.get_parser_by_extension(os.path.splitext(path)[1])
+            try:
+                with open(previous_path, "r", encoding="utf-8") as f:
+                    previous = parser.load(f.read()) or {}
+            except Exception as e:
+                logger.warning(f"이전 번역을 읽을 수 없습니다: {previous_path} ({e})")
+
+        if old_manifest is not None:
+            changed = changed_keys(old_entry, new_entry)
+        else:
+            changed = set()
+        carried = {
+            k: previous[k]
+            for k in new_entry["keys"]
+            if k in previous and k not in changed
+        }
+        to_translate = len(new_entry["keys"]) - len(carried)
+        if to_translate == 0 and set(previous) == set(new_entry["keys"]):
+            # 키가 모두 같고 바뀐 값도 없으면 이전 번역을 그대로 둠
+            stats["unchanged"] += 1
+            continue
+
+        pairs.append(
+            {
+                "input": path,
+                "output": previous_path or candidates[0],
+                "previous": carried,
+            }
+        )
+        stats["files"] += 1
+        stats["translate"] += to_translate
+        stats["carried"] += len(carried)
+    return pairs, stats
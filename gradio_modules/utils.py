@@ -1,5 +1,6 @@
 import os
 
+from minecraft_modpack_auto_translator import vfs
 from minecraft_modpack_auto_translator.parsers.base_parser import BaseParser
 
 
@@ -17,8 +18,7 @@ def extract_lang_content(file_path, content=None):
     """파일 경로 또는 파일객체에서 JSON 파싱된 딕셔너리 데이터를 반환합니다."""
     try:
         if content is None:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = vfs.read_text(file_path)
         if isinstance(file_path, str):
             ext = os.path.splitext(file_path)[1]
         elif hasattr(file_path, "name"):
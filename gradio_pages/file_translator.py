@@ -1,8 +1,6 @@
 import asyncio
-import json
 import os
 import tempfile
-import uuid
 
 import gradio as gr
 from langchain_core.rate_limiters import InMemoryRateLimiter
@@ -12,7 +10,7 @@ from gradio_modules.dictionary_builder import (
 )
 from gradio_modules.logger import Logger
 from minecraft_modpack_auto_translator.delay_manager import DelayManager
-from minecraft_modpack_auto_translator.graph import translate_json_file
+from minecraft_modpack_auto_translator.graph import translate_mapping
 from minecraft_modpack_auto_translator.parsers.base_parser import BaseParser
 from minecraft_modpack_auto_translator.translator import get_translator
 
@@ -111,25 +109,6 @@ def create_file_translator_ui(config_state):
                     logger_client.read_logs(),
                 )
 
-            # 임시 JSON 파일로 저장
-            json_input = json.dumps(original_data, ensure_ascii=False, indent=4)
-            tmp_in = tempfile.NamedTemporaryFile(
-                delete=False, mode="w", encoding="utf-8", suffix=".json"
-            )
-            tmp_in.write(json_input)
-            tmp_in_path = tmp_in.name
-            tmp_in.close()
-            add_log(f"임시 JSON 입력 파일 생성: {tmp_in_path}")
-
-            # 임시 출력 경로 설정
-            tmp_out_dir = "./temp/translated/{}".format(uuid.uuid4())
-            os.makedirs(tmp_out_dir, exist_ok=True)
-
-            tmp_out_name = (
-                f"translated_{os.path.splitext(os.path.basename(tmp_in_path))[0]}.json"
-            )
-            tmp_out_path = os.path.join(tmp_out_dir, tmp_out_name)
-            add_log(f"임시 JSON 출력 파일 경로: {tmp_out_path}")
             total = len(original_data)
             num = 0
             pr(0, total=total, desc="번역 준비중..")
@@ -152,10 +131,10 @@ def create_file_translator_ui(config_state):
                     api_keys = ["sk-proj-1234567890"]
                 selected_api_key = api_keys[0]
                 add_log("단일 파일 번역 시 첫번째 API 키 사용")
-                asyncio.run(
-                    translate_json_file(
-                        input_path=tmp_in_path,
-                        output_path=tmp_out_path,
+                translated_json, _ = asyncio.run(
+                    translate_mapping(
+                        original_data,
+                        uploaded_file.name,
                         custom_dictionary_dict=dict_init,
                         llm=get_translator(
                             provider.lower(),
@@ -184,10 +163,8 @@ def create_file_translator_ui(config_state):
                     gr.update(value="번역 실패"),
                     gr.update(visible=False),
                 )
-            # 결과 JSON 로드 및 원본 포맷으로 변환
+            # 원본 포맷으로 변환
             try:
-                with open(tmp_out_path, "r", encoding="utf-8") as f:
-                    translated_json = json.load(f)
                 translated_content = parser.save(translated_json)
                 add_log("원본 형식으로 변환 완료")
             except Exception as e:
@@ -198,17 +175,6 @@ def create_file_translator_ui(config_state):
                     logger_client.read_logs(),
                 )
 
-            # 임시 파일 정리
-            try:
-                os.remove(tmp_in_path)
-                add_log(f"임시 입력 파일 삭제: {tmp_in_path}")
-                import shutil
-
-                shutil.rmtree(tmp_out_dir)
-                add_log(f"임시 출력 디렉토리 삭제: {tmp_out_dir}")
-            except Exception as e:
-                add_log(f"임시 파일 정리 오류: {e}")
-
             # 최종 번역 파일 저장 및 다운로드 설정
             final_ext = ext
             final_name_prefix = f"{os.path.splitext(uploaded_file.name)[0]}_{os.getenv('LANG_CODE', 'ko_kr')}"
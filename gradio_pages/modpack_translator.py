@@ -16,7 +16,13 @@ from gradio_modules.dictionary_builder import (
 )
 from gradio_modules.logger import Logger
 from gradio_modules.translator import run_json_translation
-from minecraft_modpack_auto_translator.resourcepack import create_resourcepack
+from gradio_modules.update_engine import MANIFEST_NAME, build_manifest
+from minecraft_modpack_auto_translator import vfs
+from minecraft_modpack_auto_translator.config import (
+    ARCHIVE_INTERMEDIATE_COMPRESS_LEVEL,
+)
+from minecraft_modpack_auto_translator.resourcepack import add_resourcepack_to_zip
+from minecraft_modpack_auto_translator.zip_utils import ParallelZipWriter
 
 # 스케줄러 초기화 및 시작
 scheduler = BackgroundScheduler()
@@ -197,90 +203,103 @@ def create_modpack_translator_ui(config_state):
                     add_log(f"기존 번역본 ZIP 처리 중 오류 발생: {e}")
 
             # 모드팩 디렉토리 스캔하여 번역 대상 파일 검색
-            files, mods_jars, jar_fingerprints = process_modpack_directory(
-                input_dir,
-                source_lang,
-                translate_config,
-                translate_kubejs,
-                translate_mods,
-                translate_patchouli_books,
-            )
-            add_log(f"{len(files)}개의 언어 파일 발견")
-            # 번역 대상 파일 쌍 생성
-            file_pairs = []
-            for file_path in files:
-                out_path = file_path.replace(input_dir, output_dir, 1)
-                os.makedirs(os.path.dirname(out_path), exist_ok=True)
-                file_pairs.append({"input": file_path, "output": out_path})
-            total = len(file_pairs)
-            # JSON 번역 실행 (파일 레벨 병렬) 및 진행률 전송
-            add_log(f"총 {total}개의 파일 병렬 번역 시작")
-            # 진행률 초기화
-            pr(0, total=total, desc="준비중..")
-
-            # 모든 파일 번역 실행 (프로그래스 콜백 전달)
-            async def progress_callback(progress):
-                pr(
-                    progress[0] / progress[1],
-                    desc=f"번역 중.. ({progress[0]}/{progress[1]})",
+            # (JAR 항목을 읽는 동안 이 작업의 vfs session 유지)
+            with vfs.session():
+                files, mods_jars, jar_fingerprints = process_modpack_directory(
+                    input_dir,
+                    source_lang,
+                    translate_config,
+                    translate_kubejs,
+                    translate_mods,
+                    translate_patchouli_books,
                 )
+                add_log(f"{len(files)}개의 언어 파일 발견")
+                # 번역 대상 파일 쌍 생성
+                file_pairs = []
+                for file_path in files:
+                    out_path = file_path.replace(input_dir, output_dir, 1)
+                    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                    file_pairs.append({"input": file_path, "output": out_path})
+                total = len(file_pairs)
+                # JSON 번역 실행 (파일 레벨 병렬) 및 진행률 전송
+                add_log(f"총 {total}개의 파일 병렬 번역 시작")
+                # 진행률 초기화
+                pr(0, total=total, desc="준비중..")
+
+                # 모든 파일 번역 실행 (프로그래스 콜백 전달)
+                async def progress_callback(progress):
+                    pr(
+                        progress[0] / progress[1],
+                        desc=f"번역 중.. ({progress[0]}/{progress[1]})",
+                    )
 
-            results, dict_init = asyncio.run(
-                run_json_translation(
-                    file_pairs,
-                    source_lang,
-                    config,
-                    build_dict,
-                    skip_translated,
-                    max_workers,
-                    file_split_number,
-                    use_random_order,
-                    custom_dictionary_path=custom_dictionary_json.name
-                    if custom_dictionary_json
-                    else None,
-                    progress_callback=progress_callback,
-                    logger_client=logger_client,
-                    force_keep_line_break=force_keep_line_break,
+                results, dict_init = asyncio.run(
+                    run_json_translation(
+                        file_pairs,
+                        source_lang,
+                        config,
+                        build_dict,
+                        skip_translated,
+                        max_workers,
+                        file_split_number,
+                        use_random_order,
+                        custom_dictionary_path=custom_dictionary_json.name
+                        if custom_dictionary_json
+                        else None,
+                        progress_callback=progress_callback,
+                        logger_client=logger_client,
+                        force_keep_line_break=force_keep_line_break,
+                        jar_fingerprints=jar_fingerprints,
+                    )
                 )
-            )
-            # 진행률 완료
-            pr(1, desc="번역 완료")
-
-            restore_zip_files(output_dir)
-
-            add_log("모든 파일 번역 완료")
-            # 리소스팩 카테고리별 생성 (Async Queue)
-            add_log("리소스팩 생성 중...")
-            # categories_info = {
-            #     "mods": {"suffix": "_MOD_TRANSLATION"},
-            #     "config": {"suffix": "_CONFIG_TRANSLATION"},
-            #     "kubejs": {"suffix": "_KUBEJS_TRANSLATION"},
-            #     "patchouli_books": {"suffix": "_PATCHOULI_BOOKS_TRANSLATION"},
-            # }
-            # created_packs = asyncio.run(
-            #     package_categories(
-            #         output_dir,
-            #         categories_info,
-            #         translate_config,
-            #         translate_kubejs,
-            #         translate_mods,
-            #         resourcepack_name,
-            #     )
-            # )
-            # add_log(f"{len(created_packs)}개의 리소스팩 생성 완료")
-            # # 최종 ZIP 생성
-            folders_to_add = [
-                os.path.join(output_dir, "kubejs"),
-                os.path.join(output_dir, "config"),
-                os.path.join(output_dir, "patchouli_books"),
-            ]
-            mods_resource_pack = create_resourcepack(
-                output_dir,
-                [
-                    os.path.join(output_dir, "mods", "extracted"),
-                ],
-                resourcepack_name + "_RESOURCEPACK",
-            )
+                # 진행률 완료
+                pr(1, desc="번역 완료")
+
+                # 복구한 zip은 최종 ZIP에 다시 담기므로 무압축으로 저장
+                restore_zip_files(
+                    output_dir, compresslevel=ARCHIVE_INTERMEDIATE_COMPRESS_LEVEL
+                )
+
+                add_log("모든 파일 번역 완료")
+                # 리소스팩 카테고리별 생성 (Async Queue)
+                add_log("리소스팩 생성 중...")
+                # categories_info = {
+                #     "mods": {"suffix": "_MOD_TRANSLATION"},
+                #     "config": {"suffix": "_CONFIG_TRANSLATION"},
+                #     "kubejs": {"suffix": "_KUBEJS_TRANSLATION"},
+                #     "patchouli_books": {"suffix": "_PATCHOULI_BOOKS_TRANSLATION"},
+                # }
+                # created_packs = asyncio.run(
+                #     package_categories(
+                #         output_dir,
+                #         categories_info,
+                #         translate_config,
+                #         translate_kubejs,
+                #         translate_mods,
+                #         resourcepack_name,
+                #     )
+                # )
+                # add_log(f"{len(created_packs)}개의 리소스팩 생성 완료")
+                # # 최종 ZIP 생성
+                folders_to_add = [
+                    os.path.join(output_dir, "kubejs"),
+                    os.path.join(output_dir, "config"),
+                    os.path.join(output_dir, "patchouli_books"),
+                ]
+                # 다음 업데이트에서 바뀐 키만 번역할 수 있도록 원본 정보 저장
+                manifest = None
+                try:
+                    manifest = build_manifest(
+                        files, input_dir, source_lang, jar_fingerprints
+                    )
+                    if len(manifest["files"]) != len(files):
+                        add_log(
+                            f"번역 매니페스트 항목 수가 원본 파일 수와 다릅니다: "
+                            f"{len(manifest['files'])}/{len(files)}"
+                        )
+                except Exception as e:
+                    add_log(f"번역 매니페스트 생성 중 오류 발생: {e}")
+
             os.makedirs("./temp/translated_resourcepacks", exist_ok=True)
             with tempfile.NamedTemporaryFile(
                 delete=False,
@@ -288,17 +307,19 @@ def create_modpack_translator_ui(config_state):
                 mode="wb",
                 dir="./temp/translated_resourcepacks",
             ) as temp_zip_file:
-                with zipfile.ZipFile(
-                    temp_zip_file.name, "w", zipfile.ZIP_DEFLATED
-                ) as zf:
-                    zf.write(
-                        mods_resource_pack, arcname=os.path.basename(mods_resource_pack)
+                with ParallelZipWriter(temp_zip_file.name) as zf:
+                    # 모드 리소스팩은 중간 파일 없이 최종 ZIP 안에 바로 기록
+                    add_resourcepack_to_zip(
+                        zf,
+                        resourcepack_name + "_RESOURCEPACK.zip",
+                        [os.path.join(output_dir, "mods", "extracted")],
+                        resourcepack_name + "_RESOURCEPACK",
                     )
                     for folder in folders_to_add:
                         folder = folder.replace("\\", "/")
                         if os.path.exists(folder) and any(os.scandir(folder)):
-                            for root, _, files in os.walk(folder):
-                                for file in files:
+                            for root, _, folder_files in os.walk(folder):
+                                for file in folder_files:
                                     file_path = os.path.join(root, file)
                                     if (
                                         not file.endswith(".tmp")
@@ -328,6 +349,11 @@ def create_modpack_translator_ui(config_state):
                         add_log("번역 사전을 ZIP 파일에 저장 완료")
                     except Exception as e:
                         add_log(f"번역 사전 저장 중 오류 발생: {e}")
+                    if manifest is not None:
+                        zf.writestr(
+                            MANIFEST_NAME,
+                            json.dumps(manifest, ensure_ascii=False, sort_keys=True),
+                        )
 
                 final_zip_path = temp_zip_file.name  # 파일 경로 저장
 
@@ -341,9 +367,7 @@ def create_modpack_translator_ui(config_state):
                     with open(fingerprint_path, "w", encoding="utf-8") as f:
                         json.dump(jar_fingerprints, f, ensure_ascii=False, indent=4)
                     share_zip_path = os.path.join(temp_dir, "shared_result.zip")
-                    with zipfile.ZipFile(
-                        share_zip_path, "w", zipfile.ZIP_DEFLATED
-                    ) as share_zf:
+                    with ParallelZipWriter(share_zip_path) as share_zf:
                         if os.path.exists(fingerprint_path):
                             share_zf.write(fingerprint_path, arcname="fingerprint.json")
                         if os.path.exists(error_path):
@@ -503,5 +527,3 @@ def create_modpack_translator_ui(config_state):
         gr.Timer(3).tick(fn=update_log, inputs=[config_state], outputs=log_output)
         gr.Timer(3).tick(fn=detail_update_log, outputs=detail_log_output)
     return tab
-
-
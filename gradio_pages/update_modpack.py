@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import shutil
@@ -13,7 +14,21 @@ from gradio_modules.dictionary_builder import (
     process_modpack_directory,
     restore_zip_files,
 )
-from minecraft_modpack_auto_translator.parsers import BaseParser
+from gradio_modules.logger import Logger
+from gradio_modules.translator import run_json_translation
+from gradio_modules.update_engine import (
+    MANIFEST_NAME,
+    build_manifest,
+    load_manifest,
+    plan_update,
+    save_manifest,
+)
+from minecraft_modpack_auto_translator import vfs
+from minecraft_modpack_auto_translator.config import (
+    ARCHIVE_INTERMEDIATE_COMPRESS_LEVEL,
+)
+from minecraft_modpack_auto_translator.delta_pack import create_delta
+from minecraft_modpack_auto_translator.zip_utils import ParallelZipWriter
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +48,7 @@ def delete_file_later(file_path):
         print(f"임시 파일 삭제 오류 ({file_path}): {e}")
 
 
-def create_update_modpack_ui():
+def create_update_modpack_ui(config_state):
     with gr.Blocks() as tab:
         gr.Markdown("## 🛠️ 번역 업데이트 프로그램")
         with gr.Accordion("📖 사용 설명서 (클릭하여 펼치기)", open=False):
@@ -47,6 +62,10 @@ def create_update_modpack_ui():
             2. 구버전에서 번역한 모드팩 설정, 리소스팩을 업로드하세요
             3. 업데이트 옵션을 설정한 후 '업데이트 시작' 버튼을 클릭하세요
             4. 업데이트가 완료되면 결과 ZIP 파일을 다운로드 받으세요
+
+            **🔄 변경된 부분만 번역:** 이전 번역본의 `translation_manifest.json`과 비교하여
+            새로 추가되거나 원문이 바뀐 키만 번역하고, 나머지는 이전 번역을 그대로 사용합니다.
+            (모델 설정 탭의 설정을 사용합니다)
             """)
         with gr.Row():
             with gr.Column(scale=1, min_width=300):
@@ -68,6 +87,13 @@ def create_update_modpack_ui():
                         file_types=[".zip"],
                         value=None,
                     )
+                    with gr.Row():
+                        max_workers = gr.Number(
+                            label="동시 작업자 수", value=5, maximum=30
+                        )
+                        file_split_number = gr.Number(
+                            label="파일 분할 작업자 수", value=1, maximum=5
+                        )
 
             with gr.Column(scale=1, min_width=300):
                 update_btn = gr.Button("업데이트 시작")
@@ -75,11 +101,30 @@ def create_update_modpack_ui():
                 output_resourcepack_zip = gr.File(
                     label="업데이트된 리소스팩 ZIP", file_types=[".zip"]
                 )
+                output_delta_zip = gr.File(
+                    label="리소스팩 변경분 ZIP (바뀐 파일만)", file_types=[".zip"]
+                )
                 output_modpack_zip = gr.File(
                     label="업데이트된 모드팩 설정 ZIP", file_types=[".zip"]
                 )
+                log_output = gr.Textbox(
+                    label="진행 상황 로그",
+                    lines=15,
+                    interactive=False,
+                    placeholder="업데이트 로그가 여기에 표시됩니다...",
+                )
 
-        def start_update(modpack_zip, modpack_zip_old, resourcepack_zip, source_lang):
+        def start_update(
+            modpack_zip,
+            modpack_zip_old,
+            resourcepack_zip,
+            source_lang,
+            max_workers,
+            file_split_number,
+            config,
+        ):
+            logger_client = Logger(config["log_file_path"])
+            logger_client.reset_logs()
             os.makedirs("./temp/update_progress", exist_ok=True)
             short_id = str(int(time.time() * 1000))[-8:]  # 마지막 8자리 사용
             temp_dir = f"./temp/update_progress/{short_id}"
@@ -103,73 +148,56 @@ def create_update_modpack_ui():
             with zipfile.ZipFile(resourcepack_zip.name, "r") as zf:
                 zf.extractall(resourcepack_dir)
 
-            files, mods_jars, jar_fingerprints = process_modpack_directory(
-                modpack_dir,
-                source_lang,
-                True,
-                True,
-                True,
-                True,
-            )
-            extact_all_zip_files(old_modpack_dir)
-
-            for file in files:
-                file = file.replace(source_lang, "ko_kr")
-                parser = BaseParser.get_parser_by_extension(os.path.splitext(file)[1])
-                try:
-                    with open(file, "r", encoding="utf-8") as f:
-                        new_data = parser.load(f.read())
-                except Exception:
-                    logger.error(f"파일을 읽을 수 없습니다: {file}")
-                    continue
-
-                relative_path = os.path.relpath(file, modpack_dir)
-
-                if "assets" in relative_path:
-                    path_in_resourcepack = relative_path[relative_path.find("assets") :]
-                    resourcepack_file_path = os.path.join(
-                        resourcepack_dir, path_in_resourcepack
-                    ).replace("\\", "/")
-                else:
-                    resourcepack_file_path = os.path.join(
-                        resourcepack_dir, relative_path
-                    ).replace("\\", "/")
-
-                old_modpack_file_path = os.path.join(
-                    old_modpack_dir, relative_path
-                ).replace("\\", "/")
-
-                results = {}
-                try:
-                    old_data_source_path = None
-                    if os.path.exists(resourcepack_file_path):
-                        with open(resourcepack_file_path, "r", encoding="utf-8") as f:
-                            old_data = parser.load(f.read())
-                        old_data_source_path = resourcepack_file_path
-                    elif os.path.exists(old_modpack_file_path):
-                        with open(old_modpack_file_path, "r", encoding="utf-8") as f:
-                            old_data = parser.load(f.read())
-                        old_data_source_path = old_modpack_file_path
-                    else:
-                        old_data = {}
-
-                    for k, v in new_data.items():
-                        if k in old_data and old_data[k] != v:
-                            results[k] = old_data[k]
-                        else:
-                            results[k] = v
-
-                    if old_data_source_path:
-                        parser.save(results, old_data_source_path)
+            with vfs.session():
+                files, mods_jars, jar_fingerprints = process_modpack_directory(
+                    modpack_dir,
+                    source_lang,
+                    True,
+                    True,
+                    True,
+                    True,
+                )
+                extact_all_zip_files(old_modpack_dir)
 
-                except FileNotFoundError:
-                    logger.error(
-                        f"파일을 찾을 수 없습니다: {resourcepack_file_path} 또는 {old_modpack_file_path}"
+                # 이전 매니페스트와 비교하여 추가되거나 바뀐 키만 번역하고 나머지는 이전 번역 사용
+                old_manifest = load_manifest(old_modpack_dir, resourcepack_dir)
+                if old_manifest is None:
+                    logger_client.write(
+                        "이전 번역본에 매니페스트가 없어 이전 번역에 없는 키만 번역합니다."
                     )
-                    pass
-                except Exception as e:
-                    print(f"오류 발생 ({file}): {e}")
-                    pass
+                new_manifest = build_manifest(
+                    files, modpack_dir, source_lang, jar_fingerprints, base=old_manifest
+                )
+                file_pairs, stats = plan_update(
+                    files,
+                    modpack_dir,
+                    new_manifest,
+                    old_manifest,
+                    old_modpack_dir,
+                    resourcepack_dir,
+                    source_lang,
+                )
+                logger_client.write(
+                    f"변경 없음 {stats['unchanged']}개 파일, 업데이트 {stats['files']}개 파일 "
+                    f"(번역할 키 {stats['translate']}개, 이전 번역 사용 {stats['carried']}개)"
+                )
+                if file_pairs:
+                    asyncio.run(
+                        run_json_translation(
+                            file_pairs,
+                            source_lang,
+                            config,
+                            False,
+                            False,
+                            int(max_workers),
+                            int(file_split_number),
+                            True,
+                            logger_client=logger_client,
+                            jar_fingerprints=jar_fingerprints,
+                        )
+                    )
+            save_manifest(new_manifest, os.path.join(old_modpack_dir, MANIFEST_NAME))
+            logger_client.write("업데이트 번역 완료")
 
             updated_resourcepack_zip_path = os.path.join(
                 output_zip_dir, f"updated_resourcepack_{short_id}.zip"
@@ -177,21 +205,34 @@ def create_update_modpack_ui():
             updated_modpack_zip_path = os.path.join(
                 output_zip_dir, f"updated_modpack_settings_{short_id}.zip"
             ).replace("\\", "/")
+            updated_delta_zip_path = os.path.join(
+                output_zip_dir, f"updated_resourcepack_delta_{short_id}.zip"
+            ).replace("\\", "/")
 
-            restore_zip_files(old_modpack_dir, source_lang)
+            # 복구한 zip은 아래 설정 ZIP에 다시 담기므로 무압축으로 저장
+            restore_zip_files(
+                old_modpack_dir,
+                source_lang,
+                compresslevel=ARCHIVE_INTERMEDIATE_COMPRESS_LEVEL,
+            )
 
-            with zipfile.ZipFile(
-                updated_resourcepack_zip_path, "w", zipfile.ZIP_DEFLATED
-            ) as zf:
+            with ParallelZipWriter(updated_resourcepack_zip_path) as zf:
                 for root, _, files_in_dir in os.walk(resourcepack_dir):
                     for file_in_dir in files_in_dir:
                         file_path = os.path.join(root, file_in_dir)
                         arcname = os.path.relpath(file_path, resourcepack_dir)
                         zf.write(file_path, arcname)
 
-            with zipfile.ZipFile(
-                updated_modpack_zip_path, "w", zipfile.ZIP_DEFLATED
-            ) as zf:
+            # 기존 리소스팩에서 바뀐 파일만 담은 델타 (서버에서 apply_delta로 적용)
+            try:
+                create_delta(
+                    resourcepack_zip.name, resourcepack_dir, updated_delta_zip_path
+                )
+            except Exception as e:
+                logger_client.write(f"델타 리소스팩 생성 중 오류 발생: {e}")
+                updated_delta_zip_path = None
+
+            with ParallelZipWriter(updated_modpack_zip_path) as zf:
                 for root, _, files_in_dir in os.walk(old_modpack_dir):
                     included_folders = ["config", "kubejs", "scripts"]
 
@@ -227,6 +268,14 @@ def create_update_modpack_ui():
                 args=[updated_modpack_zip_path],
                 misfire_grace_time=600,
             )
+            if updated_delta_zip_path:
+                scheduler.add_job(
+                    delete_file_later,
+                    "date",
+                    run_date=datetime.fromtimestamp(time.time() + 3600),
+                    args=[updated_delta_zip_path],
+                    misfire_grace_time=600,
+                )
             scheduler.add_job(
                 shutil.rmtree,
                 "date",
@@ -252,7 +301,11 @@ def create_update_modpack_ui():
                 kwargs={"ignore_errors": True},
             )
 
-            return updated_resourcepack_zip_path, updated_modpack_zip_path
+            return (
+                updated_resourcepack_zip_path,
+                updated_delta_zip_path,
+                updated_modpack_zip_path,
+            )
 
         update_btn.click(
             start_update,
@@ -261,7 +314,18 @@ def create_update_modpack_ui():
                 modpack_zip_input_old,
                 resourcepack_zip_input,
                 source_lang,
+                max_workers,
+                file_split_number,
+                config_state,
             ],
-            outputs=[output_resourcepack_zip, output_modpack_zip],
+            outputs=[output_resourcepack_zip, output_delta_zip, output_modpack_zip],
         )
+
+        def update_log(config):
+            log_file_path = config.get("log_file_path")
+            if log_file_path:
+                logger_client = Logger(log_file_path)
+                return gr.update(value=logger_client.read_logs())
+
+        gr.Timer(3).tick(fn=update_log, inputs=[config_state], outputs=log_output)
     return tab
@@ -5,23 +5,53 @@
 번역된 내용으로 리소스팩을 생성합니다.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "2.0.1"
 
-from .graph import create_translation_graph, translate_json_file
-from .parsers import (
-    BaseParser,
-    JSONParser,
-    LangParser,
-    SNBTParser,
-    TxtParser,
-    XMLParser,
-)
-from .resourcepack import create_resourcepack
-from .translator import get_translator
+if TYPE_CHECKING:
+    from .graph import create_translation_graph, translate_json_file, translate_mapping
+    from .parsers import (
+        BaseParser,
+        JSONParser,
+        LangParser,
+        SNBTParser,
+        TxtParser,
+        XMLParser,
+    )
+    from .resourcepack import create_resourcepack
+    from .translator import get_translator
+
+# 하위 모듈은 처음 접근할 때 임포트합니다 (파서만 쓰는 워커 프로세스가 LLM 의존성을 불러오지 않도록)
+_LAZY_ATTRIBUTES = {
+    "create_translation_graph": ".graph",
+    "translate_json_file": ".graph",
+    "translate_mapping": ".graph",
+    "get_translator": ".translator",
+    "create_resourcepack": ".resourcepack",
+    "JSONParser": ".parsers",
+    "LangParser": ".parsers",
+    "TxtParser": ".parsers",
+    "SNBTParser": ".parsers",
+    "XMLParser": ".parsers",
+    "BaseParser": ".parsers",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "create_translation_graph",
     "translate_json_file",
+    "translate_mapping",
     "get_translator",
     "create_resourcepack",
     "JSONParser",
@@ -0,0 +1,112 @@
+"""
+마인크래프트 공식 언어 에셋 지연 로더
+
+assets/versions/<버전>/ 아래의 언어 파일을 처음 접근할 때만 읽어옵니다.
+여러 마인크래프트 버전의 에셋을 동시에 불러올 수 있습니다.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ASSETS_VERSIONS_PATH = os.path.join(os.path.dirname(__file__), "assets", "versions")
+DEFAULT_MINECRAFT_VERSION = "1.21.5"
+
+
+def get_default_version() -> str:
+    """환경 변수 MINECRAFT_VERSION 또는 기본 버전을 반환합니다."""
+    return os.getenv("MINECRAFT_VERSION", DEFAULT_MINECRAFT_VERSION)
+
+
+def available_versions() -> List[str]:
+    """사용 가능한 마인크래프트 버전 목록을 반환합니다."""
+    if not os.path.isdir(ASSETS_VERSIONS_PATH):
+        return []
+    return sorted(
+        entry.name for entry in os.scandir(ASSETS_VERSIONS_PATH) if entry.is_dir()
+    )
+
+
+class LanguageAssets:
+    """
+    특정 마인크래프트 버전의 언어 파일 모음
+
+    각 언어 파일은 처음 요청될 때 한 번만 파싱되어 캐시됩니다.
+    """
+
+    def __init__(self, version: str):
+        self.version = version
+        self.path = os.path.join(ASSETS_VERSIONS_PATH, version)
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def file_path(self, lang_code: str) -> str:
+        """언어 코드에 해당하는 파일 경로를 반환합니다."""
+        return os.path.join(self.path, f"{lang_code.lower()}.json")
+
+    def has(self, lang_code: str) -> bool:
+        """해당 언어 파일이 존재하는지 확인합니다."""
+        return os.path.exists(self.file_path(lang_code))
+
+    def get(self, lang_code: str) -> Dict[str, Any]:
+        """
+        언어 파일을 로드하여 반환합니다.
+
+        Args:
+            lang_code: 언어 코드 (예: en_us, ko_kr)
+
+        Returns:
+            번역 키 -> 문자열 사전. 파일이 없으면 빈 사전
+        """
+        lang_code = lang_code.lower()
+        data = self._cache.get(lang_code)
+        if data is not None:
+            return data
+
+        with self._lock:
+            data = self._cache.get(lang_code)
+            if data is not None:
+                return data
+
+            path = self.file_path(lang_code)
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                logger.debug(f"언어 에셋 로드: {self.version}/{lang_code}")
+            else:
+                logger.warning(f"언어 에셋이 없습니다: {path}")
+                data = {}
+            self._cache[lang_code] = data
+            return data
+
+    def release(self, lang_code: Optional[str] = None) -> None:
+        """캐시된 언어 파일을 해제합니다. 언어 코드가 없으면 모두 해제합니다."""
+        with self._lock:
+            if lang_code is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(lang_code.lower(), None)
+
+
+_ASSETS: Dict[str, LanguageAssets] = {}
+_ASSETS_LOCK = threading.Lock()
+
+
+def get_language_assets(version: Optional[str] = None) -> LanguageAssets:
+    """버전별 LanguageAssets 인스턴스를 반환합니다."""
+    version = version or get_default_version()
+    with _ASSETS_LOCK:
+        assets = _ASSETS.get(version)
+        if assets is None:
+            assets = LanguageAssets(version)
+            _ASSETS[version] = assets
+        return assets
+
+
+def load_language_file(lang_code: str, version: Optional[str] = None) -> Dict[str, Any]:
+    """지정한 버전의 공식 언어 파일을 로드합니다."""
+    return get_language_assets(version).get(lang_code)
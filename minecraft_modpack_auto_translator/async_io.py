@@ -0,0 +1,244 @@
+"""
+비동기 번역 파이프라인용 파일 입출력
+
+이벤트 루프에서 동기 파일 입출력을 하면 그동안 진행 중인 모든 LLM 요청 코루틴이 멈춥니다.
+이 모듈은 파일 읽기/쓰기를 전용 스레드 풀에서 실행하고, 쓰기 작업은 개수가 제한된
+write-behind 버퍼로 모아 처리합니다. 이벤트 루프 지연을 측정하는 모니터도 제공합니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Union
+
+from . import vfs
+from .config import IO_MAX_PENDING_WRITES, IO_MAX_WORKERS
+
+logger = logging.getLogger(__name__)
+
+_IO_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_IO_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """파일 입출력 전용 스레드 풀을 반환합니다."""
+    global _IO_EXECUTOR
+    if _IO_EXECUTOR is None:
+        with _IO_EXECUTOR_LOCK:
+            if _IO_EXECUTOR is None:
+                _IO_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=IO_MAX_WORKERS, thread_name_prefix="mcpack-io"
+                )
+    return _IO_EXECUTOR
+
+
+async def run_io(func: Callable, *args) -> Any:
+    """동기 함수를 입출력 스레드 풀에서 실행합니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_executor(), func, *args)
+
+
+def write_bytes_atomic(path: str, data: bytes) -> None:
+    """
+    임시 파일에 기록한 뒤 교체하여, 중간에 중단되어도 반쯤 쓰인 파일이 남지 않게 합니다.
+
+    Args:
+        path: 저장할 파일 경로
+        data: 저장할 내용
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".part"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _encode_payload(payload: Union[str, bytes, Callable[[], Union[str, bytes]]]):
+    if callable(payload):
+        payload = payload()
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    return payload
+
+
+def _write_payload_sync(path: str, payload) -> None:
+    write_bytes_atomic(path, _encode_payload(payload))
+
+
+async def read_bytes(path: str) -> bytes:
+    """파일 내용을 바이트로 읽습니다. (JAR 내부 항목의 가상 경로 포함)"""
+    return await run_io(vfs.read_bytes, path)
+
+
+async def read_text(path: str, errors: str = "strict") -> str:
+    """파일 내용을 UTF-8 문자열로 읽습니다."""
+    content = await read_bytes(path)
+    return content.decode("utf-8", errors=errors)
+
+
+async def write_text(path: str, text: str) -> None:
+    """문자열을 UTF-8로 원자적으로 저장합니다."""
+    await run_io(_write_payload_sync, path, text)
+
+
+async def write_json(path: str, data: Any) -> None:
+    """데이터를 JSON으로 직렬화하여 원자적으로 저장합니다. 직렬화도 스레드에서 수행합니다."""
+    await run_io(
+        _write_payload_sync,
+        path,
+        lambda: json.dumps(data, ensure_ascii=False, indent=4),
+    )
+
+
+class WriteBehindBuffer:
+    """
+    제한된 개수의 쓰기 작업을 백그라운드에서 처리하는 버퍼
+
+    같은 경로에 대한 쓰기가 아직 시작되지 않았으면 마지막 내용만 기록합니다.
+    진행 중인 경로 수가 max_pending에 도달하면 submit()이 자리가 날 때까지 기다립니다.
+    """
+
+    def __init__(self, max_pending: int = IO_MAX_PENDING_WRITES):
+        """
+        Args:
+            max_pending: 동시에 대기할 수 있는 최대 쓰기 경로 수
+        """
+        self.max_pending = max_pending
+        self._slots = asyncio.Semaphore(max_pending)
+        self._payloads: Dict[str, Any] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._errors: list = []
+
+    async def submit(
+        self, path: str, payload: Union[str, bytes, Callable[[], Union[str, bytes]]]
+    ) -> None:
+        """
+        쓰기 작업을 예약합니다.
+
+        Args:
+            path: 저장할 파일 경로
+            payload: 저장할 내용 또는 스레드에서 내용을 만들어 반환하는 함수
+        """
+        if path in self._tasks:
+            # 아직 기록되지 않은 이전 내용은 최신 내용으로 대체
+            self._payloads[path] = payload
+            return
+
+        await self._slots.acquire()
+        self._payloads[path] = payload
+        self._tasks[path] = asyncio.create_task(self._drain(path))
+
+    async def _drain(self, path: str) -> None:
+        try:
+            while path in self._payloads:
+                payload = self._payloads.pop(path)
+                try:
+                    await run_io(_write_payload_sync, path, payload)
+                except Exception as e:
+                    logger.error(f"파일 저장 중 오류 발생: {path} / {e}")
+                    self._errors.append((path, e))
+        finally:
+            self._tasks.pop(path, None)
+            self._slots.release()
+
+    @property
+    def errors(self) -> list:
+        """저장에 실패한 (경로, 예외) 목록"""
+        return list(self._errors)
+
+    async def flush(self) -> None:
+        """예약된 모든 쓰기 작업이 끝날 때까지 기다립니다."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks.values()), return_exceptions=True)
+
+
+class EventLoopLagMonitor:
+    """
+    이벤트 루프 지연 측정기
+
+    일정 간격으로 잠들었다 깨어나며 예정 시각보다 늦게 깨어난 시간을 기록합니다.
+    동기 입출력이나 CPU 작업이 루프를 막으면 이 값이 커집니다.
+    """
+
+    def __init__(
+        self, interval: float = 0.1, threshold: float = 0.05, window: int = 10000
+    ):
+        """
+        Args:
+            interval: 측정 간격 (초 단위)
+            threshold: 지연으로 집계할 최소 시간 (초 단위)
+            window: 중앙값 계산에 쓸 최근 측정값 개수
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.samples = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+        self._lags = deque(maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> "EventLoopLagMonitor":
+        """측정을 시작합니다."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - expected)
+            self.samples += 1
+            self.total_lag += lag
+            self._lags.append(lag)
+            if lag > self.max_lag:
+                self.max_lag = lag
+            if lag >= self.threshold:
+                self.stalls += 1
+
+    async def stop(self) -> Dict[str, float]:
+        """측정을 멈추고 통계를 반환합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        return self.stats()
+
+    def stats(self) -> Dict[str, float]:
+        """현재까지의 지연 통계를 반환합니다."""
+        return {
+            "samples": self.samples,
+            "mean_ms": (self.total_lag / self.samples * 1000) if self.samples else 0.0,
+            "p50_ms": statistics.median(self._lags) * 1000 if self._lags else 0.0,
+            "max_ms": self.max_lag * 1000,
+            "stalls": self.stalls,
+        }
+
+    def summary(self) -> str:
+        """로그용 요약 문자열을 반환합니다."""
+        stats = self.stats()
+        return (
+            f"이벤트 루프 지연: 평균 {stats['mean_ms']:.1f}ms, "
+            f"중앙값 {stats['p50_ms']:.1f}ms, "
+            f"최대 {stats['max_ms']:.1f}ms, "
+            f"{self.threshold * 1000:.0f}ms 이상 지연 {stats['stalls']}회 "
+            f"({stats['samples']}회 측정)"
+        )
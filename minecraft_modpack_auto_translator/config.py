@@ -1,19 +1,28 @@
-import json
 import os
 
 from dotenv import load_dotenv
 
+from .assets import get_default_version, get_language_assets
+
 # .env 파일 로드
 load_dotenv()
 
-# 언어 파일 경로
-LANGUAGE_FILES_PATH = os.path.join(os.path.dirname(__file__), "assets/versions/1.21.5")
-OFFICIAL_EN_LANG_FILE = json.load(
-    open(os.path.join(LANGUAGE_FILES_PATH, "en_us.json"), "r", encoding="utf-8")
-)
-OFFICIAL_KO_LANG_FILE = json.load(
-    open(os.path.join(LANGUAGE_FILES_PATH, "ko_kr.json"), "r", encoding="utf-8")
-)
+# 언어 파일 경로 (MINECRAFT_VERSION 환경 변수로 버전 선택)
+MINECRAFT_VERSION = get_default_version()
+LANGUAGE_FILES_PATH = get_language_assets(MINECRAFT_VERSION).path
+
+# 공식 언어 파일은 처음 접근할 때 로드됩니다 (OFFICIAL_EN_LANG_FILE, OFFICIAL_KO_LANG_FILE)
+_LAZY_LANGUAGE_FILES = {
+    "OFFICIAL_EN_LANG_FILE": "en_us",
+    "OFFICIAL_KO_LANG_FILE": "ko_kr",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_LANGUAGE_FILES:
+        return get_language_assets(MINECRAFT_VERSION).get(_LAZY_LANGUAGE_FILES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 FORMAT_CODE_PATTERN = r"[§&][0-9a-fk-or]"
 C_PLACEHOLDER_PATTERN = r"%(?:[sd]|[0-9]+\$s)"
@@ -194,3 +203,69 @@ DICTIONARY_PREFIX_WHITELIST = [
 ]
 
 DICTIONARY_SUFFIX_BLACKLIST = ["desc", "info", "tooltip", "description", "guide"]
+
+# 사전 후보 번역 관리
+# 한 영어 용어에 보관할 최대 한국어 후보 수와 프롬프트에 넣을 후보 수
+DICTIONARY_MAX_CANDIDATES = int(os.getenv("DICTIONARY_MAX_CANDIDATES", "5"))
+DICTIONARY_PROMPT_CANDIDATES = int(os.getenv("DICTIONARY_PROMPT_CANDIDATES", "3"))
+
+# 후보 점수 계산 시 출처별 가중치 (등장할 때마다 출처 가중치만큼 점수가 오름)
+# 순위는 후보 출처 중 가장 높은 가중치가 먼저이고, 같으면 점수로 정함
+DICTIONARY_SOURCE_WEIGHTS = {
+    "custom": 4,
+    "official": 3,
+    "existing": 2,
+    "seed": 1,
+    "llm": 1,
+}
+
+# 비동기 파이프라인 파일 입출력
+# 입출력 전용 스레드 수와 동시에 대기할 수 있는 최대 쓰기 파일 수
+IO_MAX_WORKERS = int(os.getenv("IO_MAX_WORKERS", "4"))
+IO_MAX_PENDING_WRITES = int(os.getenv("IO_MAX_PENDING_WRITES", "8"))
+
+# 전처리(특수 형식 추출, 사전 검색) 실행 방식: inline, thread, process
+PREPROCESS_MODE = os.getenv("PREPROCESS_MODE", "inline")
+PREPROCESS_MAX_WORKERS = int(
+    os.getenv("PREPROCESS_MAX_WORKERS", str(os.cpu_count() or 4))
+)
+PREPROCESS_BATCH_SIZE = int(os.getenv("PREPROCESS_BATCH_SIZE", "32"))
+PREPROCESS_BATCH_DELAY = float(os.getenv("PREPROCESS_BATCH_DELAY", "0.005"))
+# process 방식에서 작업자에 보낸 사전 키 스냅샷 이후 추가된 키가 이 수를 넘으면 스냅샷을 다시 만듦
+PREPROCESS_SNAPSHOT_REFRESH = int(os.getenv("PREPROCESS_SNAPSHOT_REFRESH", "2048"))
+
+# 작업 스케줄링
+# 번역 항목 하나의 비용(글자 수 단위)과 큰 파일을 나눌 조각 크기 (워커 하나의 이상적인 부하 대비 비율)
+SCHEDULER_UNIT_WEIGHT = float(os.getenv("SCHEDULER_UNIT_WEIGHT", "200"))
+SCHEDULER_SHARD_FACTOR = float(os.getenv("SCHEDULER_SHARD_FACTOR", "0.5"))
+
+# JAR 스캔(핑거프린트, 항목 검색) 작업자 수 (0이면 CPU 코어 수)
+JAR_SCAN_WORKERS = int(os.getenv("JAR_SCAN_WORKERS", "0"))
+
+# 기존 번역 파일에서 사전을 구축할 때의 작업자 수 (0이면 CPU 코어 수, 1이면 순차 처리)
+# 파일 수가 DICTIONARY_BUILD_PARALLEL_MIN보다 적으면 프로세스를 띄우지 않고 순차 처리
+DICTIONARY_BUILD_WORKERS = int(os.getenv("DICTIONARY_BUILD_WORKERS", "0"))
+DICTIONARY_BUILD_PARALLEL_MIN = int(os.getenv("DICTIONARY_BUILD_PARALLEL_MIN", "16"))
+
+# JAR 핑거프린트 캐시 파일 (경로, 크기, 수정 시각이 같으면 다시 계산하지 않음)
+FINGERPRINT_CACHE_PATH = os.getenv(
+    "FINGERPRINT_CACHE_PATH", "./temp/fingerprint_cache.json"
+)
+
+# JAR 번역 결과 저장소 (JAR 핑거프린트 + 항목 경로 기준으로 번역된 파일을 재사용)
+# 마지막 사용 후 보관 기간(일)과 최대 저장 용량(바이트)을 넘으면 오래된 항목부터 삭제
+TRANSLATION_STORE_MAX_AGE_DAYS = float(
+    os.getenv("TRANSLATION_STORE_MAX_AGE_DAYS", "30")
+)
+TRANSLATION_STORE_MAX_BYTES = int(
+    os.getenv("TRANSLATION_STORE_MAX_BYTES", str(512 * 1024 * 1024))
+)
+
+# 압축 파일(리소스팩, 결과 ZIP, JAR) 생성
+# 병렬 압축 스레드 수 (0이면 CPU 코어 수), 압축 수준 (0이면 무압축 STORED, 1~9는 DEFLATE)
+# 다시 다른 ZIP에 담기는 중간 압축 파일은 한 번만 압축되도록 기본적으로 무압축으로 저장
+ARCHIVE_WORKERS = int(os.getenv("ARCHIVE_WORKERS", "0"))
+ARCHIVE_COMPRESS_LEVEL = int(os.getenv("ARCHIVE_COMPRESS_LEVEL", "6"))
+ARCHIVE_INTERMEDIATE_COMPRESS_LEVEL = int(
+    os.getenv("ARCHIVE_INTERMEDIATE_COMPRESS_LEVEL", "0")
+)
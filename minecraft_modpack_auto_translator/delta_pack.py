@@ -0,0 +1,181 @@
+"""
+리소스팩 변경분(델타) 압축 파일
+
+업데이트 후 전체 리소스팩 대신 바뀐 파일만 담은 델타 ZIP을 만들고, 서버에 저장된 기존
+리소스팩(base)에 델타를 적용해 새 리소스팩을 만듭니다. 적용할 때는 base와 델타의
+압축된 항목을 그대로 복사하므로 다시 압축하지 않습니다.
+
+델타 ZIP의 delta_manifest.json 구조:
+    {
+        "version": 1,
+        "base": {항목 이름: [CRC, 크기]},      # 델타를 만든 base 리소스팩의 항목
+        "files": {항목 이름: sha256},          # 새 리소스팩의 모든 항목
+        "changed": [항목 이름, ...],           # 델타에 들어 있는 항목
+        "removed": [항목 이름, ...]            # base에서 삭제할 항목
+    }
+"""
+
+import hashlib
+import json
+import logging
+import os
+import zipfile
+import zlib
+from typing import Dict, Optional
+
+from .config import ARCHIVE_COMPRESS_LEVEL
+from .zip_utils import ParallelZipWriter
+
+logger = logging.getLogger(__name__)
+
+DELTA_MANIFEST_NAME = "delta_manifest.json"
+DELTA_VERSION = 1
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
+def _hash_file(path: str):
+    """파일의 (sha256, CRC, 크기)를 한 번 읽어 계산합니다."""
+    sha = hashlib.sha256()
+    crc = 0
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(_READ_CHUNK_SIZE):
+            sha.update(chunk)
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+    return sha.hexdigest(), crc, size
+
+
+def _iter_directory(directory: str):
+    for root, _, files in os.walk(directory):
+        for file in sorted(files):
+            path = os.path.join(root, file)
+            yield path, os.path.relpath(path, directory).replace(os.sep, "/")
+
+
+def create_delta(
+    base_zip_path: str,
+    directory: str,
+    delta_path: str,
+    compresslevel: int = ARCHIVE_COMPRESS_LEVEL,
+) -> Dict:
+    """
+    base 리소스팩과 비교하여 새 리소스팩 폴더의 바뀐 파일만 담은 델타 ZIP을 만듭니다.
+
+    base 항목과 크기, CRC가 같은 파일은 바뀌지 않은 것으로 봅니다.
+
+    Args:
+        base_zip_path: 기존 리소스팩 ZIP
+        directory: 새 리소스팩 폴더
+        delta_path: 저장할 델타 ZIP 경로
+        compresslevel: 압축 수준
+
+    Returns:
+        델타 매니페스트
+    """
+    with zipfile.ZipFile(base_zip_path, "r") as base:
+        base_entries = {
+            info.filename: [info.CRC, info.file_size]
+            for info in base.infolist()
+            if not info.is_dir()
+        }
+
+    manifest = {
+        "version": DELTA_VERSION,
+        "base": base_entries,
+        "files": {},
+        "changed": [],
+        "removed": [],
+    }
+    with ParallelZipWriter(delta_path, compresslevel) as zf:
+        for path, arcname in _iter_directory(directory):
+            digest, crc, size = _hash_file(path)
+            manifest["files"][arcname] = digest
+            if base_entries.get(arcname) != [crc, size]:
+                zf.write(path, arcname)
+                manifest["changed"].append(arcname)
+        manifest["removed"] = sorted(set(base_entries) - set(manifest["files"]))
+        zf.writestr(
+            DELTA_MANIFEST_NAME,
+            json.dumps(manifest, ensure_ascii=False, indent=4, sort_keys=True),
+        )
+    logger.info(
+        f"델타 생성: 변경 {len(manifest['changed'])}개, "
+        f"삭제 {len(manifest['removed'])}개, 전체 {len(manifest['files'])}개 ({delta_path})"
+    )
+    return manifest
+
+
+def read_delta_manifest(delta: zipfile.ZipFile) -> Dict:
+    """델타 ZIP의 매니페스트를 읽습니다."""
+    try:
+        manifest = json.loads(delta.read(DELTA_MANIFEST_NAME))
+    except KeyError:
+        raise ValueError("델타 매니페스트가 없는 ZIP입니다.") from None
+    if manifest.get("version") != DELTA_VERSION:
+        raise ValueError(f"지원하지 않는 델타 버전입니다: {manifest.get('version')}")
+    return manifest
+
+
+def apply_delta(
+    base_zip_path: str,
+    delta_path: str,
+    output_path: str,
+    verify: bool = True,
+    compresslevel: Optional[int] = None,
+) -> Dict:
+    """
+    기존 리소스팩에 델타를 적용하여 새 리소스팩을 만듭니다.
+
+    바뀌지 않은 항목은 base에서, 바뀐 항목은 델타에서 압축된 바이트를 그대로 복사합니다.
+
+    Args:
+        base_zip_path: 델타를 만들 때 사용한 기존 리소스팩 ZIP
+        delta_path: 델타 ZIP
+        output_path: 저장할 새 리소스팩 ZIP 경로
+        verify: base 항목의 CRC와 크기가 델타를 만들 때와 같은지 확인
+        compresslevel: 원본 복사를 할 수 없을 때 사용할 압축 수준
+
+    Returns:
+        델타 매니페스트
+
+    Raises:
+        ValueError: 델타 형식이 잘못되었거나 base가 델타를 만든 리소스팩과 다를 때
+    """
+    with (
+        zipfile.ZipFile(base_zip_path, "r") as base,
+        zipfile.ZipFile(delta_path, "r") as delta,
+    ):
+        manifest = read_delta_manifest(delta)
+        changed = set(manifest["changed"])
+        skipped = changed | set(manifest["removed"])
+
+        if verify:
+            expected = manifest["base"]
+            for info in base.infolist():
+                if info.is_dir() or info.filename in changed:
+                    continue
+                if expected.get(info.filename) != [info.CRC, info.file_size]:
+                    raise ValueError(
+                        f"델타를 만든 리소스팩과 다릅니다: {info.filename}"
+                    )
+
+        base_names = [
+            info.filename
+            for info in base.infolist()
+            if not info.is_dir() and info.filename not in skipped
+        ]
+        missing = set(manifest["files"]) - set(base_names) - changed
+        if missing:
+            raise ValueError(f"base와 델타에 없는 항목: {sorted(missing)[:5]}")
+
+        kwargs = {} if compresslevel is None else {"compresslevel": compresslevel}
+        with ParallelZipWriter(output_path, **kwargs) as out:
+            for name in base_names:
+                out.copy_raw_entry(base, base.getinfo(name))
+            for name in manifest["changed"]:
+                out.copy_raw_entry(delta, delta.getinfo(name))
+    logger.info(
+        f"델타 적용: base {len(base_names)}개, 변경 {len(changed)}개 ({output_path})"
+    )
+    return manifest
@@ -0,0 +1,222 @@
+"""
+번역 사전 영구 저장소
+
+SQLite(WAL 모드)에 사전 항목을 기록합니다. 변경 사항은 메모리에 잠시 모았다가
+일정 개수 또는 일정 시간마다 한 번에 커밋하므로, 작업이 중간에 종료되어도
+마지막 플러시까지의 항목이 남고 다른 프로세스나 이후 작업에서 다시 열 수 있습니다.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .async_io import get_io_executor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DICTIONARY_STORE_PATH = "./temp/shared_dictionary.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    en TEXT NOT NULL,
+    ko TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 1,
+    source TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (en, ko)
+)
+"""
+
+
+class DictionaryStore:
+    """
+    SQLite 기반 번역 사전 저장소
+
+    record()로 추가된 항목은 버퍼에 쌓였다가 flush_size개가 모이거나
+    flush_interval초가 지나면 입출력 스레드에서 하나의 트랜잭션으로 기록됩니다.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_DICTIONARY_STORE_PATH,
+        flush_size: int = 50,
+        flush_interval: float = 5.0,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            flush_size: 자동 플러시할 버퍼 항목 수
+            flush_interval: 자동 플러시 간격 (초 단위)
+        """
+        self.path = path
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._pending: List[Tuple[str, str, Optional[str], float]] = []
+        self._last_flush = time.time()
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+        self._closed = False
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "DictionaryStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def seed(
+        self, dictionary: Dict[str, Union[str, List[str]]], source: str = "seed"
+    ) -> None:
+        """
+        기존 사전 항목을 저장소에 넣습니다. 이미 있는 항목의 빈도는 올리지 않습니다.
+
+        Args:
+            dictionary: 번역 사전
+            source: 항목 출처
+        """
+        now = time.time()
+        rows = [
+            (en, ko, source, now)
+            for en, value in dictionary.items()
+            for ko in (value if isinstance(value, list) else [value])
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO entries (en, ko, count, source, updated_at) "
+                "VALUES (?, ?, 1, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def record(
+        self,
+        en_value: str,
+        ko_value: Union[str, List[str]],
+        source: Optional[str] = None,
+    ) -> None:
+        """
+        사전 변경 사항을 기록합니다.
+
+        Args:
+            en_value: 영어 원문
+            ko_value: 한국어 번역 (리스트 가능)
+            source: 항목 출처
+        """
+        now = time.time()
+        values = ko_value if isinstance(ko_value, list) else [ko_value]
+        with self._lock:
+            for ko in values:
+                self._pending.append((en_value, ko, source, now))
+            should_flush = not self._flush_scheduled and (
+                len(self._pending) >= self.flush_size
+                or now - self._last_flush >= self.flush_interval
+            )
+            if should_flush:
+                self._flush_scheduled = True
+        if should_flush:
+            # 번역 워커(이벤트 루프)를 막지 않도록 입출력 스레드에서 기록
+            get_io_executor().submit(self._background_flush)
+
+    def _background_flush(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._flush_scheduled = False
+
+    def flush(self) -> int:
+        """
+        버퍼에 쌓인 변경 사항을 저장소에 기록합니다.
+
+        Returns:
+            기록된 항목 수
+        """
+        with self._lock:
+            if self._closed:
+                return 0
+            pending, self._pending = self._pending, []
+            self._last_flush = time.time()
+            if not pending:
+                return 0
+            try:
+                self._conn.executemany(
+                    "INSERT INTO entries (en, ko, count, source, updated_at) "
+                    "VALUES (?, ?, 1, ?, ?) "
+                    "ON CONFLICT (en, ko) DO UPDATE SET "
+                    "count = count + 1, updated_at = excluded.updated_at",
+                    pending,
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"사전 저장소 기록 중 오류 발생: {e}")
+                self._conn.rollback()
+                self._pending = pending + self._pending
+                return 0
+        logger.debug(f"사전 저장소 플러시: {len(pending)}개 항목")
+        return len(pending)
+
+    def iter_entries(self) -> Iterable[Tuple[str, str, int, Optional[str]]]:
+        """저장된 (영어, 한국어, 빈도, 출처) 항목을 기록된 순서대로 반환합니다."""
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT en, ko, count, source FROM entries ORDER BY rowid"
+            ).fetchall()
+        return rows
+
+    def load(self) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        저장소 내용을 번역 사전 형태로 불러옵니다.
+
+        Returns:
+            (번역 사전, 소문자 키 -> 원본 키 사전)
+        """
+        dictionary: Dict[str, Any] = {}
+        dictionary_lowercase: Dict[str, str] = {}
+        for en, ko, _, _ in self.iter_entries():
+            key_lower = en.lower()
+            if key_lower in dictionary_lowercase:
+                orig_key = dictionary_lowercase[key_lower]
+                target = dictionary[orig_key]
+                if isinstance(target, list):
+                    if ko not in target:
+                        target.append(ko)
+                elif target != ko:
+                    dictionary[orig_key] = [target, ko]
+            else:
+                dictionary[en] = ko
+                dictionary_lowercase[key_lower] = en
+        return dictionary, dictionary_lowercase
+
+    def export_json(self, path: str) -> str:
+        """
+        저장소 내용을 기존 JSON 사전 형식으로 내보냅니다.
+
+        Returns:
+            저장된 파일 경로
+        """
+        dictionary, _ = self.load()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dictionary, f, ensure_ascii=False, indent=4)
+        return path
+
+    def close(self) -> None:
+        """남은 변경 사항을 기록하고 저장소를 닫습니다."""
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._conn.close()
@@ -1,11 +1,30 @@
-from typing import Union
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple, Union
 
 import aiofiles
 import numpy as np
 from numba import njit
 
+from .async_io import write_bytes_atomic
+from .config import FINGERPRINT_CACHE_PATH
 
-@njit(nogil=True)
+logger = logging.getLogger(__name__)
+
+# 캐시 파일 형식 버전 (형식이 바뀌면 기존 캐시를 버림)
+FINGERPRINT_CACHE_VERSION = 1
+# 내용 기준 캐시에 보관할 최대 항목 수
+FINGERPRINT_CACHE_MAX_ENTRIES = 20000
+
+
+# nogil: 여러 스레드에서 동시에 계산 / cache: 프로세스마다 다시 컴파일하지 않음
+@njit(nogil=True, cache=True)
 def _compute_fingerprint_nb(buf):
     # 상수
     MULT = np.uint32(1540483477)
@@ -43,22 +62,206 @@ def _compute_fingerprint_nb(buf):
     return (num6 ^ (num6 >> 15)) & MASK
 
 
-def compute_fingerprint(data: Union[bytes, bytearray]) -> int:
+def compute_fingerprint(data: Union[bytes, bytearray, memoryview]) -> int:
     """
     바이트 시퀀스에 대해 fingerprint 계산.
+
+    읽기 전용 버퍼도 복사하지 않고 그대로 계산합니다.
     """
-    # frombuffer 로 읽기 전용 뷰가 생성되므로, .copy() 로 복사해서 쓰기 가능하게 만듭니다.
-    arr = np.frombuffer(data, dtype=np.uint8).copy()
+    arr = np.frombuffer(data, dtype=np.uint8)
     return int(_compute_fingerprint_nb(arr))
 
 
 def fingerprint_file(path: str) -> int:
     """
     파일 경로를 받아 fingerprint 계산.
+
+    파일을 메모리에 읽어 들이지 않고 mmap으로 매핑하여 계산합니다.
+    해시 초기값이 공백을 제외한 바이트 수에서 시작하므로 매핑된 페이지를 두 번 훑습니다.
     """
     with open(path, "rb") as f:
-        data = f.read()
-    return compute_fingerprint(data)
+        if os.fstat(f.fileno()).st_size == 0:
+            return compute_fingerprint(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            arr = np.frombuffer(mapped, dtype=np.uint8)
+            try:
+                return int(_compute_fingerprint_nb(arr))
+            finally:
+                # 배열이 버퍼를 잡고 있으면 mmap을 닫을 수 없음
+                del arr
+
+
+def _central_directory_digest(path: str, size: int) -> Optional[str]:
+    """
+    ZIP 중앙 디렉토리의 해시를 계산합니다.
+
+    중앙 디렉토리에는 모든 항목의 이름, CRC, 크기가 들어 있으므로 파일 끝부분만 읽고도
+    같은 JAR인지 판단할 수 있습니다. 다시 압축 해제되어 경로와 수정 시각이 바뀐
+    같은 JAR의 캐시를 찾는 데 사용합니다.
+
+    Returns:
+        ZIP 형식이 아니거나 ZIP64이면 None
+    """
+    try:
+        with open(path, "rb") as f:
+            tail_size = min(size, 65536 + 22)
+            f.seek(size - tail_size)
+            tail = f.read(tail_size)
+            eocd = tail.rfind(b"PK\x05\x06")
+            if eocd < 0 or len(tail) - eocd < 22:
+                return None
+            cd_size, cd_offset = struct.unpack("<II", tail[eocd + 12 : eocd + 20])
+            if cd_size == 0xFFFFFFFF or cd_offset == 0xFFFFFFFF:
+                return None
+            f.seek(cd_offset)
+            directory = f.read(cd_size)
+            if len(directory) != cd_size:
+                return None
+    except OSError:
+        return None
+    return hashlib.blake2b(directory, digest_size=16).hexdigest()
+
+
+class FingerprintCache:
+    """
+    JAR 핑거프린트 캐시
+
+    (경로, 크기, 수정 시각)이 같으면 저장된 값을 그대로 사용합니다. 경로가 달라도
+    (크기, 중앙 디렉토리 해시)가 같으면 같은 JAR로 보고 다시 계산하지 않습니다.
+    업로드된 모드팩은 작업마다 새 폴더에 압축 해제되므로 두 번째 키가 필요합니다.
+    """
+
+    def __init__(self, path: str = FINGERPRINT_CACHE_PATH):
+        self.path = path
+        self.by_path: Dict[str, dict] = {}
+        self.by_content: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != FINGERPRINT_CACHE_VERSION:
+                return
+            self.by_path = data.get("paths", {})
+            self.by_content = data.get("content", {})
+        except Exception as e:
+            logger.warning(f"핑거프린트 캐시를 읽을 수 없습니다: {self.path} ({e})")
+
+    @staticmethod
+    def _stat_key(path: str) -> Tuple[str, int, int]:
+        stat = os.stat(path)
+        return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+    def fingerprint(self, path: str) -> Tuple[int, bool]:
+        """
+        캐시를 확인하고 없으면 계산합니다.
+
+        Returns:
+            (핑거프린트, 캐시 사용 여부)
+        """
+        key, size, mtime_ns = self._stat_key(path)
+        with self._lock:
+            entry = self.by_path.get(key)
+        if entry and entry["size"] == size and entry["mtime_ns"] == mtime_ns:
+            return entry["fingerprint"], True
+
+        digest = _central_directory_digest(path, size)
+        content_key = f"{size}:{digest}" if digest else None
+        with self._lock:
+            value = self.by_content.get(content_key) if content_key else None
+        cached = value is not None
+        if not cached:
+            value = fingerprint_file(path)
+
+        with self._lock:
+            self.by_path[key] = {
+                "size": size,
+                "mtime_ns": mtime_ns,
+                "fingerprint": value,
+            }
+            if content_key:
+                # 최근에 사용한 항목을 뒤로 보내 오래된 항목부터 정리
+                self.by_content.pop(content_key, None)
+                self.by_content[content_key] = value
+            self._dirty = True
+        return value, cached
+
+    def save(self) -> None:
+        """캐시를 파일에 저장합니다. 더 이상 존재하지 않는 경로는 정리합니다."""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            paths = {k: v for k, v in self.by_path.items() if os.path.exists(k)}
+            content = dict(
+                list(self.by_content.items())[-FINGERPRINT_CACHE_MAX_ENTRIES:]
+            )
+            self.by_path, self.by_content = paths, content
+            self._dirty = False
+        payload = {
+            "version": FINGERPRINT_CACHE_VERSION,
+            "paths": paths,
+            "content": content,
+        }
+        try:
+            write_bytes_atomic(
+                self.path, json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            )
+        except OSError as e:
+            logger.warning(f"핑거프린트 캐시를 저장할 수 없습니다: {self.path} ({e})")
+
+
+def fingerprint_files(
+    paths: Iterable[str],
+    max_workers: Optional[int] = None,
+    cache_path: Optional[str] = FINGERPRINT_CACHE_PATH,
+) -> Tuple[Dict[str, int], Dict[str, str]]:
+    """
+    여러 파일의 핑거프린트를 스레드 풀에서 병렬로 계산합니다.
+
+    계산 커널은 GIL을 놓고 실행되므로 스레드만으로 여러 코어를 사용합니다.
+
+    Args:
+        paths: 파일 경로 목록
+        max_workers: 스레드 수 (None이면 CPU 코어 수)
+        cache_path: 캐시 파일 경로 (None이면 캐시를 사용하지 않음)
+
+    Returns:
+        ({경로: 핑거프린트}, {경로: 오류 메시지})
+    """
+    paths = list(paths)
+    cache = FingerprintCache(cache_path)
+    fingerprints: Dict[str, int] = {}
+    errors: Dict[str, str] = {}
+    hits = 0
+
+    def work(path):
+        try:
+            return path, cache.fingerprint(path), None
+        except Exception as e:
+            return path, None, f"{type(e).__name__}: {e}"
+
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(paths) or 1))
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="mcpack-fingerprint"
+    ) as executor:
+        for path, result, error in executor.map(work, paths):
+            if error:
+                errors[path] = error
+                continue
+            fingerprints[path] = result[0]
+            hits += result[1]
+
+    cache.save()
+    logger.info(
+        f"핑거프린트 {len(fingerprints)}개 계산 완료 "
+        f"(캐시 사용 {hits}개, 실패 {len(errors)}개)"
+    )
+    return fingerprints, errors
 
 
 async def async_fingerprint_file(path: str) -> int:
@@ -0,0 +1,329 @@
+"""
+마인크래프트 공식 번역 용어집 인덱스
+
+공식 언어 파일(en_us.json, ko_kr.json)로부터 용어집을 미리 빌드한 압축 바이너리
+파일을 생성하고, 필요할 때 mmap으로 지연 로드합니다.
+인덱스에는 원본 언어 파일의 크기와 해시를 기록하여, 원본이 바뀌면 다시 빌드합니다.
+
+인덱스 빌드:
+    python -m minecraft_modpack_auto_translator.glossary
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from .config import LANGUAGE_FILES_PATH
+
+logger = logging.getLogger(__name__)
+
+# 파일 형식: 헤더 뒤에 (문자열 오프셋, 문자열 블롭) 순서
+# 헤더: 매직, 버전, 항목 수, 문자열 블롭 길이, 원본/대상 파일 크기, 원본/대상 파일 해시
+# 문자열 블롭의 각 문자열은 NUL 문자로 끝나므로 한 번에 디코딩해서 분리할 수 있습니다.
+INDEX_MAGIC = b"MCGLOSS1"
+INDEX_FORMAT_VERSION = 2
+_HEADER = struct.Struct("<8sIIIQQ16s16s")
+_DIGEST_SIZE = 16
+
+# 하나의 영어 용어에 여러 한국어 번역이 있을 때 사용하는 구분자
+VALUE_SEPARATOR = "\x1f"
+
+
+def get_index_path(
+    source_lang: str = "en_us",
+    target_lang: str = "ko_kr",
+    language_files_path: str = LANGUAGE_FILES_PATH,
+) -> str:
+    """언어 쌍에 해당하는 용어집 인덱스 파일 경로를 반환합니다."""
+    return os.path.join(
+        language_files_path, f"glossary_{source_lang}_{target_lang}.idx"
+    )
+
+
+def _file_digest(path: str) -> bytes:
+    """원본 언어 파일 내용의 해시"""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=_DIGEST_SIZE).digest()
+
+
+def _merge_entry(
+    en_value: str,
+    ko_value: str,
+    dictionary: Dict[str, Union[str, List[str]]],
+    dictionary_lowercase: Dict[str, str],
+) -> None:
+    """대소문자를 무시하고 같은 영어 용어의 번역을 병합합니다."""
+    key_lower = en_value.lower()
+    if key_lower in dictionary_lowercase:
+        orig_key = dictionary_lowercase[key_lower]
+        target = dictionary[orig_key]
+        if isinstance(target, list):
+            if ko_value not in target:
+                target.append(ko_value)
+        elif target != ko_value:
+            dictionary[orig_key] = [target, ko_value]
+    else:
+        dictionary[en_value] = ko_value
+        dictionary_lowercase[key_lower] = en_value
+
+
+def build_glossary_bytes(
+    source_lang: str = "en_us",
+    target_lang: str = "ko_kr",
+    language_files_path: str = LANGUAGE_FILES_PATH,
+) -> bytes:
+    """
+    공식 언어 파일에서 용어집 인덱스를 빌드하여 바이트로 반환합니다.
+
+    Args:
+        source_lang: 원본 언어 코드
+        target_lang: 대상 언어 코드
+        language_files_path: 공식 언어 파일이 있는 디렉토리
+
+    Returns:
+        인덱스 파일 내용
+    """
+    source_path = os.path.join(language_files_path, f"{source_lang}.json")
+    target_path = os.path.join(language_files_path, f"{target_lang}.json")
+    with open(source_path, "r", encoding="utf-8") as f:
+        source_data = json.load(f)
+    with open(target_path, "r", encoding="utf-8") as f:
+        target_data = json.load(f)
+
+    dictionary: Dict[str, Union[str, List[str]]] = {}
+    dictionary_lowercase: Dict[str, str] = {}
+    for key, en_val in source_data.items():
+        ko_val = target_data.get(key)
+        if en_val and ko_val:
+            _merge_entry(en_val, ko_val, dictionary, dictionary_lowercase)
+
+    strings: List[bytes] = []
+    for en_val, ko_val in dictionary.items():
+        if isinstance(ko_val, list):
+            ko_val = VALUE_SEPARATOR.join(ko_val)
+        strings.append(en_val.encode("utf-8") + b"\x00")
+        strings.append(ko_val.encode("utf-8") + b"\x00")
+
+    string_offsets = [0]
+    for chunk in strings:
+        string_offsets.append(string_offsets[-1] + len(chunk))
+
+    string_blob = b"".join(strings)
+    header = _HEADER.pack(
+        INDEX_MAGIC,
+        INDEX_FORMAT_VERSION,
+        len(dictionary),
+        len(string_blob),
+        os.path.getsize(source_path),
+        os.path.getsize(target_path),
+        _file_digest(source_path),
+        _file_digest(target_path),
+    )
+    return b"".join(
+        [
+            header,
+            struct.pack(f"<{len(string_offsets)}I", *string_offsets),
+            string_blob,
+        ]
+    )
+
+
+def build_glossary_index(
+    source_lang: str = "en_us",
+    target_lang: str = "ko_kr",
+    language_files_path: str = LANGUAGE_FILES_PATH,
+    output_path: Optional[str] = None,
+) -> str:
+    """
+    용어집 인덱스를 빌드하여 파일로 저장합니다.
+
+    Returns:
+        저장된 인덱스 파일 경로
+    """
+    output_path = output_path or get_index_path(
+        source_lang, target_lang, language_files_path
+    )
+    data = build_glossary_bytes(source_lang, target_lang, language_files_path)
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, output_path)
+    logger.info(f"용어집 인덱스 빌드 완료: {output_path} ({len(data)} bytes)")
+    return output_path
+
+
+class OfficialGlossary:
+    """
+    mmap 기반 공식 용어집 인덱스 리더
+
+    문자열은 요청될 때만 디코딩합니다.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        self._buffer = buffer
+        magic, version = struct.unpack_from("<8sI", buffer, 0)
+        if magic != INDEX_MAGIC or version != INDEX_FORMAT_VERSION:
+            raise ValueError("지원하지 않는 용어집 인덱스 형식입니다.")
+        (
+            _,
+            _,
+            self.entry_count,
+            string_blob_len,
+            self.source_size,
+            self.target_size,
+            self.source_digest,
+            self.target_digest,
+        ) = _HEADER.unpack_from(buffer, 0)
+
+        view = memoryview(buffer)
+        pos = _HEADER.size
+        self._string_offsets = view[pos : pos + (2 * self.entry_count + 1) * 4].cast(
+            "I"
+        )
+        pos += (2 * self.entry_count + 1) * 4
+        self._string_blob = view[pos : pos + string_blob_len]
+
+        self._dictionary_cache: Optional[Dict[str, Union[str, List[str]]]] = None
+
+    @classmethod
+    def open(cls, path: str) -> "OfficialGlossary":
+        """인덱스 파일을 읽기 전용 mmap으로 엽니다."""
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer)
+
+    def __len__(self) -> int:
+        return self.entry_count
+
+    def _string(self, index: int) -> str:
+        start = self._string_offsets[index]
+        end = self._string_offsets[index + 1] - 1
+        return str(self._string_blob[start:end], "utf-8")
+
+    def entry(self, entry_id: int) -> Tuple[str, Union[str, List[str]]]:
+        """항목 번호에 해당하는 (영어, 한국어) 쌍을 반환합니다."""
+        en_val = self._string(2 * entry_id)
+        ko_val = self._string(2 * entry_id + 1)
+        if VALUE_SEPARATOR in ko_val:
+            return en_val, ko_val.split(VALUE_SEPARATOR)
+        return en_val, ko_val
+
+    def items(self) -> Iterator[Tuple[str, Union[str, List[str]]]]:
+        """모든 용어집 항목을 순서대로 반환합니다."""
+        for entry_id in range(self.entry_count):
+            yield self.entry(entry_id)
+
+    def to_dictionary(
+        self,
+    ) -> Tuple[Dict[str, Union[str, List[str]]], Dict[str, str]]:
+        """
+        번역 사전 형태로 변환합니다.
+
+        반환되는 사전은 호출자가 수정할 수 있도록 매번 새로 복사됩니다.
+
+        Returns:
+            (번역 사전, 소문자 키 -> 원본 키 사전)
+        """
+        if self._dictionary_cache is None:
+            strings = str(self._string_blob, "utf-8").split("\x00")
+            self._dictionary_cache = {
+                en_val: ko_val.split(VALUE_SEPARATOR)
+                if VALUE_SEPARATOR in ko_val
+                else ko_val
+                for en_val, ko_val in zip(strings[0:-1:2], strings[1:-1:2])
+            }
+        dictionary = {
+            k: list(v) if isinstance(v, list) else v
+            for k, v in self._dictionary_cache.items()
+        }
+        dictionary_lowercase = {k.lower(): k for k in dictionary}
+        return dictionary, dictionary_lowercase
+
+
+_GLOSSARIES: Dict[Tuple[str, str, str], OfficialGlossary] = {}
+_GLOSSARY_LOCK = threading.Lock()
+
+
+def _is_stale(glossary: OfficialGlossary, source_path: str, target_path: str) -> bool:
+    """인덱스를 만든 원본 언어 파일과 현재 파일의 크기 또는 내용이 다른지 확인합니다."""
+    if glossary.source_size != os.path.getsize(
+        source_path
+    ) or glossary.target_size != os.path.getsize(target_path):
+        return True
+    # 크기가 같아도 내용이 바뀌었을 수 있으므로 해시를 비교 (mtime은 checkout마다 바뀜)
+    return glossary.source_digest != _file_digest(
+        source_path
+    ) or glossary.target_digest != _file_digest(target_path)
+
+
+def get_official_glossary(
+    source_lang: str = "en_us",
+    target_lang: str = "ko_kr",
+    language_files_path: str = LANGUAGE_FILES_PATH,
+) -> Optional[OfficialGlossary]:
+    """
+    공식 용어집을 지연 로드하여 반환합니다.
+
+    미리 빌드된 인덱스가 있으면 mmap으로 열고, 없거나 원본 언어 파일과
+    맞지 않으면 메모리에서 새로 빌드합니다. 공식 언어 파일이 없으면 None을 반환합니다.
+    """
+    cache_key = (source_lang, target_lang, language_files_path)
+    glossary = _GLOSSARIES.get(cache_key)
+    if glossary is not None:
+        return glossary
+
+    with _GLOSSARY_LOCK:
+        glossary = _GLOSSARIES.get(cache_key)
+        if glossary is not None:
+            return glossary
+
+        source_path = os.path.join(language_files_path, f"{source_lang}.json")
+        target_path = os.path.join(language_files_path, f"{target_lang}.json")
+        if not (os.path.exists(source_path) and os.path.exists(target_path)):
+            return None
+
+        index_path = get_index_path(source_lang, target_lang, language_files_path)
+        if os.path.exists(index_path):
+            try:
+                glossary = OfficialGlossary.open(index_path)
+                if _is_stale(glossary, source_path, target_path):
+                    logger.warning(f"용어집 인덱스가 오래되었습니다: {index_path}")
+                    glossary = None
+            except Exception as e:
+                logger.warning(f"용어집 인덱스 로드 실패: {index_path} ({e})")
+                glossary = None
+
+        if glossary is None:
+            glossary = OfficialGlossary(
+                build_glossary_bytes(source_lang, target_lang, language_files_path)
+            )
+
+        _GLOSSARIES[cache_key] = glossary
+        return glossary
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="공식 번역 용어집 인덱스 빌드")
+    parser.add_argument("--source-lang", default="en_us")
+    parser.add_argument("--target-lang", default="ko_kr")
+    parser.add_argument("--language-files-path", default=LANGUAGE_FILES_PATH)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    build_glossary_index(
+        args.source_lang,
+        args.target_lang,
+        args.language_files_path,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
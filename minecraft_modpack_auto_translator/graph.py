@@ -4,9 +4,8 @@ import logging
 import random
 import re
 import traceback
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-import regex
 from dotenv import load_dotenv
 from langchain.schema.output_parser import OutputParserException
 from langchain_core.language_models import BaseChatModel
@@ -14,20 +13,12 @@ from langchain_core.output_parsers import BaseOutputParser, PydanticOutputParser
 from langchain_core.prompts import PromptTemplate
 from langgraph.graph import END, StateGraph
 from pydantic import BaseModel, Field
-from rank_bm25 import BM25Okapi
 
+from .async_io import WriteBehindBuffer, read_text, write_json
 from .config import (
-    C_PLACEHOLDER_PATTERN,
-    DICTIONARY_BLACKLIST,
     DICTIONARY_INSTRUCTIONS,
-    FORMAT_CODE_PATTERN,
-    HTML_TAG_PATTERN,
-    ITEM_PLACEHOLDER_PATTERN,
-    JSON_PLACEHOLDER_PATTERN,
-    MINECRAFT_ITEM_CODE_PATTERN,
     RULES_FOR_NO_PLACEHOLDER,
     RULES_FOR_PLACEHOLDER,
-    SQUARE_BRACKET_TAG_PATTERN,
     TEMPLATE_TRANSLATE_TEXT,
 )
 from .delay_manager import DelayManager
@@ -50,6 +41,12 @@ from .loaders import (
     TranslationContext,
     WhiteListLoader,
 )
+from .preprocess import analyze as analyze_special_formats
+from .preprocess import (  # noqa: F401 (extract_special_formats: 기존 임포트 경로 유지)
+    extract_special_formats,
+    find_dictionary_keys,
+    restore_special_formats,
+)
 
 registry = LoaderRegistry()
 
@@ -88,81 +85,24 @@ logging.basicConfig(
 load_dotenv()
 
 
-# 특수 형식 (색상 코드, 플레이스홀더) 추출 및 보존
-def extract_special_formats(text):
-    format_codes = [i for i in re.findall(FORMAT_CODE_PATTERN, text) if i != ""]
-    c_placeholders = [i for i in re.findall(C_PLACEHOLDER_PATTERN, text) if i != ""]
-    json_placeholders = [
-        i for i in regex.findall(JSON_PLACEHOLDER_PATTERN, text) if i != ""
-    ]
-    item_placeholders = [
-        i for i in re.findall(ITEM_PLACEHOLDER_PATTERN, text) if i != ""
-    ]
-    html_tags_placeholders = [i for i in re.findall(HTML_TAG_PATTERN, text) if i != ""]
-    square_bracket_tags = [
-        i for i in re.findall(SQUARE_BRACKET_TAG_PATTERN, text) if i != ""
-    ]
-
-    # 마인크래프트 아이템 코드 패턴 (예: minecraft:grass)
-    minecraft_item_codes = [
-        i[0] for i in re.findall(MINECRAFT_ITEM_CODE_PATTERN, text) if i != ""
-    ]
-
-    # 모든 특수 형식을 [PLACEHOLDER_N] 형태로 대체
-    replaced_text = text
-    placeholder_map = {}
-    placeholder_count = 0
-
-    for placeholder in (
-        html_tags_placeholders
-        + item_placeholders
-        + json_placeholders
-        + format_codes
-        + c_placeholders
-        + minecraft_item_codes
-        + square_bracket_tags
-    ):
-        try:
-            if placeholder in replaced_text:
-                placeholder_count += 1
-                token = f"[P{placeholder_count}]"
-                replaced_text = replaced_text.replace(placeholder, token, 1)
-                placeholder_map[token] = placeholder
-        except Exception as e:
-            logger.error(f"특수 형식 추출 중 오류 발생: {placeholder}")
-            logger.error(f"오류 발생 원인: {e}")
-    return replaced_text, placeholder_map
-
-
-# 특수 형식 복원
-def restore_special_formats(text, placeholder_map):
-    restored_text = text
-
-    # 플레이스홀더 복원
-    for token, placeholder in placeholder_map.items():
-        restored_text = restored_text.replace(token, placeholder)
-
-    return restored_text
-
-
 # 텍스트 분석 및 특수 형식 추출
 async def analyze_text(state):
     text = state["text"]
-    replaced_text, placeholder_map = extract_special_formats(text)
 
     # TranslationContext 객체가 있으면 사전 초기화
     context: TranslationContext = state.get("context")
     if context:
         context.initialize_dictionaries()
 
-    if context.force_keep_line_break and "\n" in replaced_text:
-        logger.debug(f"줄바꿈 강제 유지: {replaced_text}")
-        num = 0
-        for i in re.findall(r"\n", replaced_text):
-            num += 1
-            newline_placeholder = f"[P_NEWLINE_{num}]"
-            replaced_text = re.sub(i, newline_placeholder, replaced_text, 1)
-            placeholder_map[newline_placeholder] = i
+    pool = context.preprocess_pool
+    if pool is not None:
+        replaced_text, placeholder_map = await pool.analyze(
+            text, context.force_keep_line_break
+        )
+    else:
+        replaced_text, placeholder_map = analyze_special_formats(
+            text, context.force_keep_line_break
+        )
 
     return {
         "text": text,
@@ -183,83 +123,22 @@ async def retrieve_translations(state):
 
     dictionary = []
     text = state["replaced_text"]
-    normalized_text = text.lower()
-
-    # replaced_text = text
-
-    # for k, i in translation_dictionary.items():
-    #     if isinstance(i, list):
-    #         for j in i:
-    #             if len(j) < 3:
-    #                 continue
-    #             if j in replaced_text:
-    #                 replaced_text = replaced_text.replace(j, "__REPLACE__")
-    #                 dictionary.append(f"{k} -> {j}")
-    #     else:
-    #         if len(i) < 3:
-    #             continue
-    #         if i in replaced_text:
-    #             replaced_text = replaced_text.replace(i, "__REPLACE__")
-    #             dictionary.append(f"{k} -> {i}")
-
-    filtered_english_words = [
-        i
-        for i in re.findall(r"\b[a-zA-Z]+\b", normalized_text)
-        if i not in DICTIONARY_BLACKLIST
-    ]
-    # s, 's로 끝나는 단어들의 원형도 추가
-    additional_words = []
-    for word in filtered_english_words:
-        # 정규식을 사용하여 's 또는 s로 끝나는 단어 처리
-        base_word = re.sub(r"'s$|s$", "", word)
-        if (
-            base_word != word
-            and base_word not in filtered_english_words
-            and len(base_word) > 3
-        ):
-            additional_words.append(base_word)
-
-    # 원형 단어들 추가
-    filtered_english_words.extend(additional_words)
-
-    finded = []
-    # 사전에서 영어 단어가 포함된 항목 찾기 (사전의 키 목록을 먼저 복사)
+
     # 동시성 문제 방지를 위해 사전의 키 목록을 미리 복사
     dict_keys = list(translation_dictionary.keys())
 
-    for word in filtered_english_words:
-        if len(word) > 3:  # 너무 짧은 단어는 제외
-            for dict_key in dict_keys:
-                if word.lower() in dict_key.lower().split():
-                    if dict_key not in finded:
-                        finded.append(dict_key)
-
-    # finded가 비어있는 경우 처리
-    if not finded:
-        return {**state, "dictionary": dictionary}
-
-    bm25 = BM25Okapi(
-        [doc.lower().split() for doc in finded],
-    )
-    doc_scores = bm25.get_scores(
-        [
-            re.sub(r"'s$|s$", "", word)
-            for word in re.sub(r"\[p[0-9]+\]", "", normalized_text).split(" ")
-        ]
-    )
-    sorted_docs = sorted(enumerate(doc_scores), key=lambda x: x[1], reverse=True)
-
-    # 점수가 0보다 큰 상위 항목 선택
-    top_n_indices = [finded[i] for i, score in sorted_docs[:5] if score > 0]
+    pool = context.preprocess_pool
+    if pool is not None:
+        top_keys = await pool.retrieve(
+            text, dict_keys, context.get("dictionary_generation")
+        )
+    else:
+        top_keys = find_dictionary_keys(text, dict_keys)
 
-    added = []
-    for i in top_n_indices:
-        if i not in added:
-            added.append(i)
-            if isinstance(translation_dictionary[i], list):
-                dictionary.append(f"{i} -> {', '.join(translation_dictionary[i])}")
-            else:
-                dictionary.append(f"{i} -> {translation_dictionary[i]}")
+    for i in top_keys:
+        dictionary.append(
+            f"{i} -> {context.format_dictionary_value(translation_dictionary[i])}"
+        )
 
     return {**state, "dictionary": dictionary}
 
@@ -306,7 +185,7 @@ async def translate_text(state):
             if key.lower() in text_replaced_with_korean_dictionary.lower():
                 try:
                     dictionary_entries.append(
-                        f"{key} -> {', '.join(item) if isinstance(item, list) else item}"
+                        f"{key} -> {context.format_dictionary_value(item)}"
                     )
                 except Exception as e:
                     logger.error(f"사전 항목 추가 중 오류 발생: {e} ({key}, {item})")
@@ -623,9 +502,9 @@ async def translate_item(
         return key, value
 
 
-async def translate_json_file(
+async def translate_mapping(
+    data: Dict[str, Any],
     input_path: str,
-    output_path: str,
     ko_data: dict = {},
     custom_dictionary_dict: Dict = {},
     llm=None,
@@ -635,19 +514,25 @@ async def translate_json_file(
     delay_manager: DelayManager = None,
     use_random_order: bool = False,
     force_keep_line_break: bool = False,
-):
+    checkpoint_callback=None,
+) -> Tuple[Dict[str, Any], List[tuple]]:
     """
-    JSON 파일을 비동기적으로 번역합니다.
+    파싱된 데이터를 파일을 거치지 않고 비동기적으로 번역합니다.
 
     Parameters:
-        input_path: 번역할 JSON 파일 경로
-        output_path: 번역 결과를 저장할 경로
+        data: 번역할 키-값 데이터
+        input_path: 원본 파일 경로 (로더 선택에 사용)
+        ko_data: 이미 존재하는 한국어 번역 데이터
         custom_dictionary_dict: 사용자 정의 사전
         llm: 번역에 사용할 언어 모델 인스턴스 (필수)
         max_workers: 동시 작업자 수
         progress_callback: 진행 상황 콜백 함수
         external_context: 외부에서 제공하는 TranslationContext 객체
         delay_manager: API 요청 사이 딜레이를 관리하는 객체
+        checkpoint_callback: 사전이 크게 늘어날 때마다 중간 결과로 호출되는 비동기 함수
+
+    Returns:
+        (번역된 데이터, 오류 목록)
     """
     # llm이 제공되지 않은 경우 오류 발생
     if llm is None:
@@ -660,13 +545,6 @@ async def translate_json_file(
         delay_manager = DelayManager(delay=0)
         logger.info("딜레이 관리자가 제공되지 않아 기본 딜레이 0초로 설정합니다.")
 
-    # 입력 JSON 파일 로드
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    # 번역 그래프 생성
-    translation_graph = create_translation_graph()
-
     # 번역 결과를 저장할 복사본 생성
     translated_data = {}
 
@@ -680,7 +558,7 @@ async def translate_json_file(
     else:
         # 공유 컨텍스트 생성 (모든 워커가 이 컨텍스트를 공유함)
         context = TranslationContext(
-            translation_graph=translation_graph,
+            translation_graph=create_translation_graph(),
             custom_dictionary_dict=custom_dictionary_dict,
             registry=registry,
             force_keep_line_break=force_keep_line_break,
@@ -696,15 +574,21 @@ async def translate_json_file(
         logger.warning(f"사전 크기 확인 중 오류: {e}")
         logger.info("초기 사전 정보를 확인할 수 없습니다.")
 
-    # 작업 큐 생성
-    queue = asyncio.Queue()
+    # 작업 큐 생성 (크기 제한, 생산자가 자리가 날 때마다 채움)
+    queue = asyncio.Queue(maxsize=max_workers * 2)
 
-    # 큐에 작업 추가 (랜덤 순서로)
-    items = list(data.items())
-    if use_random_order:
-        random.shuffle(items)  # 리스트 순서 섞기
-    for key, value in items:
-        await queue.put((key, value))
+    async def producer():
+        try:
+            # 큐에 작업 추가 (랜덤 순서로)
+            keys = list(data.keys())
+            if use_random_order:
+                random.shuffle(keys)  # 리스트 순서 섞기
+            for key in keys:
+                await queue.put((key, data[key]))
+        finally:
+            # Worker 종료 신호
+            for _ in range(max_workers):
+                await queue.put(None)
 
     # 공유 사전 상태 저장용 락
     dict_save_lock = asyncio.Lock()
@@ -716,9 +600,12 @@ async def translate_json_file(
     async def worker(worker_id: int):
         nonlocal last_save_size, error_list, ko_data
 
-        while not queue.empty():
+        while True:
             try:
-                key, value = await queue.get()
+                item = await queue.get()
+                if item is None:
+                    break
+                key, value = item
 
                 if ko_data.get(key) is not None:
                     if ko_data[key] != value and "patchouli_books" not in input_path:
@@ -739,19 +626,17 @@ async def translate_json_file(
                 else:
                     logger.error(f"번역 오류 발생: {key} / {value}")
                     error_list.append((input_path, key, value, translated_value))
-                # 사전 크기 확인 및 중간 저장 (사전 항목이 10개 이상 추가되면)
+                # 사전 크기 확인 및 중간 저장 (사전 항목이 100개 이상 추가되면)
                 current_dict_size = len(context.get_dictionary())
-                if current_dict_size - last_save_size >= 100:
+                if (
+                    checkpoint_callback is not None
+                    and current_dict_size - last_save_size >= 100
+                ):
                     async with dict_save_lock:
                         # 다른 워커가 이미 저장했는지 다시 확인
                         if current_dict_size - last_save_size >= 100:
                             try:
-                                # 중간 결과 파일 저장
-                                with open(output_path, "w", encoding="utf-8") as f:
-                                    json.dump(
-                                        translated_data, f, ensure_ascii=False, indent=4
-                                    )
-
+                                await checkpoint_callback(dict(translated_data))
                                 last_save_size = current_dict_size
                                 logger.info(
                                     f"중간 사전 저장 완료: {current_dict_size}개 항목"
@@ -766,34 +651,92 @@ async def translate_json_file(
             finally:
                 queue.task_done()
 
-    # Worker 시작
+    # 생산자와 Worker 시작
+    producer_task = asyncio.create_task(producer())
     workers = []
     for i in range(max_workers):
         task = asyncio.create_task(worker(i))
         workers.append(task)
 
     # 모든 작업이 완료될 때까지 대기
-    await queue.join()
+    await asyncio.gather(producer_task, *workers, return_exceptions=True)
+
+    return translated_data, error_list
 
-    # Worker 태스크 취소
-    for task in workers:
-        task.cancel()
 
-    # 완료된 태스크 처리
-    await asyncio.gather(*workers, return_exceptions=True)
+async def translate_json_file(
+    input_path: str,
+    output_path: str,
+    ko_data: dict = {},
+    custom_dictionary_dict: Dict = {},
+    llm=None,
+    max_workers: int = 5,
+    progress_callback=None,
+    external_context=None,
+    delay_manager: DelayManager = None,
+    use_random_order: bool = False,
+    force_keep_line_break: bool = False,
+):
+    """
+    JSON 파일을 비동기적으로 번역합니다.
+
+    translate_mapping을 감싸 파일을 읽고 결과를 파일로 저장합니다.
+
+    Parameters:
+        input_path: 번역할 JSON 파일 경로
+        output_path: 번역 결과를 저장할 경로
+        custom_dictionary_dict: 사용자 정의 사전
+        llm: 번역에 사용할 언어 모델 인스턴스 (필수)
+        max_workers: 동시 작업자 수
+        progress_callback: 진행 상황 콜백 함수
+        external_context: 외부에서 제공하는 TranslationContext 객체
+        delay_manager: API 요청 사이 딜레이를 관리하는 객체
+    """
+    # llm이 제공되지 않은 경우 오류 발생
+    if llm is None:
+        raise ValueError(
+            "llm은 필수 인자입니다. 번역을 위해 언어 모델을 제공해야 합니다."
+        )
+
+    # 입력 JSON 파일 로드 (이벤트 루프를 막지 않도록 입출력 스레드에서 읽음)
+    data = json.loads(await read_text(input_path))
+
+    # 중간 결과는 백그라운드에서 저장하고, 저장이 밀리면 최신 내용만 기록
+    write_buffer = WriteBehindBuffer()
+
+    async def save_checkpoint(partial_data):
+        # 중간 결과 파일 저장
+        await write_buffer.submit(
+            output_path,
+            lambda: json.dumps(partial_data, ensure_ascii=False, indent=4),
+        )
+
+    translated_data, error_list = await translate_mapping(
+        data,
+        input_path,
+        ko_data=ko_data,
+        custom_dictionary_dict=custom_dictionary_dict,
+        llm=llm,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+        external_context=external_context,
+        delay_manager=delay_manager,
+        use_random_order=use_random_order,
+        force_keep_line_break=force_keep_line_break,
+        checkpoint_callback=save_checkpoint,
+    )
+    await write_buffer.flush()
 
     # 번역된 데이터 저장
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(translated_data, f, ensure_ascii=False, indent=4)
+        await write_json(output_path, translated_data)
         logger.info(f"번역 완료. 결과가 {output_path}에 저장되었습니다.")
     except Exception as save_error:
         logger.error(f"최종 결과 저장 중 오류 발생: {save_error}")
         # 대체 경로에 저장 시도
         try:
             backup_path = f"{output_path}.backup.json"
-            with open(backup_path, "w", encoding="utf-8") as f:
-                json.dump(translated_data, f, ensure_ascii=False, indent=4)
+            await write_json(backup_path, translated_data)
             logger.info(f"백업 결과가 {backup_path}에 저장되었습니다.")
         except Exception as backup_save_error:
             logger.error(f"백업 저장 중 오류 발생: {backup_save_error}")
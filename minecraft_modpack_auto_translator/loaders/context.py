@@ -1,13 +1,23 @@
 import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Union
+
+from ..config import (
+    DICTIONARY_MAX_CANDIDATES,
+    DICTIONARY_PROMPT_CANDIDATES,
+    DICTIONARY_SOURCE_WEIGHTS,
+)
 
 logger = logging.getLogger(__name__)
 
 # 전역 공유 상태
 _GLOBAL_DICTIONARY = {}
 _GLOBAL_DICTIONARY_LOWERCASE = {}
+# 사전 키별 후보 통계: {원본 키: {한국어 후보: [점수, 등장 횟수, 출처 집합, 최초 순서]}}
+_GLOBAL_CANDIDATE_STATS = {}
 _GLOBAL_LOCK = asyncio.Lock()
+# 공유 사전을 새로 만들 때마다 오르는 세대 (같은 세대에서는 키가 추가되기만 함)
+_GLOBAL_GENERATION = 0
 
 
 class TranslationContext:
@@ -19,11 +29,26 @@ class TranslationContext:
         custom_dictionary_dict=None,
         registry=None,
         force_keep_line_break=False,
+        dictionary_store=None,
+        max_candidates=DICTIONARY_MAX_CANDIDATES,
+        prompt_candidates=DICTIONARY_PROMPT_CANDIDATES,
+        preprocess_pool=None,
+        dictionary_sources=None,
     ):
         self.translation_graph = translation_graph
         self.custom_dictionary_dict = custom_dictionary_dict or {}
         self.registry = registry
         self.force_keep_line_break = force_keep_line_break
+        # 사전 변경 사항을 기록할 영구 저장소 (DictionaryStore, 선택)
+        self.dictionary_store = dictionary_store
+        # 키별로 보관할 후보 수와 프롬프트에 포함할 후보 수
+        self.max_candidates = max(1, int(max_candidates))
+        self.prompt_candidates = max(1, int(prompt_candidates))
+        # analyze/retrieve 단계를 실행할 전처리 풀 (PreprocessPool, 없으면 코루틴에서 직접 실행)
+        self.preprocess_pool = preprocess_pool
+        # 초기 사전 항목의 통계: {소문자 영어: {한국어 후보: [점수, 등장 횟수, 출처 집합]}}
+        # (기록이 없는 후보는 "seed" 출처로 한 번 등장한 것으로 봄)
+        self.dictionary_sources = dictionary_sources or {}
         # 번역 컨텍스트가 생성될 때 공유 사전 초기화
         self.initialize_dictionaries()
 
@@ -33,7 +58,8 @@ class TranslationContext:
 
     def initialize_dictionaries(self) -> None:
         """공유 사전을 초기화합니다."""
-        global _GLOBAL_DICTIONARY, _GLOBAL_DICTIONARY_LOWERCASE
+        global _GLOBAL_DICTIONARY, _GLOBAL_DICTIONARY_LOWERCASE, _GLOBAL_CANDIDATE_STATS
+        global _GLOBAL_GENERATION
         _GLOBAL_LOCK = asyncio.Lock()
         # 전역 사전이 비어있고 커스텀 사전이 있으면 초기화
         if not _GLOBAL_DICTIONARY and self.custom_dictionary_dict:
@@ -41,17 +67,66 @@ class TranslationContext:
             _GLOBAL_DICTIONARY_LOWERCASE = {
                 k.lower(): k for k in self.custom_dictionary_dict.keys()
             }
-
-    async def async_add_to_dictionary(self, en_value: str, ko_value: str) -> bool:
+            _GLOBAL_CANDIDATE_STATS = {}
+            _GLOBAL_GENERATION += 1
+            # 후보가 여러 개인 항목은 처음부터 순위를 매겨 상위 후보만 남김
+            for key, value in _GLOBAL_DICTIONARY.items():
+                if isinstance(value, list):
+                    self._candidate_stats(key)
+                    _GLOBAL_DICTIONARY[key] = self._rank_candidates(key)
+
+    async def async_add_to_dictionary(
+        self, en_value: str, ko_value: str, source: str = "llm"
+    ) -> bool:
         """사전에 새 항목을 비동기적으로 추가합니다."""
         async with _GLOBAL_LOCK:
-            return self._add_to_dictionary_unsafe(en_value, ko_value)
+            return self._add_to_dictionary_unsafe(en_value, ko_value, source)
 
-    def add_to_dictionary(self, en_value: str, ko_value: str) -> bool:
+    def add_to_dictionary(
+        self, en_value: str, ko_value: str, source: str = "llm"
+    ) -> bool:
         """사전에 새 항목을 추가합니다."""
-        return self._add_to_dictionary_unsafe(en_value, ko_value)
-
-    def _add_to_dictionary_unsafe(self, en_value: str, ko_value: str) -> bool:
+        return self._add_to_dictionary_unsafe(en_value, ko_value, source)
+
+    def _candidate_stats(self, target_key: str) -> Dict[str, list]:
+        """키의 후보 통계를 반환합니다. 없으면 현재 사전 값으로 생성합니다."""
+        stats = _GLOBAL_CANDIDATE_STATS.get(target_key)
+        if stats is None:
+            current = _GLOBAL_DICTIONARY.get(target_key)
+            current = current if isinstance(current, list) else [current]
+            seeded = self.dictionary_sources.get(target_key.lower(), {})
+            seed_weight = DICTIONARY_SOURCE_WEIGHTS.get("seed", 1)
+            stats = {}
+            for candidate in current:
+                if isinstance(candidate, str) and candidate not in stats:
+                    score, count, sources = seeded.get(
+                        candidate, (seed_weight, 1, {"seed"})
+                    )
+                    stats[candidate] = [score, count, set(sources), len(stats)]
+            _GLOBAL_CANDIDATE_STATS[target_key] = stats
+        return stats
+
+    def _rank_candidates(self, target_key: str) -> Union[str, List[str]]:
+        """
+        상위 후보만 남긴 사전 값을 반환합니다.
+
+        가중치가 가장 높은 출처 순으로 정렬하므로 커스텀 사전 항목은 LLM이 더 자주
+        제안한 후보보다 앞에 옵니다. 출처가 같으면 점수, 먼저 나온 순서로 정렬합니다.
+        """
+        stats = _GLOBAL_CANDIDATE_STATS[target_key]
+
+        def rank(candidate):
+            score, _, sources, order = stats[candidate]
+            best = max(DICTIONARY_SOURCE_WEIGHTS.get(s, 1) for s in sources)
+            return -best, -score, order
+
+        ranked = sorted(stats, key=rank)
+        ranked = ranked[: self.max_candidates]
+        return ranked[0] if len(ranked) == 1 else ranked
+
+    def _add_to_dictionary_unsafe(
+        self, en_value: str, ko_value: str, source: str = "llm"
+    ) -> bool:
         """락 없이 사전에 항목을 추가합니다. (내부 함수)"""
         global _GLOBAL_DICTIONARY, _GLOBAL_DICTIONARY_LOWERCASE
 
@@ -65,39 +140,75 @@ class TranslationContext:
                     else:
                         flattened_ko_values.append(item)
                 ko_value = flattened_ko_values
+            values = ko_value if isinstance(ko_value, list) else [ko_value]
 
             if en_value.lower() in _GLOBAL_DICTIONARY_LOWERCASE:
                 target_key = _GLOBAL_DICTIONARY_LOWERCASE[en_value.lower()]
-                target = _GLOBAL_DICTIONARY[target_key]
-
-                if isinstance(target, list):
-                    if isinstance(ko_value, list):
-                        for val in ko_value:
-                            if val not in target:
-                                _GLOBAL_DICTIONARY[target_key].append(val)
-                    else:
-                        if ko_value not in target:
-                            _GLOBAL_DICTIONARY[target_key].append(ko_value)
-                elif isinstance(target, str):
-                    if isinstance(ko_value, list):
-                        _GLOBAL_DICTIONARY[target_key] = [target] + ko_value
-                    else:
-                        if target != ko_value:
-                            _GLOBAL_DICTIONARY[target_key] = [target, ko_value]
             else:
-                _GLOBAL_DICTIONARY[en_value] = ko_value
+                target_key = en_value
+                _GLOBAL_DICTIONARY[target_key] = []
                 _GLOBAL_DICTIONARY_LOWERCASE[en_value.lower()] = en_value
+                _GLOBAL_CANDIDATE_STATS[target_key] = {}
+
+            # 후보별 등장 횟수와 출처를 누적하고 상위 후보만 사전에 유지
+            stats = self._candidate_stats(target_key)
+            weight = DICTIONARY_SOURCE_WEIGHTS.get(source, 1)
+            for val in values:
+                if val in stats:
+                    stats[val][0] += weight
+                    stats[val][1] += 1
+                    stats[val][2].add(source)
+                else:
+                    stats[val] = [weight, 1, {source}, len(stats)]
+            _GLOBAL_DICTIONARY[target_key] = self._rank_candidates(target_key)
+
+            if self.dictionary_store is not None:
+                self.dictionary_store.record(en_value, ko_value, source)
 
             return True
         except Exception as e:
             logger.error(f"사전 추가 중 오류 발생: {e}")
             return False
 
+    def get_candidate_stats(self, en_value: str) -> Dict[str, Dict[str, Any]]:
+        """
+        영어 용어의 후보별 점수, 등장 횟수, 출처를 반환합니다.
+
+        Args:
+            en_value: 영어 용어 (대소문자 무시)
+
+        Returns:
+            {한국어 후보: {"score", "count", "sources"}}
+        """
+        target_key = _GLOBAL_DICTIONARY_LOWERCASE.get(en_value.lower())
+        if target_key is None:
+            return {}
+        stats = self._candidate_stats(target_key)
+        return {
+            candidate: {
+                "score": score,
+                "count": count,
+                "sources": sorted(sources),
+            }
+            for candidate, (score, count, sources, _) in stats.items()
+        }
+
+    def format_dictionary_value(self, value: Union[str, List[str]]) -> str:
+        """프롬프트에 넣을 수 있도록 상위 후보만 문자열로 변환합니다."""
+        if isinstance(value, list):
+            return ", ".join(str(v) for v in value[: self.prompt_candidates])
+        return str(value)
+
     def get_dictionary(self) -> Dict[str, Any]:
         """현재 사전을 반환합니다."""
         global _GLOBAL_DICTIONARY
         return _GLOBAL_DICTIONARY
 
+    @property
+    def dictionary_generation(self) -> int:
+        """공유 사전의 세대 (사전 키 스냅샷을 다시 만들지 판단하는 데 사용)"""
+        return _GLOBAL_GENERATION
+
     @property
     def translation_dictionary(self) -> Dict[str, Any]:
         """공유 사전에 접근합니다."""
@@ -4,8 +4,13 @@
 모든 파서의 기본 인터페이스를 정의합니다.
 """
 
+import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from .spans import UnsupportedEdit, ValueSpans, splice
+
+logger = logging.getLogger(__name__)
 
 
 class BaseParser(ABC):
@@ -41,6 +46,65 @@ class BaseParser(ABC):
         """
         pass
 
+    @classmethod
+    def load_with_spans(
+        cls, content: str
+    ) -> Tuple[Dict[str, Any], Optional[ValueSpans]]:
+        """
+        파일 내용을 로드하고, 문자열 값의 위치를 함께 기록합니다.
+
+        기본 구현은 위치를 기록하지 않으며, save_preserving()은 save()와 같게 동작합니다.
+
+        Args:
+            content (str): 파일 내용
+
+        Returns:
+            Tuple[Dict[str, Any], Optional[ValueSpans]]: 파싱된 데이터와 값 위치
+        """
+        return cls.load(content), None
+
+    @classmethod
+    def save_preserving(
+        cls,
+        data: Dict[str, Any],
+        original: Dict[str, Any],
+        content: str,
+        spans: Optional[ValueSpans],
+    ) -> str:
+        """
+        원본 서식(들여쓰기, 주석, 키 순서)을 유지하며 바뀐 값만 원본에 바꿔 넣습니다.
+
+        data에 없는 최상위 키는 원본에서 지우며, 구조가 바뀌어 바꿔 넣을 수 없으면
+        save()로 전체를 다시 직렬화합니다.
+
+        Args:
+            data (Dict[str, Any]): 저장할 데이터
+            original (Dict[str, Any]): content를 파싱한 데이터
+            content (str): 원본 파일 내용
+            spans (Optional[ValueSpans]): load_with_spans()가 기록한 값 위치
+
+        Returns:
+            str: 변환된 파일 내용
+        """
+        if spans is not None and isinstance(original, dict) and isinstance(data, dict):
+            try:
+                return splice(
+                    content, original, data, spans, cls.decode_span, cls.encode_span
+                )
+            except UnsupportedEdit as e:
+                logger.debug(f"원본 서식 유지 저장 불가, 전체 저장: {e}")
+        return cls.save(data)
+
+    @classmethod
+    def decode_span(cls, text: str) -> Any:
+        """기록된 위치의 원본 문자열을 값으로 변환합니다. (save_preserving 확인용)"""
+        raise NotImplementedError
+
+    @classmethod
+    def encode_span(cls, value: str) -> str:
+        """값을 원본에 바꿔 넣을 문자열로 변환합니다."""
+        raise NotImplementedError
+
     @staticmethod
     def get_parser_by_extension(extension: str) -> Union[Type["BaseParser"], None]:
         """
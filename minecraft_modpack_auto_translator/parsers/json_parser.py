@@ -7,9 +7,10 @@ JSON 형식 파일을 처리하는 파서 클래스입니다.
 import json
 import logging
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from .base_parser import BaseParser
+from .spans import ValueSpans, scan_json
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +18,21 @@ logger = logging.getLogger(__name__)
 class JSONParser(BaseParser):
     """JSON 형식 파일 파서"""
 
-    # JSON 파일에서 주석 제거하는 정규식 패턴
-    # // 형식의 한 줄 주석을 제거합니다
-    COMMENT_PATTERN = re.compile(r"^\s*//.*$|//.*$", re.MULTILINE)
+    # 주석과 끝 쉼표를 한 번에 제거하는 정규식 패턴
+    # 문자열(그룹 1)은 그대로 두고, // 및 /* */ 주석은 지우며,
+    # 닫는 괄호 앞의 쉼표는 사이의 공백, 주석과 함께 지우고 괄호(그룹 2)만 남깁니다
+    LENIENT_PATTERN = re.compile(
+        r'("[^"\\]*(?:\\.[^"\\]*)*")'
+        r"|//[^\n]*|/\*.*?\*/"
+        r"|,(?:\s|//[^\n]*|/\*.*?\*/)*([\]}])",
+        re.DOTALL,
+    )
 
     @classmethod
     def load(cls, content: str) -> Dict[str, Any]:
         """
         JSON 문자열을 파싱하여 Python 딕셔너리로 반환합니다.
-        주석이 포함된 JSON도 처리할 수 있습니다.
+        주석, 끝 쉼표, 문자열 안의 탭이 포함된 JSON도 처리할 수 있습니다.
 
         Args:
             content (str): JSON 문자열
@@ -34,20 +41,45 @@ class JSONParser(BaseParser):
             Dict[str, Any]: 파싱된 JSON 데이터
         """
         try:
-            content = re.sub(r"\t", " ", content)
-            return json.loads(content)
+            # 문자열 안의 탭 등 제어 문자 허용
+            return json.loads(content, strict=False)
         except json.JSONDecodeError:
-            # 주석이 있는 경우 주석 제거 후 다시 시도
-            try:
-                logger.info("JSON Comma 오류 수정 시도")
-                content = re.sub(r'("(?:\\?.)*?")|,\s*([]}])', r"\1\2", content)
-                return json.loads(content)
-            except json.JSONDecodeError:
-                try:
-                    cleaned_content = cls.COMMENT_PATTERN.sub("", content)
-                    return json.loads(cleaned_content)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"JSON 파싱 오류: {e}")
+            pass
+        # 주석과 끝 쉼표를 한 번에 제거한 뒤 다시 파싱
+        try:
+            return json.loads(cls.LENIENT_PATTERN.sub(r"\1\2", content), strict=False)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON 파싱 오류: {e}")
+
+    @classmethod
+    def load_with_spans(
+        cls, content: str
+    ) -> Tuple[Dict[str, Any], Optional[ValueSpans]]:
+        """
+        JSON 문자열을 파싱하고 문자열 값의 위치를 기록합니다.
+
+        Args:
+            content (str): JSON 문자열
+
+        Returns:
+            Tuple[Dict[str, Any], Optional[ValueSpans]]: 파싱된 데이터와 값 위치
+        """
+        data = cls.load(content)
+        try:
+            spans = scan_json(content)
+        except ValueError:
+            spans = None
+        return data, spans
+
+    @classmethod
+    def decode_span(cls, text: str) -> Any:
+        if "\\" not in text:
+            return text[1:-1]
+        return json.loads(text, strict=False)
+
+    @classmethod
+    def encode_span(cls, value: str) -> str:
+        return json.dumps(value, ensure_ascii=False)
 
     @classmethod
     def save(cls, data: Dict[str, Any]) -> str:
@@ -5,9 +5,10 @@ Lang 파서 클래스
 """
 
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from .base_parser import BaseParser
+from .spans import ValueSpans
 
 
 class LangParser(BaseParser):
@@ -42,6 +43,56 @@ class LangParser(BaseParser):
                 result[key.strip()] = parsed_value
         return result
 
+    @classmethod
+    def load_with_spans(
+        cls, content: str
+    ) -> Tuple[Dict[str, Any], Optional[ValueSpans]]:
+        """
+        .lang 형식 문자열을 파싱하고 값의 위치를 기록합니다. (load()와 같은 결과)
+
+        Args:
+            content (str): .lang 형식 문자열
+
+        Returns:
+            Tuple[Dict[str, Any], Optional[ValueSpans]]: 파싱된 데이터와 값 위치
+        """
+        result = {}
+        values = {}
+        members = []
+        offset = 0
+        for raw_line in content.splitlines(keepends=True):
+            line_start = offset
+            offset += len(raw_line)
+            line = raw_line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            key = key.strip()
+            value_start = (
+                line_start
+                + (len(raw_line) - len(raw_line.lstrip()))
+                + len(line)
+                - len(value)
+                + (len(value) - len(value.lstrip()))
+            )
+            value = value.strip()
+            result[key] = cls.decode_span(value)
+            values[(key,)] = (value_start, value_start + len(value))
+            members.append((key, line_start, offset, None))
+        return result, ValueSpans(values, members, line_based=True)
+
+    @classmethod
+    def decode_span(cls, text: str) -> Any:
+        # JSON 이스케이프 처리를 통해 특수 문자 처리 (load()와 같음)
+        try:
+            return json.loads(f'"{text}"')
+        except json.JSONDecodeError:
+            return text
+
+    @classmethod
+    def encode_span(cls, value: str) -> str:
+        return json.dumps(value, ensure_ascii=False)[1:-1]
+
     @classmethod
     def save(cls, data: Dict[str, Any]) -> str:
         """
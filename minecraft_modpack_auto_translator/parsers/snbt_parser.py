@@ -5,13 +5,14 @@ SNBT 파서 클래스
 """
 
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 import ftb_snbt_lib as slib
 from ftb_snbt_lib.tag import Bool, Compound, Double, Integer, Long, String
 from ftb_snbt_lib.tag import List as SNBTList
 
 from .base_parser import BaseParser
+from .spans import ValueSpans, scan_snbt
 
 
 class SNBTParser(BaseParser):
@@ -83,6 +84,36 @@ class SNBTParser(BaseParser):
         """
         return slib.loads(content)
 
+    @classmethod
+    def load_with_spans(
+        cls, content: str
+    ) -> Tuple[Dict[str, Any], Optional[ValueSpans]]:
+        """
+        .snbt 형식 문자열을 파싱하고 문자열 값의 위치를 기록합니다.
+
+        Args:
+            content (str): .snbt 형식 문자열
+
+        Returns:
+            Tuple[Dict[str, Any], Optional[ValueSpans]]: 파싱된 데이터와 값 위치
+        """
+        data = cls.load(content)
+        try:
+            spans = scan_snbt(content)
+        except ValueError:
+            spans = None
+        return data, spans
+
+    @classmethod
+    def decode_span(cls, text: str) -> Any:
+        # ftb_snbt_lib의 문자열 토큰 해석과 같음
+        return text[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+
+    @classmethod
+    def encode_span(cls, value: str) -> str:
+        # save()와 같이 & 이스케이프 후 SNBT 문자열로 변환 (끝 줄바꿈 제외)
+        return slib.dumps(String(cls.replace_ampersand(value)))[:-1]
+
     @staticmethod
     def convert_to_snbt_type(value: Any) -> Any:
         """
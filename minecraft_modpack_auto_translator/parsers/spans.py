@@ -0,0 +1,285 @@
+"""
+원본 서식을 유지하는 저장 도구
+
+파싱할 때 문자열 값의 위치(문자 단위 [시작, 끝))를 기록해 두고, 저장할 때는 번역된 값만
+원본 문자열의 해당 위치에 바꿔 넣습니다. 들여쓰기, 주석, 키 순서가 그대로 남고,
+바뀐 값의 수와 파일 크기에 비례하는 시간만 듭니다.
+
+값 위치는 경로(키 또는 목록 인덱스의 튜플)로 찾습니다. 구조가 달라 바꿔 넣을 수 없는
+경우에는 UnsupportedEdit을 발생시키고, 호출하는 쪽에서 전체 직렬화로 대신합니다.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Span = Tuple[int, int]
+
+# 토큰 앞의 공백은 함께 건너뜀. 그룹: 1 주석, 2 문자열, 3 구분 기호, 4 그 외 값
+# JSON(주석, 끝 쉼표 허용)
+_JSON_TOKEN = re.compile(
+    r"\s*(?:(//[^\n]*|/\*.*?\*/|#[^\n]*)"
+    r'|("[^"\\]*(?:\\.[^"\\]*)*")'
+    r"|([{}\[\],:])"
+    r'|([^\s{}\[\],:"/#]+))',
+    re.DOTALL,
+)
+
+# SNBT(FTB, 쉼표 또는 줄바꿈으로 구분)
+_SNBT_TOKEN = re.compile(
+    r"\s*(?:(#[^\n]*)"
+    r'|("[^"\\]*(?:\\.[^"\\]*)*")'
+    r"|([{}\[\],:;])"
+    r'|([^\s{}\[\],:;"#]+))'
+)
+
+_COMMENT, _STRING, _PUNCT = 1, 2, 3
+
+
+class UnsupportedEdit(Exception):
+    """원본 문자열에 바꿔 넣을 수 없는 변경"""
+
+
+class ValueSpans:
+    """
+    파싱한 문자열의 값 위치 정보
+
+    Attributes:
+        values: 경로 -> 문자열 값의 위치 (따옴표 포함 여부는 형식마다 다름)
+        members: 최상위 항목 (키, 시작, 값 끝, 뒤따르는 쉼표 위치) 목록.
+            None이면 최상위 항목 삭제를 지원하지 않음
+        line_based: 최상위 항목이 한 줄씩이어서 [시작, 끝)만 지우면 되는지 여부
+    """
+
+    __slots__ = ("values", "members", "line_based")
+
+    def __init__(
+        self,
+        values: Dict[tuple, Span],
+        members: Optional[List[tuple]] = None,
+        line_based: bool = False,
+    ):
+        self.values = values
+        self.members = members
+        self.line_based = line_based
+
+
+def _decode_json_key(token: str) -> str:
+    if "\\" not in token:
+        return token[1:-1]
+    return json.loads(token, strict=False)
+
+
+def _decode_snbt_key(token: str) -> str:
+    return token[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+
+
+def _scan_tokens(content: str, pattern, decode_key) -> ValueSpans:
+    """
+    토큰 단위로 한 번 훑으며 문자열 값의 경로와 위치, 최상위 항목 위치를 기록합니다.
+
+    컨테이너 프레임: [종류, 경로, 다음 키 또는 인덱스, 값을 기다리는지 여부]
+    """
+    values = {}
+    members = []
+    stack = []
+    member = None  # 현재 최상위 항목 [키, 시작, 값 끝, 쉼표 위치]
+
+    def finish_value(end):
+        nonlocal member
+        if not stack:
+            return
+        frame = stack[-1]
+        if frame[0] == "arr":
+            frame[2] += 1
+        else:
+            frame[3] = False
+            if len(stack) == 1 and member is not None:
+                member[2] = end
+
+    for match in pattern.finditer(content):
+        kind = match.lastindex
+        if kind == _COMMENT:
+            continue
+        token = match.group(kind)
+        start, end = match.span(kind)
+        frame = stack[-1] if stack else None
+
+        if kind == _PUNCT:
+            if token == "{" or token == "[":
+                path = frame[1] + (frame[2],) if frame is not None else ()
+                if token == "{":
+                    stack.append(["obj", path, None, False])
+                else:
+                    stack.append(["arr", path, 0, False])
+            elif token == "}" or token == "]":
+                if not stack:
+                    raise ValueError("닫는 괄호가 맞지 않습니다.")
+                stack.pop()
+                finish_value(end)
+            elif token == ":":
+                if frame is None or frame[0] != "obj":
+                    raise ValueError("잘못된 위치의 ':'입니다.")
+                frame[3] = True
+            elif token == ",":
+                if len(stack) == 1 and frame[0] == "obj" and member is not None:
+                    member[3] = start
+            continue
+
+        if frame is None:
+            continue
+        if frame[0] == "obj" and not frame[3]:
+            # 키
+            key = decode_key(token) if kind == _STRING else token
+            frame[2] = key
+            if len(stack) == 1:
+                member = [key, start, end, None]
+                members.append(member)
+            continue
+        if kind == _STRING:
+            values[frame[1] + (frame[2],)] = (start, end)
+        finish_value(end)
+
+    if stack:
+        raise ValueError("닫히지 않은 괄호가 있습니다.")
+    return ValueSpans(values, [tuple(m) for m in members])
+
+
+def scan_json(content: str) -> ValueSpans:
+    """JSON(주석, 끝 쉼표 허용) 문자열 값의 위치를 기록합니다."""
+    return _scan_tokens(content, _JSON_TOKEN, _decode_json_key)
+
+
+def scan_snbt(content: str) -> ValueSpans:
+    """SNBT 문자열 값의 위치를 기록합니다. (최상위 항목 삭제는 지원하지 않음)"""
+    spans = _scan_tokens(content, _SNBT_TOKEN, _decode_snbt_key)
+    spans.members = None
+    return spans
+
+
+def _collect_edits(
+    original: Any,
+    new: Any,
+    path: tuple,
+    spans: ValueSpans,
+    content: str,
+    decode: Callable[[str], Any],
+    encode: Callable[[str], str],
+    edits: List[Tuple[int, int, str]],
+) -> None:
+    if new is original or new == original:
+        return
+    if isinstance(new, str) and isinstance(original, str):
+        span = spans.values.get(path)
+        if span is None:
+            raise UnsupportedEdit(f"값 위치가 없습니다: {path}")
+        # 기록한 위치가 실제로 원본 값인지 확인 (파서와 다르게 해석한 경우 대비)
+        try:
+            current = decode(content[span[0] : span[1]])
+        except Exception:
+            current = None
+        if current != original:
+            raise UnsupportedEdit(f"값 위치가 원본과 다릅니다: {path}")
+        edits.append((span[0], span[1], encode(new)))
+        return
+    if isinstance(new, dict) and isinstance(original, dict):
+        if len(new) != len(original):
+            raise UnsupportedEdit(f"항목 수가 다릅니다: {path}")
+        for key, value in new.items():
+            if key not in original:
+                raise UnsupportedEdit(f"새 키가 있습니다: {path + (key,)}")
+            _collect_edits(
+                original[key],
+                value,
+                path + (key,),
+                spans,
+                content,
+                decode,
+                encode,
+                edits,
+            )
+        return
+    if isinstance(new, list) and isinstance(original, list):
+        if len(new) != len(original):
+            raise UnsupportedEdit(f"목록 길이가 다릅니다: {path}")
+        for index, (before, after) in enumerate(zip(original, new)):
+            _collect_edits(
+                before, after, path + (index,), spans, content, decode, encode, edits
+            )
+        return
+    raise UnsupportedEdit(f"바꿔 넣을 수 없는 값입니다: {path}")
+
+
+def _member_deletions(spans: ValueSpans, removed: set) -> List[Tuple[int, int, str]]:
+    """최상위 항목을 지우는 편집 목록을 만듭니다."""
+    members = spans.members
+    if spans.line_based:
+        return [(start, end, "") for key, start, end, _ in members if key in removed]
+
+    kept = [i for i, m in enumerate(members) if m[0] not in removed]
+    if not kept:
+        return [(members[0][1], members[-1][2], "")]
+    last_kept = kept[-1]
+    deletions = []
+    for i, (key, start, _, _) in enumerate(members[:last_kept]):
+        if key in removed:
+            # 다음 항목의 키 앞까지 지워 쉼표와 들여쓰기를 함께 제거
+            deletions.append((start, members[i + 1][1], ""))
+    if last_kept < len(members) - 1:
+        # 뒤쪽 항목을 지우면 마지막으로 남는 항목의 쉼표부터 지움
+        comma = members[last_kept][3]
+        if comma is None:
+            raise UnsupportedEdit("쉼표 위치가 없습니다.")
+        deletions.append((comma, members[-1][2], ""))
+    return deletions
+
+
+def splice(
+    content: str,
+    original: Dict[str, Any],
+    data: Dict[str, Any],
+    spans: ValueSpans,
+    decode: Callable[[str], Any],
+    encode: Callable[[str], str],
+) -> str:
+    """
+    원본 문자열에서 바뀐 값만 바꿔 넣고, data에 없는 최상위 항목은 지웁니다.
+
+    Args:
+        content: 원본 문자열
+        original: content를 파싱한 데이터
+        data: 저장할 데이터 (original과 같은 구조)
+        spans: content의 값 위치
+        decode: 기록된 위치의 문자열을 값으로 바꾸는 함수 (확인용)
+        encode: 값을 원본 형식의 문자열로 바꾸는 함수
+
+    Returns:
+        새 문자열
+
+    Raises:
+        UnsupportedEdit: 바꿔 넣을 수 없는 변경이 있을 때
+    """
+    edits: List[Tuple[int, int, str]] = []
+    removed = {key for key in original if key not in data}
+    if removed:
+        if spans.members is None or len({m[0] for m in spans.members}) != len(
+            spans.members
+        ):
+            raise UnsupportedEdit("최상위 항목을 지울 수 없습니다.")
+        edits.extend(_member_deletions(spans, removed))
+        original = {k: v for k, v in original.items() if k not in removed}
+    _collect_edits(original, data, (), spans, content, decode, encode, edits)
+    if not edits:
+        return content
+
+    edits.sort()
+    parts = []
+    position = 0
+    for start, end, text in edits:
+        if start < position:
+            raise UnsupportedEdit("겹치는 편집이 있습니다.")
+        parts.append(content[position:start])
+        parts.append(text)
+        position = end
+    parts.append(content[position:])
+    return "".join(parts)
@@ -0,0 +1,477 @@
+"""
+번역 전처리 (특수 형식 추출, 사전 검색)
+
+정규식 추출과 BM25 사전 검색은 CPU를 사용하는 동기 작업입니다. 이 모듈의 함수는
+LLM 의존성 없이 동작하므로 스레드 풀이나 프로세스 풀에서 실행할 수 있습니다.
+PreprocessPool은 여러 코루틴의 요청을 묶어서 풀에 제출합니다.
+process 방식에서는 작업자마다 사전 키 스냅샷(토큰 색인)을 두고 추가된 키만 전달합니다.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import regex
+from rank_bm25 import BM25Okapi
+
+from .config import (
+    C_PLACEHOLDER_PATTERN,
+    DICTIONARY_BLACKLIST,
+    FORMAT_CODE_PATTERN,
+    HTML_TAG_PATTERN,
+    ITEM_PLACEHOLDER_PATTERN,
+    JSON_PLACEHOLDER_PATTERN,
+    MINECRAFT_ITEM_CODE_PATTERN,
+    PREPROCESS_BATCH_DELAY,
+    PREPROCESS_BATCH_SIZE,
+    PREPROCESS_MAX_WORKERS,
+    PREPROCESS_SNAPSHOT_REFRESH,
+    SQUARE_BRACKET_TAG_PATTERN,
+)
+
+logger = logging.getLogger(__name__)
+
+PREPROCESS_MODES = ("inline", "thread", "process")
+
+# 작업 중에는 입출력 스레드가 돌고 있으므로 fork 대신 forkserver로 작업자를 만듦
+# (forkserver가 없는 Windows는 기본값인 spawn 사용)
+_MP_CONTEXT = (
+    multiprocessing.get_context("forkserver")
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else None
+)
+
+
+# 특수 형식 (색상 코드, 플레이스홀더) 추출 및 보존
+def extract_special_formats(text):
+    format_codes = [i for i in re.findall(FORMAT_CODE_PATTERN, text) if i != ""]
+    c_placeholders = [i for i in re.findall(C_PLACEHOLDER_PATTERN, text) if i != ""]
+    json_placeholders = [
+        i for i in regex.findall(JSON_PLACEHOLDER_PATTERN, text) if i != ""
+    ]
+    item_placeholders = [
+        i for i in re.findall(ITEM_PLACEHOLDER_PATTERN, text) if i != ""
+    ]
+    html_tags_placeholders = [i for i in re.findall(HTML_TAG_PATTERN, text) if i != ""]
+    square_bracket_tags = [
+        i for i in re.findall(SQUARE_BRACKET_TAG_PATTERN, text) if i != ""
+    ]
+
+    # 마인크래프트 아이템 코드 패턴 (예: minecraft:grass)
+    minecraft_item_codes = [
+        i[0] for i in re.findall(MINECRAFT_ITEM_CODE_PATTERN, text) if i != ""
+    ]
+
+    # 모든 특수 형식을 [PLACEHOLDER_N] 형태로 대체
+    replaced_text = text
+    placeholder_map = {}
+    placeholder_count = 0
+
+    for placeholder in (
+        html_tags_placeholders
+        + item_placeholders
+        + json_placeholders
+        + format_codes
+        + c_placeholders
+        + minecraft_item_codes
+        + square_bracket_tags
+    ):
+        try:
+            if placeholder in replaced_text:
+                placeholder_count += 1
+                token = f"[P{placeholder_count}]"
+                replaced_text = replaced_text.replace(placeholder, token, 1)
+                placeholder_map[token] = placeholder
+        except Exception as e:
+            logger.error(f"특수 형식 추출 중 오류 발생: {placeholder}")
+            logger.error(f"오류 발생 원인: {e}")
+    return replaced_text, placeholder_map
+
+
+# 특수 형식 복원
+def restore_special_formats(text, placeholder_map):
+    restored_text = text
+
+    # 플레이스홀더 복원
+    for token, placeholder in placeholder_map.items():
+        restored_text = restored_text.replace(token, placeholder)
+
+    return restored_text
+
+
+def analyze(text: str, force_keep_line_break: bool = False) -> Tuple[str, dict]:
+    """
+    특수 형식을 플레이스홀더로 바꾸고, 필요하면 줄바꿈도 플레이스홀더로 바꿉니다.
+
+    Returns:
+        (대체된 텍스트, 플레이스홀더 맵)
+    """
+    replaced_text, placeholder_map = extract_special_formats(text)
+
+    if force_keep_line_break and "\n" in replaced_text:
+        logger.debug(f"줄바꿈 강제 유지: {replaced_text}")
+        num = 0
+        for i in re.findall(r"\n", replaced_text):
+            num += 1
+            newline_placeholder = f"[P_NEWLINE_{num}]"
+            replaced_text = re.sub(i, newline_placeholder, replaced_text, 1)
+            placeholder_map[newline_placeholder] = i
+
+    return replaced_text, placeholder_map
+
+
+def analyze_batch(items: Sequence[Tuple[str, bool]]) -> List[Tuple[str, dict]]:
+    """analyze()를 여러 항목에 적용합니다. (풀 제출 단위)"""
+    return [
+        analyze(text, force_keep_line_break) for text, force_keep_line_break in items
+    ]
+
+
+def _query_words(normalized_text: str) -> List[str]:
+    """사전 검색에 사용할 영어 단어 목록 (s, 's로 끝나는 단어는 원형도 추가)"""
+    filtered_english_words = [
+        i
+        for i in re.findall(r"\b[a-zA-Z]+\b", normalized_text)
+        if i not in DICTIONARY_BLACKLIST
+    ]
+    # s, 's로 끝나는 단어들의 원형도 추가
+    additional_words = []
+    for word in filtered_english_words:
+        # 정규식을 사용하여 's 또는 s로 끝나는 단어 처리
+        base_word = re.sub(r"'s$|s$", "", word)
+        if (
+            base_word != word
+            and base_word not in filtered_english_words
+            and len(base_word) > 3
+        ):
+            additional_words.append(base_word)
+
+    # 원형 단어들 추가
+    filtered_english_words.extend(additional_words)
+    # 너무 짧은 단어는 제외
+    return [word for word in filtered_english_words if len(word) > 3]
+
+
+def _rank_keys(finded: List[str], normalized_text: str, limit: int) -> List[str]:
+    """찾은 사전 키를 BM25 점수 순으로 정렬하여 상위 키를 반환합니다."""
+    # finded가 비어있는 경우 처리
+    if not finded:
+        return []
+
+    bm25 = BM25Okapi(
+        [doc.lower().split() for doc in finded],
+    )
+    doc_scores = bm25.get_scores(
+        [
+            re.sub(r"'s$|s$", "", word)
+            for word in re.sub(r"\[p[0-9]+\]", "", normalized_text).split(" ")
+        ]
+    )
+    sorted_docs = sorted(enumerate(doc_scores), key=lambda x: x[1], reverse=True)
+
+    # 점수가 0보다 큰 상위 항목 선택
+    top_keys = []
+    for i, score in sorted_docs[:limit]:
+        if score > 0 and finded[i] not in top_keys:
+            top_keys.append(finded[i])
+    return top_keys
+
+
+def find_dictionary_keys(
+    text: str, dict_keys: Sequence[str], limit: int = 5
+) -> List[str]:
+    """
+    텍스트와 관련된 사전 키를 BM25 점수 순으로 찾습니다.
+
+    Args:
+        text: 플레이스홀더가 대체된 원문
+        dict_keys: 사전 키 목록
+        limit: 반환할 최대 키 수
+
+    Returns:
+        점수가 0보다 큰 상위 사전 키 목록
+    """
+    normalized_text = text.lower()
+    finded = []
+    # 사전에서 영어 단어가 포함된 항목 찾기
+    for word in _query_words(normalized_text):
+        for dict_key in dict_keys:
+            if word in dict_key.lower().split():
+                if dict_key not in finded:
+                    finded.append(dict_key)
+    return _rank_keys(finded, normalized_text, limit)
+
+
+class DictionaryKeyIndex:
+    """
+    사전 키의 단어 -> 키 목록 색인
+
+    find_dictionary_keys()처럼 키를 모두 훑지 않고 단어마다 색인을 조회합니다.
+    키는 사전 순서대로 추가되므로 찾은 키의 순서도 같습니다.
+    """
+
+    def __init__(self, keys: Sequence[str] = ()):
+        self.size = 0
+        self._postings: Dict[str, List[str]] = {}
+        self.extend(keys)
+
+    def extend(self, keys: Sequence[str]) -> None:
+        """키를 색인에 추가합니다."""
+        for key in keys:
+            for token in set(key.lower().split()):
+                self._postings.setdefault(token, []).append(key)
+            self.size += 1
+
+    def find(self, text: str, limit: int = 5) -> List[str]:
+        """find_dictionary_keys()와 같은 결과를 색인으로 찾습니다."""
+        normalized_text = text.lower()
+        finded = []
+        seen = set()
+        for word in _query_words(normalized_text):
+            for dict_key in self._postings.get(word, ()):
+                if dict_key not in seen:
+                    seen.add(dict_key)
+                    finded.append(dict_key)
+        return _rank_keys(finded, normalized_text, limit)
+
+
+# process 작업자의 사전 키 스냅샷 (작업자 프로세스마다 하나)
+_WORKER_SNAPSHOT: Dict[str, Any] = {"generation": None, "base": 0, "index": None}
+
+
+def _init_retrieve_worker(generation: Any, keys: Sequence[str]) -> None:
+    """작업자 프로세스 시작 시 사전 키 스냅샷을 색인합니다."""
+    _WORKER_SNAPSHOT["generation"] = generation
+    _WORKER_SNAPSHOT["base"] = len(keys)
+    _WORKER_SNAPSHOT["index"] = DictionaryKeyIndex(keys)
+
+
+def retrieve_batch(
+    texts: Sequence[str], generation: Any, tail: Sequence[str]
+) -> List[List[str]]:
+    """
+    작업자의 스냅샷으로 사전 검색을 여러 항목에 적용합니다. (풀 제출 단위)
+
+    Args:
+        texts: 검색할 원문 목록
+        generation: 스냅샷을 만든 사전 세대
+        tail: 스냅샷 이후 사전에 추가된 키 (스냅샷 크기부터 현재까지)
+    """
+    if _WORKER_SNAPSHOT["generation"] != generation:
+        raise RuntimeError("사전 키 스냅샷의 세대가 다릅니다.")
+    index = _WORKER_SNAPSHOT["index"]
+    # 이 작업자가 아직 색인하지 않은 키만 추가
+    index.extend(tail[index.size - _WORKER_SNAPSHOT["base"] :])
+    return [index.find(text) for text in texts]
+
+
+class _Batcher:
+    """짧은 시간 동안 모인 요청을 한 번에 풀에 제출합니다."""
+
+    def __init__(
+        self,
+        executor: Executor,
+        batch_func: Callable[[list], list],
+        batch_size: int,
+        batch_delay: float,
+        batch_args: Optional[Callable[[], tuple]] = None,
+    ):
+        self.executor = executor
+        self.batch_func = batch_func
+        # 제출할 때 batch_func에 함께 넘길 인자를 만드는 함수 (선택)
+        self.batch_args = batch_args
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.batch_delay, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        loop = asyncio.get_running_loop()
+        args = self.batch_args() if self.batch_args is not None else ()
+        task = loop.run_in_executor(
+            self.executor, self.batch_func, [item for item, _ in batch], *args
+        )
+        task.add_done_callback(lambda done: self._resolve(batch, done))
+
+    @staticmethod
+    def _resolve(batch, done: asyncio.Future) -> None:
+        if done.cancelled():
+            for _, future in batch:
+                future.cancel()
+            return
+        error = done.exception()
+        results = None if error else done.result()
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if error:
+                future.set_exception(error)
+            else:
+                future.set_result(results[index])
+
+
+class PreprocessPool:
+    """
+    analyze/retrieve 단계를 이벤트 루프 밖에서 실행하는 풀
+
+    - inline: 기존처럼 코루틴 안에서 바로 실행
+    - thread: 스레드 풀에서 실행
+    - process: 특수 형식 추출과 사전 검색을 프로세스 풀에서 묶어서 실행.
+      사전 검색 작업자는 시작할 때 사전 키 스냅샷을 받아 색인하고, 요청 묶음마다
+      스냅샷 이후 추가된 키만 받습니다. 추가된 키가 PREPROCESS_SNAPSHOT_REFRESH개를
+      넘거나 사전 세대가 바뀌면 새 스냅샷으로 작업자를 다시 만듭니다.
+    """
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        max_workers: int = PREPROCESS_MAX_WORKERS,
+        batch_size: int = PREPROCESS_BATCH_SIZE,
+        batch_delay: float = PREPROCESS_BATCH_DELAY,
+        snapshot_refresh: int = PREPROCESS_SNAPSHOT_REFRESH,
+    ):
+        """
+        Args:
+            mode: 실행 방식 (inline, thread, process)
+            max_workers: 풀 작업자 수
+            batch_size: 한 번에 제출할 최대 요청 수
+            batch_delay: 요청을 모으는 최대 대기 시간 (초 단위)
+            snapshot_refresh: 스냅샷을 다시 만들 추가 키 수 (process 방식)
+        """
+        if mode not in PREPROCESS_MODES:
+            raise ValueError(
+                f"지원하지 않는 전처리 방식입니다: {mode} (가능한 값: {PREPROCESS_MODES})"
+            )
+        self.mode = mode
+        self.max_workers = max_workers
+        self.snapshot_refresh = max(1, snapshot_refresh)
+        self._thread_executor = None
+        self._process_executor = None
+        self._analyze_batcher = None
+        # process 방식 사전 검색 (스냅샷 세대, 스냅샷 크기, 최근 키 목록)
+        self._retrieve_executor = None
+        self._retrieve_batcher = None
+        self._snapshot_generation = None
+        self._snapshot_size = 0
+        self._latest_keys: Sequence[str] = ()
+
+        if mode == "inline":
+            return
+        self._thread_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mcpack-preprocess"
+        )
+        analyze_executor = self._thread_executor
+        if mode == "process":
+            self._process_executor = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=_MP_CONTEXT
+            )
+            analyze_executor = self._process_executor
+        self._analyze_batcher = _Batcher(
+            analyze_executor, analyze_batch, batch_size, batch_delay
+        )
+        if mode == "process":
+            self._retrieve_batcher = _Batcher(
+                None,
+                retrieve_batch,
+                batch_size,
+                batch_delay,
+                batch_args=self._retrieve_args,
+            )
+        logger.info(f"전처리 풀 생성: {mode} ({max_workers}개 작업자)")
+
+    async def analyze(
+        self, text: str, force_keep_line_break: bool = False
+    ) -> Tuple[str, Dict[str, str]]:
+        """특수 형식 추출을 풀에서 실행합니다."""
+        if self._analyze_batcher is None:
+            return analyze(text, force_keep_line_break)
+        return await self._analyze_batcher.submit((text, force_keep_line_break))
+
+    async def retrieve(
+        self, text: str, dict_keys: Sequence[str], generation: Any = None
+    ) -> List[str]:
+        """
+        사전 검색을 풀에서 실행합니다.
+
+        Args:
+            text: 플레이스홀더가 대체된 원문
+            dict_keys: 사전 키 목록 (같은 세대에서는 키가 뒤에 추가되기만 해야 함)
+            generation: 사전 세대 (사전을 새로 만들면 바뀌는 값)
+        """
+        if self._retrieve_batcher is not None:
+            self._update_snapshot(dict_keys, generation)
+            return await self._retrieve_batcher.submit(text)
+        if self._thread_executor is None:
+            return find_dictionary_keys(text, dict_keys)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._thread_executor, find_dictionary_keys, text, dict_keys
+        )
+
+    def _update_snapshot(self, dict_keys: Sequence[str], generation: Any) -> None:
+        """필요하면 현재 사전 키로 작업자 스냅샷을 다시 만듭니다."""
+        if len(dict_keys) >= len(self._latest_keys):
+            self._latest_keys = dict_keys
+        if (
+            self._retrieve_executor is not None
+            and generation == self._snapshot_generation
+            and self._snapshot_size
+            <= len(self._latest_keys)
+            <= self._snapshot_size + self.snapshot_refresh
+        ):
+            return
+        if self._retrieve_executor is not None:
+            # 이미 제출한 묶음은 이전 작업자에서 끝까지 처리됨
+            self._retrieve_executor.shutdown(wait=False)
+        keys = list(dict_keys)
+        self._latest_keys = keys
+        self._snapshot_generation = generation
+        self._snapshot_size = len(keys)
+        self._retrieve_executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=_MP_CONTEXT,
+            initializer=_init_retrieve_worker,
+            initargs=(generation, keys),
+        )
+        self._retrieve_batcher.executor = self._retrieve_executor
+        logger.debug(f"사전 검색 스냅샷 생성: {len(keys)}개 키")
+
+    def _retrieve_args(self) -> tuple:
+        """묶음과 함께 보낼 (세대, 스냅샷 이후 추가된 키)"""
+        return (
+            self._snapshot_generation,
+            list(self._latest_keys[self._snapshot_size :]),
+        )
+
+    def close(self) -> None:
+        """풀을 종료합니다."""
+        if self._thread_executor is not None:
+            self._thread_executor.shutdown(wait=False, cancel_futures=True)
+        # 프로세스 풀은 작업자가 종료될 때까지 기다려 종료 시점의 파이프 오류를 막음
+        for executor in (self._process_executor, self._retrieve_executor):
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        self._thread_executor = None
+        self._process_executor = None
+        self._retrieve_executor = None
+        self._analyze_batcher = None
+        self._retrieve_batcher = None
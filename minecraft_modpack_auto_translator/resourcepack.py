@@ -3,10 +3,13 @@ import logging
 import os
 import shutil
 import tempfile
+import time
 import zipfile
 from glob import escape as glob_escape
 from glob import glob
 
+from .zip_utils import ParallelZipWriter
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -94,13 +97,11 @@ def repack_mods(mods_folder):
                         temp_zip_path  # finally에서 참조할 수 있도록 할당
                     )
                     os.close(temp_fd)  # 핸들 닫기
-                    temp_zip_file = zipfile.ZipFile(
-                        temp_zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=6
-                    )
+                    temp_zip_file = ParallelZipWriter(temp_zip_path)
                     logger.debug(f"Created temporary zip file: {temp_zip_path}")
                     # added_arcnames = set() # Output 우선 로직에서 사용, 현재는 불필요
 
-                    added = []
+                    added = set()
                     logger.info(
                         f"Packing/overwriting contents from output: {output_folder}"
                     )
@@ -119,23 +120,30 @@ def repack_mods(mods_folder):
                             arcname = os.path.relpath(file_path, output_folder)
                             temp_zip_file.write(file_path, arcname)
                             logger.debug(f"Added/overwritten from output: {arcname}")
-                            added.append(arcname)
+                            added.add(arcname.replace("\\", "/"))
 
                     # 1. input JAR 내용 압축 (존재하는 경우)
                     if input_jar_exists:
                         logger.info(
                             f"Packing contents from input JAR: {input_jar_path}"
                         )
+                        # 바뀌지 않은 항목은 압축을 풀지 않고 압축된 바이트를 그대로 복사
+                        raw_copied = 0
                         with zipfile.ZipFile(input_jar_path, "r") as src_jar:
                             for member_info in src_jar.infolist():
-                                # 특정 임시 파일 등 건너뛰기
+                                # output에서 덮어쓴 항목은 건너뛰기
                                 if member_info.filename in added:
                                     continue
-                                member_data = src_jar.read(member_info.filename)
-                                temp_zip_file.writestr(member_info, member_data)
+                                raw_copied += temp_zip_file.copy_raw_entry(
+                                    src_jar, member_info
+                                )
                                 logger.debug(
                                     f"Added from input JAR: {member_info.filename}"
                                 )
+                        logger.info(
+                            f"Copied {raw_copied} entries without recompression "
+                            f"({len(added)} entries from output)"
+                        )
 
                     temp_zip_file.close()  # 파일 쓰기 완료 후 닫기
                     temp_zip_file = None  # 정상 종료 시 None으로 설정하여 finally에서 중복 close 방지
@@ -192,52 +200,62 @@ def repack_mods(mods_folder):
     return created_jars
 
 
-def create_resourcepack(
-    output_dir,
-    folder_list,
-    pack_name="Korean-Translation",
-    source_lang="en_us",
-):
+def _is_skipped_file(name):
+    """임시 파일이나 변환 중간 파일인지 확인합니다."""
+    return (
+        name.endswith(".tmp") or ".zip_extracted" in name or name.endswith(".converted")
+    )
+
+
+def _iter_files(base):
+    """glob("**/*")처럼 숨김 파일/폴더를 제외하고 base 아래 파일의 (경로, 상대 경로)를 반환합니다."""
+    for root, dirs, files in os.walk(base):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for file in sorted(files):
+            if file.startswith("."):
+                continue
+            path = os.path.join(root, file)
+            yield path, os.path.relpath(path, base).replace("\\", "/")
+
+
+def _rename_lang_code(arcname, source_lang):
+    return arcname.replace(source_lang, "ko_kr").replace(
+        source_lang.split("_")[0] + "_" + source_lang.split("_")[1].upper(),
+        "ko_KR",
+    )
+
+
+def collect_resourcepack_entries(folder_list, pack_name, source_lang="en_us"):
     """
-    번역된 내용으로 마인크래프트 리소스팩을 생성합니다.
+    리소스팩에 들어갈 항목을 모읍니다. 파일을 복사하지 않고 경로만 모읍니다.
+
+    같은 이름의 항목은 나중에 나온 것이 앞의 것을 덮어씁니다.
 
     Args:
-        output_dir: 출력 디렉토리
-        folder_list: 리소스팩에 포함할 폴더 및 파일 목록
+        folder_list: 리소스팩에 포함할 폴더 목록
         pack_name: 리소스팩 이름
+        source_lang: 원본 언어 코드 (파일 이름의 언어 코드를 ko_kr로 변경)
 
     Returns:
-        생성된 리소스팩 ZIP 파일 경로
+        {압축 파일 내 이름: 원본 파일 경로 또는 내용(bytes)}
     """
-    # 리소스팩 디렉토리 생성 (임시 디렉토리)
-    resourcepack_dir = os.path.join(output_dir, f"{pack_name}")
-
-    # 기존 리소스팩 폴더가 있으면 삭제
-    if os.path.exists(resourcepack_dir):
-        shutil.rmtree(resourcepack_dir)
-
-    # 리소스팩 기본 디렉토리 생성
-    os.makedirs(resourcepack_dir, exist_ok=True)
-
-    # pack.mcmeta 파일 생성
     pack_mcmeta = {
         "pack": {
             "pack_format": 15,  # Minecraft 1.20+ 버전용
             "description": f"{pack_name} - 한국어 번역 리소스팩",
         }
     }
+    entries = {
+        "pack.mcmeta": json.dumps(pack_mcmeta, ensure_ascii=False, indent=4).encode(
+            "utf-8"
+        )
+    }
 
-    with open(
-        os.path.join(resourcepack_dir, "pack.mcmeta"), "w", encoding="utf-8"
-    ) as f:
-        json.dump(pack_mcmeta, f, ensure_ascii=False, indent=4)
-
-    # 아이콘 파일 복사 (있는 경우)
+    # 아이콘 파일 (있는 경우)
     icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pack.png")
     if os.path.exists(icon_path):
-        shutil.copy(icon_path, os.path.join(resourcepack_dir, "pack.png"))
+        entries["pack.png"] = icon_path
 
-    # 번역 파일 처리
     for folder in folder_list:
         try:
             if not os.path.exists(folder):
@@ -248,85 +266,95 @@ def create_resourcepack(
             normalized_folder = os.path.normpath(folder)
 
             if "mods" in normalized_folder:
-                extracted_glob_path = normalize_glob_path(
-                    os.path.join(normalized_folder, "*")
-                )
-                for path in glob(extracted_glob_path, recursive=True):
-                    if not os.path.exists(path):
-                        continue
-
-                    path_glob = normalize_glob_path(os.path.join(path, "**", "*"))
-                    for src_file in glob(path_glob, recursive=True):
-                        if os.path.isfile(src_file):
-                            rel_path = os.path.relpath(src_file, path)
-                            dst_file = os.path.join(resourcepack_dir, rel_path)
-
-                            # 대상 디렉토리 존재 확인 후 생성
-                            dst_dir = os.path.dirname(dst_file)
-                            if not os.path.exists(dst_dir):
-                                os.makedirs(dst_dir, exist_ok=True)
-
-                            shutil.copy2(src_file, dst_file)
+                # mods/extracted/<JAR 이름>/ 아래의 파일을 리소스팩 최상위 기준으로 추가
+                with os.scandir(normalized_folder) as it:
+                    jar_dirs = sorted(
+                        entry.path
+                        for entry in it
+                        if entry.is_dir() and not entry.name.startswith(".")
+                    )
+                for jar_dir in jar_dirs:
+                    for path, rel_path in _iter_files(jar_dir):
+                        entries[rel_path] = path
 
             elif (
                 "kubejs" in normalized_folder
                 or "config" in normalized_folder
                 or "patchouli_books" in normalized_folder
             ):
-                folder_glob_path = normalize_glob_path(
-                    os.path.join(normalized_folder, "**", "*.*")
-                )
-                for path in glob(folder_glob_path, recursive=True):
-                    if not os.path.exists(path):
-                        continue
-
-                    # 경로 정규화 및 상대 경로 계산
-                    normalized_path = os.path.normpath(path).replace("\\", "/")
-                    base_folder = os.path.normpath(normalized_folder).replace("\\", "/")
-                    relative_path = (
-                        normalized_path[len(base_folder) + 1 :]
-                        if normalized_path.startswith(base_folder)
-                        else normalized_path
-                    )
+                # "**/*.*" 패턴과 같이 경로에 확장자(점)가 있는 파일만 추가
+                for path, rel_path in _iter_files(normalized_folder):
+                    if "." in rel_path:
+                        entries[rel_path] = path
 
-                    to_copy_path = os.path.join(resourcepack_dir, relative_path)
-                    dst_dir = os.path.dirname(to_copy_path)
+        except Exception as e:
+            logger.error(f"리소스팩 생성 중 오류 발생: {e}")
 
-                    if not os.path.exists(dst_dir):
-                        os.makedirs(dst_dir, exist_ok=True)
+    return {
+        _rename_lang_code(arcname, source_lang): source
+        for arcname, source in entries.items()
+        if not _is_skipped_file(os.path.basename(arcname))
+    }
 
-                    if os.path.isfile(path):
-                        shutil.copy(path, to_copy_path)
-                    else:
-                        shutil.copytree(path, to_copy_path)
 
-        except Exception as e:
-            logger.error(f"리소스팩 생성 중 오류 발생: {e}")
+def write_resourcepack(zipf, folder_list, pack_name, source_lang="en_us"):
+    """
+    리소스팩 항목을 열린 ZIP 파일에 바로 기록합니다. (임시 폴더에 복사하지 않음)
+
+    Returns:
+        기록한 항목 수
+    """
+    entries = collect_resourcepack_entries(folder_list, pack_name, source_lang)
+    for arcname, source in entries.items():
+        if isinstance(source, bytes):
+            zipf.writestr(arcname, source)
+        else:
+            zipf.write(source, arcname)
+        logger.debug(f"압축: {arcname}")
+    return len(entries)
+
+
+def add_resourcepack_to_zip(zipf, arcname, folder_list, pack_name, source_lang="en_us"):
+    """
+    리소스팩 ZIP을 다른 ZIP 안의 항목으로 바로 기록합니다.
+
+    리소스팩 내부 파일은 한 번만 압축하고, 바깥 ZIP 항목은 무압축(STORED)으로 저장하여
+    이미 압축된 데이터를 다시 압축하지 않습니다. 중간 리소스팩 파일도 만들지 않습니다.
+
+    Returns:
+        기록한 항목 수
+    """
+    info = zipfile.ZipInfo(arcname, date_time=time.localtime()[:6])
+    info.compress_type = zipfile.ZIP_STORED
+    info.external_attr = 0o644 << 16
+    with zipf.open(info, "w") as raw:
+        with ParallelZipWriter(raw) as inner:
+            count = write_resourcepack(inner, folder_list, pack_name, source_lang)
+    logger.info(f"리소스팩 생성 완료: {arcname} ({count}개 항목)")
+    return count
 
-    # ZIP 파일로 압축 - 파일 구조 유지하면서 직접 생성
-    zip_path = os.path.join(output_dir, f"{pack_name}.zip")
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for root, _, files in os.walk(resourcepack_dir):
-            for file in files:
-                # .tmp 파일 건너뛰기
-                if (
-                    file.endswith(".tmp")
-                    or ".zip_extracted" in file
-                    or file.endswith(".converted")
-                ):
-                    continue
-                file_path = os.path.join(root, file)
-                # 리소스팩 디렉토리를 기준으로 상대 경로 생성
-                arcname = os.path.relpath(file_path, resourcepack_dir)
-                arcname = arcname.replace(source_lang, "ko_kr").replace(
-                    source_lang.split("_")[0] + "_" + source_lang.split("_")[1].upper(),
-                    "ko_KR",
-                )
-                zipf.write(file_path, arcname)
-                logger.debug(f"압축: {file_path} -> {arcname}")
 
-    # 임시 디렉토리 정리
-    shutil.rmtree(resourcepack_dir)
+def create_resourcepack(
+    output_dir,
+    folder_list,
+    pack_name="Korean-Translation",
+    source_lang="en_us",
+):
+    """
+    번역된 내용으로 마인크래프트 리소스팩을 생성합니다.
+
+    Args:
+        output_dir: 출력 디렉토리
+        folder_list: 리소스팩에 포함할 폴더 및 파일 목록
+        pack_name: 리소스팩 이름
+
+    Returns:
+        생성된 리소스팩 ZIP 파일 경로
+    """
+    # 번역 파일을 임시 폴더에 복사하지 않고 ZIP 파일에 바로 기록
+    zip_path = os.path.join(output_dir, f"{pack_name}.zip")
+    with ParallelZipWriter(zip_path) as zipf:
+        count = write_resourcepack(zipf, folder_list, pack_name, source_lang)
 
-    logger.info(f"리소스팩 생성 완료: {zip_path}")
+    logger.info(f"리소스팩 생성 완료: {zip_path} ({count}개 항목)")
     return zip_path
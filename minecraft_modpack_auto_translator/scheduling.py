@@ -0,0 +1,168 @@
+"""
+번역 작업 스케줄링
+
+파일마다 번역 비용(항목 수와 글자 수)을 추정하여 큰 작업부터 시작하고(LPT),
+혼자 전체 작업 시간을 좌우할 만큼 큰 파일은 여러 조각으로 나누어
+쉬고 있는 워커가 나눠 처리할 수 있게 합니다.
+"""
+
+import logging
+import math
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+from . import vfs
+from .config import SCHEDULER_SHARD_FACTOR, SCHEDULER_UNIT_WEIGHT
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_cost(units: int, chars: int, unit_weight: float = SCHEDULER_UNIT_WEIGHT):
+    """
+    번역 비용을 추정합니다.
+
+    항목마다 LLM 요청이 한 번씩 발생하므로 항목 수에 가중치를 주고 글자 수를 더합니다.
+
+    Args:
+        units: 번역 항목 수
+        chars: 글자 수
+        unit_weight: 항목 하나의 비용 (글자 수 단위)
+    """
+    return units * unit_weight + chars
+
+
+def estimate_file_cost(path: str) -> Tuple[int, int]:
+    """
+    파일을 파싱하지 않고 (항목 수, 글자 수)를 추정합니다.
+
+    언어 파일은 대부분 한 줄에 한 항목이므로 줄 수를 항목 수로 사용합니다.
+
+    Returns:
+        (추정 항목 수, 바이트 수). 파일을 읽을 수 없으면 (0, 0)
+    """
+    try:
+        content = vfs.read_bytes(path)
+    except OSError:
+        return 0, 0
+    return content.count(b"\n") + 1, len(content)
+
+
+def value_cost(value: Any, unit_weight: float = SCHEDULER_UNIT_WEIGHT) -> float:
+    """파싱된 항목 하나의 비용을 추정합니다."""
+    return estimate_cost(
+        1, len(value) if isinstance(value, str) else len(str(value)), unit_weight
+    )
+
+
+def plan_work_units(
+    costs: Sequence[float],
+    max_workers: int,
+    max_shards: Sequence[int] = None,
+    shard_factor: float = SCHEDULER_SHARD_FACTOR,
+) -> List[Tuple[int, int, int, float]]:
+    """
+    파일별 비용으로 작업 단위를 계획합니다.
+
+    워커 하나의 이상적인 부하(전체 비용 / 워커 수)에 shard_factor를 곱한 값보다
+    큰 파일은 여러 조각으로 나눕니다. 결과는 비용이 큰 순서(LPT)로 정렬됩니다.
+
+    Args:
+        costs: 파일별 추정 비용
+        max_workers: 동시에 처리하는 워커 수
+        max_shards: 파일별 최대 조각 수 (보통 항목 수)
+        shard_factor: 조각 크기 기준 (이상적인 워커 부하 대비 비율)
+
+    Returns:
+        (파일 인덱스, 조각 인덱스, 조각 수, 조각 비용) 목록
+    """
+    total = sum(costs)
+    units = []
+    if total <= 0:
+        return [(index, 0, 1, 0.0) for index in range(len(costs))]
+
+    target = max(total / max(1, max_workers) * shard_factor, 1.0)
+    for index, cost in enumerate(costs):
+        shards = max(1, math.ceil(cost / target)) if max_workers > 1 else 1
+        if max_shards is not None:
+            shards = max(1, min(shards, max_shards[index]))
+        for shard in range(shards):
+            units.append((index, shard, shards, cost / shards))
+
+    # 비용이 큰 작업부터 (같은 비용이면 원래 순서 유지)
+    units.sort(key=lambda unit: -unit[3])
+    return units
+
+
+def split_items(
+    data: Dict[str, Any], shards: int, unit_weight: float = SCHEDULER_UNIT_WEIGHT
+) -> List[Dict[str, Any]]:
+    """
+    파싱된 데이터를 비용이 비슷한 연속 구간으로 나눕니다.
+
+    Args:
+        data: 키-값 데이터
+        shards: 나눌 조각 수
+
+    Returns:
+        조각 목록 (빈 조각은 제외)
+    """
+    if shards <= 1 or len(data) <= 1:
+        return [data]
+
+    costs = [value_cost(value, unit_weight) for value in data.values()]
+    target = sum(costs) / shards
+    parts: List[Dict[str, Any]] = [{}]
+    accumulated = 0.0
+    for (key, value), cost in zip(data.items(), costs):
+        if accumulated >= target * len(parts) and len(parts) < shards:
+            parts.append({})
+        parts[-1][key] = value
+        accumulated += cost
+    return [part for part in parts if part]
+
+
+def ideal_makespan(durations: Sequence[float], workers: int) -> float:
+    """작업 시간 목록으로 계산한 이상적인 전체 작업 시간 (하한)"""
+    if not durations:
+        return 0.0
+    return max(sum(durations) / max(1, workers), max(durations))
+
+
+class MakespanTracker:
+    """실제 전체 작업 시간과 이상적인 작업 시간을 비교하기 위한 기록기"""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.durations: List[float] = []
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+
+    def record(self, duration: float) -> None:
+        """작업 단위 하나의 처리 시간을 기록합니다."""
+        self.durations.append(duration)
+
+    def finish(self) -> Dict[str, float]:
+        """기록을 마치고 통계를 반환합니다."""
+        self.finished_at = time.perf_counter()
+        return self.stats()
+
+    def stats(self) -> Dict[str, float]:
+        """현재까지의 통계를 반환합니다."""
+        end = self.finished_at or time.perf_counter()
+        makespan = end - self.started_at
+        ideal = ideal_makespan(self.durations, self.workers)
+        return {
+            "units": len(self.durations),
+            "makespan": makespan,
+            "ideal": ideal,
+            "efficiency": (ideal / makespan) if makespan > 0 else 1.0,
+        }
+
+    def summary(self) -> str:
+        """로그용 요약 문자열을 반환합니다."""
+        stats = self.stats()
+        return (
+            f"작업 시간: {stats['makespan']:.1f}초 / 이상적인 작업 시간: "
+            f"{stats['ideal']:.1f}초 (효율 {stats['efficiency'] * 100:.0f}%, "
+            f"작업 단위 {stats['units']}개, 워커 {self.workers}개)"
+        )
@@ -0,0 +1,271 @@
+"""
+JAR 번역 결과 저장소
+
+같은 모드 JAR은 여러 모드팩에서 반복해서 나옵니다. 이 저장소는 번역이 끝난 파일 내용을
+(JAR 핑거프린트, JAR 내부 항목 경로, 언어) 기준으로 SQLite에 보관하여, 이미 번역한 JAR을
+다시 만나면 LLM 요청 없이 바로 결과를 씁니다. 파일 내용은 해시로 한 번만 저장하고,
+마지막 사용 시각과 전체 용량을 기준으로 오래된 항목부터 정리합니다.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from . import vfs
+from .config import TRANSLATION_STORE_MAX_AGE_DAYS, TRANSLATION_STORE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRANSLATION_STORE_PATH = "./temp/translation_store.sqlite3"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS blobs (
+        digest TEXT PRIMARY KEY,
+        content BLOB NOT NULL,
+        size INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        fingerprint INTEGER NOT NULL,
+        entry TEXT NOT NULL,
+        lang TEXT NOT NULL,
+        digest TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        PRIMARY KEY (fingerprint, entry, lang)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)",
+)
+
+
+def resolve_jar_entry(
+    path: str, jar_fingerprints: Dict[str, int]
+) -> Optional[Tuple[int, str]]:
+    """
+    JAR 내부 항목의 가상 경로를 저장소 키로 변환합니다.
+
+    Args:
+        path: `<모드팩>/mods/extracted/<JAR 이름>/<항목 경로>` 형태의 경로
+        jar_fingerprints: JAR 파일 이름 -> 핑거프린트
+
+    Returns:
+        (핑거프린트, 항목 경로). JAR 항목이 아니거나 핑거프린트가 없으면 None
+    """
+    resolved = vfs.resolve(path)
+    if resolved is None:
+        return None
+    fingerprint = jar_fingerprints.get(os.path.basename(resolved[0]))
+    if fingerprint is None:
+        return None
+    return int(fingerprint), resolved[1]
+
+
+class TranslationStore:
+    """
+    SQLite 기반 JAR 번역 결과 저장소
+
+    get()/put()은 입출력 스레드에서 호출할 수 있도록 내부 잠금으로 보호됩니다.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_TRANSLATION_STORE_PATH,
+        max_age_days: float = TRANSLATION_STORE_MAX_AGE_DAYS,
+        max_bytes: int = TRANSLATION_STORE_MAX_BYTES,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_age_days: 마지막 사용 후 보관 기간 (일 단위, 0 이하면 제한 없음)
+            max_bytes: 최대 저장 용량 (바이트 단위, 0 이하면 제한 없음)
+        """
+        self.path = path
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.stored = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def __enter__(self) -> "TranslationStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get(self, fingerprint: int, entry: str, lang: str) -> Optional[bytes]:
+        """
+        저장된 번역 결과를 찾습니다.
+
+        Args:
+            fingerprint: JAR 핑거프린트
+            entry: JAR 내부 항목 경로
+            lang: 언어 쌍 (예: en_us:ko_kr)
+
+        Returns:
+            번역된 파일 내용. 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT b.content FROM entries e JOIN blobs b ON e.digest = b.digest "
+                "WHERE e.fingerprint = ? AND e.entry = ? AND e.lang = ?",
+                (fingerprint, entry, lang),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? "
+                "WHERE fingerprint = ? AND entry = ? AND lang = ?",
+                (time.time(), fingerprint, entry, lang),
+            )
+            self._conn.commit()
+            self.hits += 1
+        return bytes(row[0])
+
+    def get_many(
+        self, keys: Iterable[Tuple[int, str]], lang: str
+    ) -> Dict[Tuple[int, str], bytes]:
+        """
+        여러 항목을 한 번에 찾습니다.
+
+        Args:
+            keys: (JAR 핑거프린트, 항목 경로) 목록
+            lang: 언어 쌍 (예: en_us:ko_kr)
+
+        Returns:
+            찾은 항목의 (핑거프린트, 항목 경로) -> 번역된 파일 내용
+        """
+        found = {}
+        now = time.time()
+        with self._lock:
+            for fingerprint, entry in keys:
+                row = self._conn.execute(
+                    "SELECT b.content FROM entries e "
+                    "JOIN blobs b ON e.digest = b.digest "
+                    "WHERE e.fingerprint = ? AND e.entry = ? AND e.lang = ?",
+                    (fingerprint, entry, lang),
+                ).fetchone()
+                if row is not None:
+                    found[(fingerprint, entry)] = bytes(row[0])
+            if found:
+                self._conn.executemany(
+                    "UPDATE entries SET accessed_at = ? "
+                    "WHERE fingerprint = ? AND entry = ? AND lang = ?",
+                    [(now, fp, entry, lang) for fp, entry in found],
+                )
+                self._conn.commit()
+            self.hits += len(found)
+        return found
+
+    def put(self, fingerprint: int, entry: str, lang: str, content: bytes) -> None:
+        """
+        번역 결과를 저장합니다. 같은 내용은 한 번만 저장됩니다.
+
+        Args:
+            fingerprint: JAR 핑거프린트
+            entry: JAR 내부 항목 경로
+            lang: 언어 쌍 (예: en_us:ko_kr)
+            content: 번역된 파일 내용
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO blobs (digest, content, size) "
+                    "VALUES (?, ?, ?)",
+                    (digest, sqlite3.Binary(content), len(content)),
+                )
+                self._conn.execute(
+                    "INSERT INTO entries "
+                    "(fingerprint, entry, lang, digest, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (fingerprint, entry, lang) DO UPDATE SET "
+                    "digest = excluded.digest, accessed_at = excluded.accessed_at",
+                    (fingerprint, entry, lang, digest, now, now),
+                )
+                self._conn.commit()
+                self.stored += 1
+            except sqlite3.Error as e:
+                logger.error(f"번역 결과 저장소 기록 중 오류 발생: {e}")
+                self._conn.rollback()
+
+    def evict(self) -> int:
+        """
+        보관 기간이 지난 항목을 지우고, 최대 용량을 넘으면 오래 사용하지 않은 항목부터 지웁니다.
+
+        Returns:
+            삭제된 항목 수
+        """
+        removed = 0
+        with self._lock:
+            try:
+                if self.max_age_days > 0:
+                    cutoff = time.time() - self.max_age_days * 86400
+                    removed += self._conn.execute(
+                        "DELETE FROM entries WHERE accessed_at < ?", (cutoff,)
+                    ).rowcount
+                self._delete_orphan_blobs()
+
+                if self.max_bytes > 0:
+                    total = self._conn.execute(
+                        "SELECT COALESCE(SUM(size), 0) FROM blobs"
+                    ).fetchone()[0]
+                    if total > self.max_bytes:
+                        removed += self._evict_by_size()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"번역 결과 저장소 정리 중 오류 발생: {e}")
+                self._conn.rollback()
+        if removed:
+            logger.info(f"번역 결과 저장소 정리: {removed}개 항목 삭제")
+        return removed
+
+    def _evict_by_size(self) -> int:
+        # 최근에 사용한 항목부터 용량을 채우고, 넘치는 항목을 삭제
+        rows = self._conn.execute(
+            "SELECT e.rowid, e.digest, b.size FROM entries e "
+            "JOIN blobs b ON e.digest = b.digest ORDER BY e.accessed_at DESC"
+        ).fetchall()
+        kept_digests = set()
+        used = 0
+        doomed = []
+        for rowid, digest, size in rows:
+            if digest in kept_digests:
+                continue
+            if used + size <= self.max_bytes:
+                kept_digests.add(digest)
+                used += size
+            else:
+                doomed.append((rowid,))
+        # 남길 내용을 가리키는 다른 항목은 지우지 않음
+        self._conn.executemany("DELETE FROM entries WHERE rowid = ?", doomed)
+        self._delete_orphan_blobs()
+        return len(doomed)
+
+    def _delete_orphan_blobs(self) -> None:
+        self._conn.execute(
+            "DELETE FROM blobs WHERE digest NOT IN (SELECT digest FROM entries)"
+        )
+
+    def close(self) -> None:
+        """오래된 항목을 정리하고 저장소를 닫습니다."""
+        self.evict()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,147 @@
+"""
+JAR 내부 파일을 압축 해제 없이 읽기 위한 가상 파일 계층
+
+모드 JAR의 번역 대상 파일은 `<모드팩>/mods/extracted/<JAR 이름>/<항목 경로>` 형태의
+가상 경로로 다룹니다. 이 경로에 실제 파일이 있으면 그 파일을 사용하고, 없으면
+`<모드팩>/mods/<JAR 이름>`의 중앙 디렉토리에서 항목을 찾아 바로 읽습니다.
+번역 결과는 지금처럼 출력 폴더의 같은 상대 경로에 실제 파일로 저장됩니다.
+
+열어 둔 JAR 핸들은 프로세스 전체에서 공유하므로, 작업은 `with vfs.session():` 안에서
+읽습니다. 동시에 실행 중인 작업이 모두 끝났을 때만 핸들을 닫습니다.
+"""
+
+import contextlib
+import logging
+import os
+import threading
+import zipfile
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+VIRTUAL_JAR_MARKER = "/mods/extracted/"
+
+_ARCHIVES: Dict[str, zipfile.ZipFile] = {}
+_ARCHIVES_LOCK = threading.Lock()
+_ARCHIVES_PID = os.getpid()
+# 진행 중인 session() 수 (0이 되면 캐시된 JAR을 닫음)
+_SESSIONS = 0
+
+
+def resolve(path: str) -> Optional[Tuple[str, str]]:
+    """
+    가상 경로를 (JAR 경로, 항목 경로)로 변환합니다.
+
+    Returns:
+        가상 경로 형식이 아니면 None
+    """
+    normalized = "/" + path.replace("\\", "/")
+    index = normalized.find(VIRTUAL_JAR_MARKER)
+    if index < 0:
+        return None
+    jar_name, sep, entry = normalized[index + len(VIRTUAL_JAR_MARKER) :].partition("/")
+    if not jar_name or not sep or not entry:
+        return None
+    return (normalized[:index] + "/mods/" + jar_name)[1:], entry
+
+
+def virtual_path(jar_path: str, entry: str) -> str:
+    """JAR 경로와 항목 경로로 가상 경로를 만듭니다."""
+    mods_dir, jar_name = os.path.split(jar_path)
+    return os.path.join(mods_dir, "extracted", jar_name, entry)
+
+
+def _get_archive(jar_path: str) -> Optional[zipfile.ZipFile]:
+    """JAR을 열어 캐시합니다. (프로세스마다 따로 엽니다)"""
+    global _ARCHIVES_PID
+    with _ARCHIVES_LOCK:
+        if _ARCHIVES_PID != os.getpid():
+            # fork된 자식 프로세스는 부모의 파일 핸들을 공유하지 않도록 새로 엽니다.
+            _ARCHIVES.clear()
+            _ARCHIVES_PID = os.getpid()
+        archive = _ARCHIVES.get(jar_path)
+        if archive is None:
+            if not os.path.isfile(jar_path):
+                return None
+            try:
+                archive = zipfile.ZipFile(jar_path, "r")
+            except (OSError, zipfile.BadZipFile) as e:
+                logger.warning(f"JAR 파일을 열 수 없습니다: {jar_path} ({e})")
+                return None
+            _ARCHIVES[jar_path] = archive
+        return archive
+
+
+def _get_entry(path: str) -> Optional[Tuple[zipfile.ZipFile, zipfile.ZipInfo]]:
+    resolved = resolve(path)
+    if resolved is None:
+        return None
+    archive = _get_archive(resolved[0])
+    if archive is None:
+        return None
+    info = archive.NameToInfo.get(resolved[1])
+    if info is None or info.is_dir():
+        return None
+    return archive, info
+
+
+def exists(path: str) -> bool:
+    """실제 파일 또는 JAR 항목이 있는지 확인합니다."""
+    if os.path.exists(path):
+        return True
+    return _get_entry(path) is not None
+
+
+def getsize(path: str) -> int:
+    """파일 크기 (JAR 항목은 압축 해제 후 크기)를 반환합니다."""
+    if os.path.exists(path):
+        return os.path.getsize(path)
+    entry = _get_entry(path)
+    if entry is None:
+        raise FileNotFoundError(path)
+    return entry[1].file_size
+
+
+def read_bytes(path: str) -> bytes:
+    """실제 파일 또는 JAR 항목의 내용을 바이트로 읽습니다."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        entry = _get_entry(path)
+        if entry is None:
+            raise
+    archive, info = entry
+    return archive.read(info)
+
+
+def read_text(path: str, errors: str = "strict") -> str:
+    """실제 파일 또는 JAR 항목의 내용을 UTF-8 문자열로 읽습니다."""
+    return read_bytes(path).decode("utf-8", errors=errors)
+
+
+@contextlib.contextmanager
+def session():
+    """
+    작업 하나가 JAR 항목을 읽는 동안 캐시된 JAR 핸들을 유지합니다.
+
+    여러 작업이 동시에 실행될 수 있으므로 session 수를 세어, 마지막 session이
+    끝날 때만 캐시된 JAR 파일을 닫습니다.
+    """
+    global _SESSIONS
+    with _ARCHIVES_LOCK:
+        _SESSIONS += 1
+    try:
+        yield
+    finally:
+        archives = []
+        with _ARCHIVES_LOCK:
+            _SESSIONS -= 1
+            if _SESSIONS == 0:
+                archives = list(_ARCHIVES.values())
+                _ARCHIVES.clear()
+        for archive in archives:
+            try:
+                archive.close()
+            except Exception:
+                pass
@@ -0,0 +1,317 @@
+"""
+ZIP 작성 도구
+
+- 원본 복사: JAR/ZIP을 다시 만들 때 바뀌지 않은 항목은 압축된 바이트를 그대로 복사하여,
+  재압축 시간이 바뀐 파일 크기에만 비례하도록 합니다.
+- 병렬 압축: zlib은 압축 중 GIL을 놓으므로 여러 항목을 스레드에서 동시에 압축하고,
+  ZIP에는 추가한 순서대로 기록합니다.
+"""
+
+import copy
+import logging
+import os
+import struct
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, Union
+
+from .config import ARCHIVE_COMPRESS_LEVEL, ARCHIVE_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# 로컬 파일 헤더 (고정 길이 30바이트)
+_LOCAL_HEADER_STRUCT = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+# 데이터 뒤에 크기/CRC가 기록되는 항목 플래그
+_FLAG_DATA_DESCRIPTOR = 0x08
+# ZIP64 확장 필드 ID
+_ZIP64_EXTRA_ID = 0x0001
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """확장 필드에서 ZIP64 항목을 제거합니다. (필요하면 헤더를 쓸 때 다시 추가됨)"""
+    result = bytearray()
+    offset = 0
+    while offset + 4 <= len(extra):
+        field_id, size = struct.unpack_from("<HH", extra, offset)
+        end = offset + 4 + size
+        if field_id != _ZIP64_EXTRA_ID:
+            result += extra[offset:end]
+        offset = end
+    return bytes(result)
+
+
+def _data_offset(src: zipfile.ZipFile, info: zipfile.ZipInfo) -> int:
+    """원본 항목의 압축 데이터 시작 위치를 로컬 헤더에서 계산합니다."""
+    src.fp.seek(info.header_offset)
+    header = src.fp.read(_LOCAL_HEADER_STRUCT.size)
+    if len(header) != _LOCAL_HEADER_STRUCT.size:
+        raise zipfile.BadZipFile(f"로컬 헤더를 읽을 수 없습니다: {info.filename}")
+    fields = _LOCAL_HEADER_STRUCT.unpack(header)
+    if fields[0] != _LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"잘못된 로컬 헤더입니다: {info.filename}")
+    name_length, extra_length = fields[-2], fields[-1]
+    return info.header_offset + _LOCAL_HEADER_STRUCT.size + name_length + extra_length
+
+
+def copy_raw_entry(
+    src: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    dst: zipfile.ZipFile,
+    arcname: Optional[str] = None,
+) -> bool:
+    """
+    원본 ZIP 항목의 압축된 바이트를 그대로 대상 ZIP에 복사합니다.
+
+    로컬 헤더는 중앙 디렉토리 정보로 새로 작성하고(데이터 디스크립터 플래그 제거),
+    대상 ZIP의 항목 목록과 중앙 디렉토리 시작 위치를 갱신합니다.
+    원본 복사가 불가능하면 압축을 풀어 다시 쓰는 방식으로 대신합니다.
+
+    Args:
+        src: 읽기 모드로 열린 원본 ZIP
+        info: 복사할 항목
+        dst: 쓰기 모드로 열린 대상 ZIP
+        arcname: 대상 ZIP에서 사용할 이름 (없으면 원래 이름)
+
+    Returns:
+        원본 복사에 성공하면 True, 다시 압축해서 썼으면 False
+    """
+    new_info = copy.copy(info)
+    if arcname is not None:
+        new_info.filename = arcname
+        new_info.orig_filename = arcname
+
+    try:
+        if dst._writing or src.fp is None or dst.fp is None:
+            raise ValueError("원본 복사를 지원하지 않는 ZIP 상태입니다.")
+        with src._lock:
+            data_offset = _data_offset(src, info)
+        new_info.flag_bits &= ~_FLAG_DATA_DESCRIPTOR
+        new_info.extra = _strip_zip64_extra(info.extra)
+        zip64 = (
+            new_info.file_size > zipfile.ZIP64_LIMIT
+            or new_info.compress_size > zipfile.ZIP64_LIMIT
+        )
+    except Exception as e:
+        logger.debug(f"원본 복사 불가, 다시 압축합니다: {info.filename} ({e})")
+        dst.writestr(new_info, src.read(info))
+        return False
+
+    def read_chunks():
+        remaining = info.compress_size
+        with src._lock:
+            src.fp.seek(data_offset)
+            while remaining > 0:
+                chunk = src.fp.read(min(remaining, _COPY_CHUNK_SIZE))
+                if not chunk:
+                    raise zipfile.BadZipFile(
+                        f"압축 데이터가 잘렸습니다: {info.filename}"
+                    )
+                remaining -= len(chunk)
+                yield chunk
+
+    _append_entry(dst, new_info, read_chunks(), zip64)
+    return True
+
+
+def _append_entry(
+    dst: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    chunks: Iterable[bytes],
+    zip64: Optional[bool] = None,
+) -> None:
+    """
+    CRC와 크기가 채워진 항목을 압축된 데이터와 함께 대상 ZIP 끝에 기록합니다.
+
+    크기를 미리 알고 있으므로 데이터 디스크립터 없이 기록하며,
+    탐색할 수 없는 스트림(다른 ZIP의 항목 등)에도 쓸 수 있습니다.
+    """
+    if zip64 is None:
+        zip64 = (
+            info.file_size > zipfile.ZIP64_LIMIT
+            or info.compress_size > zipfile.ZIP64_LIMIT
+        )
+    if zip64 and not dst._allowZip64:
+        raise zipfile.LargeZipFile("ZIP64 확장이 필요한 항목입니다.")
+    with dst._lock:
+        if dst._seekable:
+            dst.fp.seek(dst.start_dir)
+        info.header_offset = dst.start_dir
+        dst.fp.write(info.FileHeader(zip64))
+        for chunk in chunks:
+            dst.fp.write(chunk)
+        dst.start_dir = dst.fp.tell()
+        dst.filelist.append(info)
+        dst.NameToInfo[info.filename] = info
+        dst._didModify = True
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _prepare_entry(
+    source: Union[bytes, Callable[[], bytes]], compress_type: int, level: int
+):
+    """항목 내용을 읽고 CRC와 압축 결과를 계산합니다. (작업자 스레드에서 실행)"""
+    data = source() if callable(source) else source
+    crc = zlib.crc32(data)
+    if compress_type == zipfile.ZIP_DEFLATED:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+    elif compress_type == zipfile.ZIP_STORED:
+        compressed = data
+    else:
+        raise NotImplementedError(f"지원하지 않는 압축 방식입니다: {compress_type}")
+    return crc, len(data), compressed
+
+
+class ParallelZipWriter:
+    """
+    여러 항목을 스레드에서 동시에 압축하고 추가한 순서대로 기록하는 ZIP 작성기
+
+    zipfile.ZipFile의 write()/writestr()/open() 대신 사용할 수 있습니다.
+    동시에 메모리에 올라가는 항목 수는 window개로 제한됩니다.
+    """
+
+    def __init__(
+        self,
+        file,
+        compresslevel: int = ARCHIVE_COMPRESS_LEVEL,
+        max_workers: int = ARCHIVE_WORKERS,
+        window: Optional[int] = None,
+    ):
+        """
+        Args:
+            file: 저장할 파일 경로 또는 쓰기 가능한 파일 객체
+            compresslevel: 압축 수준 (0이면 무압축 STORED, 1~9는 DEFLATE)
+            max_workers: 압축 스레드 수 (0이면 CPU 코어 수, 1이면 순차 처리)
+            window: 기록을 기다리며 메모리에 둘 최대 항목 수
+        """
+        self.compresslevel = max(0, min(9, compresslevel))
+        self.compression = (
+            zipfile.ZIP_DEFLATED if self.compresslevel > 0 else zipfile.ZIP_STORED
+        )
+        self._zf = zipfile.ZipFile(file, "w", self.compression)
+        workers = max_workers or os.cpu_count() or 1
+        self._executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcpack-zip")
+            if workers > 1
+            else None
+        )
+        self._window = window or workers * 4
+        self._pending = deque()
+
+    def __enter__(self) -> "ParallelZipWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._abort()
+
+    @property
+    def zip_file(self) -> zipfile.ZipFile:
+        """내부 ZipFile (직접 사용하기 전에 flush()를 호출해야 함)"""
+        return self._zf
+
+    def write(
+        self,
+        filename: str,
+        arcname: Optional[str] = None,
+        compress_type: Optional[int] = None,
+    ) -> None:
+        """파일을 추가합니다. 파일 읽기와 압축은 작업자 스레드에서 수행합니다."""
+        info = zipfile.ZipInfo.from_file(filename, arcname)
+        if info.is_dir():
+            self._submit(info, b"", zipfile.ZIP_STORED)
+        else:
+            self._submit(info, lambda: _read_file(filename), compress_type)
+
+    def writestr(
+        self,
+        zinfo_or_arcname: Union[str, zipfile.ZipInfo],
+        data: Union[str, bytes],
+        compress_type: Optional[int] = None,
+    ) -> None:
+        """메모리의 내용을 추가합니다."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if isinstance(zinfo_or_arcname, zipfile.ZipInfo):
+            info = copy.copy(zinfo_or_arcname)
+            if compress_type is None and info.compress_type in (
+                zipfile.ZIP_STORED,
+                zipfile.ZIP_DEFLATED,
+            ):
+                compress_type = info.compress_type
+        else:
+            info = zipfile.ZipInfo(zinfo_or_arcname, time.localtime(time.time())[:6])
+            if info.is_dir():
+                info.external_attr = 0o40775 << 16 | 0x10
+            else:
+                info.external_attr = 0o600 << 16
+        self._submit(info, data, compress_type)
+
+    def _submit(self, info, source, compress_type) -> None:
+        compress_type = self.compression if compress_type is None else compress_type
+        level = self.compresslevel or 6
+        info.compress_type = compress_type
+        info.flag_bits &= ~_FLAG_DATA_DESCRIPTOR
+        info.extra = _strip_zip64_extra(info.extra)
+        if self._executor is None:
+            future = Future()
+            future.set_result(_prepare_entry(source, compress_type, level))
+        else:
+            future = self._executor.submit(_prepare_entry, source, compress_type, level)
+        self._pending.append((info, future))
+        while len(self._pending) > self._window:
+            self._commit_next()
+
+    def _commit_next(self) -> None:
+        info, future = self._pending.popleft()
+        crc, size, compressed = future.result()
+        info.CRC = crc
+        info.file_size = size
+        info.compress_size = len(compressed)
+        _append_entry(self._zf, info, (compressed,))
+
+    def flush(self) -> None:
+        """대기 중인 항목을 모두 기록합니다."""
+        while self._pending:
+            self._commit_next()
+
+    def open(self, name, mode: str = "r", **kwargs):
+        """ZipFile.open()과 같습니다. 대기 중인 항목을 먼저 기록합니다."""
+        self.flush()
+        return self._zf.open(name, mode, **kwargs)
+
+    def copy_raw_entry(
+        self,
+        src: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        arcname: Optional[str] = None,
+    ) -> bool:
+        """다른 ZIP의 항목을 압축된 상태 그대로 복사합니다. (copy_raw_entry 참고)"""
+        self.flush()
+        return copy_raw_entry(src, info, self._zf, arcname)
+
+    def close(self) -> None:
+        """남은 항목을 기록하고 ZIP을 닫습니다."""
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            self._zf.close()
+
+    def _abort(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pending.clear()
+        self._zf.close()
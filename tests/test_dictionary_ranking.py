@@ -0,0 +1,53 @@
+import pytest
+
+from gradio_modules.dictionary_builder import (
+    add_pairs_to_dictionary,
+    tag_dictionary_sources,
+)
+from minecraft_modpack_auto_translator.loaders import context as context_module
+from minecraft_modpack_auto_translator.loaders.context import TranslationContext
+
+
+@pytest.fixture(autouse=True)
+def empty_global_dictionary(monkeypatch):
+    # 공유 사전은 모듈 전역이므로 테스트마다 비움
+    monkeypatch.setattr(context_module, "_GLOBAL_DICTIONARY", {})
+    monkeypatch.setattr(context_module, "_GLOBAL_DICTIONARY_LOWERCASE", {})
+    monkeypatch.setattr(context_module, "_GLOBAL_CANDIDATE_STATS", {})
+
+
+def build(pairs_by_source):
+    dictionary, dictionary_lowercase, sources = {}, {}, {}
+    for source, pairs in pairs_by_source:
+        add_pairs_to_dictionary(pairs, dictionary, dictionary_lowercase)
+        tag_dictionary_sources(sources, pairs, source)
+    return dictionary, sources
+
+
+def test_custom_entry_outranks_more_frequent_llm_candidate():
+    dictionary, sources = build([("custom", [("Copper", "구리")])])
+    context = TranslationContext(None, dictionary, dictionary_sources=sources)
+
+    for _ in range(5):
+        context.add_to_dictionary("copper", "코퍼")
+
+    assert context.get_dictionary()["Copper"] == ["구리", "코퍼"]
+
+
+def test_seeded_lists_are_ranked_by_frequency_and_capped():
+    pairs = [("Ore", f"광석{i}") for i in range(8)] + [("Ore", "광석7")] * 3
+    dictionary, sources = build([("existing", pairs)])
+    assert len(dictionary["Ore"]) == 8
+
+    context = TranslationContext(
+        None,
+        dictionary,
+        dictionary_sources=sources,
+        max_candidates=3,
+        prompt_candidates=2,
+    )
+
+    value = context.get_dictionary()["Ore"]
+    assert value == ["광석7", "광석0", "광석1"]
+    assert context.format_dictionary_value(value) == "광석7, 광석0"
+    assert context.get_candidate_stats("ore")["광석7"]["count"] == 4
@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 느린 CI 환경을 고려한 넉넉한 상한 (초)
+IMPORT_BUDGET_SECONDS = 10.0
+
+_SCRIPT = """
+import json, time
+started = time.perf_counter()
+import minecraft_modpack_auto_translator.parsers
+elapsed = time.perf_counter() - started
+from minecraft_modpack_auto_translator import assets, glossary
+print(json.dumps({
+    "elapsed": elapsed,
+    "loaded": sorted(lang for a in assets._ASSETS.values() for lang in a._cache),
+    "glossaries": len(glossary._GLOSSARIES),
+}))
+"""
+
+
+def test_parsers_import_does_not_load_language_assets():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (ROOT, env.get("PYTHONPATH")) if p)
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+
+    # en_us/ko_kr 공식 언어 파일과 용어집은 처음 사용할 때만 로드되어야 함
+    assert result["loaded"] == []
+    assert result["glossaries"] == 0
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
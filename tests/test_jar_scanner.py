@@ -0,0 +1,57 @@
+import json
+import zipfile
+
+from gradio_modules.jar_scanner import (
+    collect_jar_dictionary_pairs,
+    index_locale_entries,
+)
+
+PATCHOULI_NAMES = [
+    "assets/mod/patchouli_books/guide/en_us/entries/ores/raw_ore.json",
+    "assets/mod/patchouli_books/guide/ko_kr/entries/ores/raw_ore.json",
+    "assets/mod/patchouli_books/guide/en_us/entries/trees/big_tree.json",
+    "assets/mod/patchouli_books/guide/ko_kr/entries/trees/big_tree.json",
+    "assets/mod/lang/en_us.json",
+    "assets/mod/lang/ko_kr.json",
+    "assets/mod/lang/ja_jp.json",
+]
+
+
+def test_index_pairs_underscore_named_patchouli_entries():
+    index = index_locale_entries(PATCHOULI_NAMES, ("en_us", "ko_kr"))
+
+    pairs = {
+        locales["en_us"]: locales["ko_kr"]
+        for locales in index.values()
+        if "en_us" in locales and "ko_kr" in locales
+    }
+    assert pairs == {
+        PATCHOULI_NAMES[0]: PATCHOULI_NAMES[1],
+        PATCHOULI_NAMES[2]: PATCHOULI_NAMES[3],
+        PATCHOULI_NAMES[4]: PATCHOULI_NAMES[5],
+    }
+    # 요청하지 않은 언어와 raw_ore, big_tree는 언어 코드로 보지 않음
+    assert all(set(locales) <= {"en_us", "ko_kr"} for locales in index.values())
+
+
+def test_index_matches_locale_case_insensitively():
+    index = index_locale_entries(
+        ["assets/mod/lang/en_US.lang", "assets/mod/lang/ko_KR.lang"],
+        ("en_us", "ko_kr"),
+    )
+    assert list(index.values()) == [
+        {"en_us": "assets/mod/lang/en_US.lang", "ko_kr": "assets/mod/lang/ko_KR.lang"}
+    ]
+
+
+def test_collect_pairs_from_underscore_named_patchouli_entries(tmp_path):
+    jar = tmp_path / "mod.jar"
+    with zipfile.ZipFile(jar, "w") as zf:
+        zf.writestr(PATCHOULI_NAMES[0], json.dumps({"name": "Raw Ore"}))
+        zf.writestr(PATCHOULI_NAMES[1], json.dumps({"name": "원석"}))
+
+    result = collect_jar_dictionary_pairs(str(jar), "en_us")
+
+    assert result["error"] is None
+    assert result["files"] == 1
+    assert result["pairs"] == [("Raw Ore", "원석")]
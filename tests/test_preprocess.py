@@ -0,0 +1,57 @@
+import asyncio
+
+from minecraft_modpack_auto_translator.preprocess import (
+    DictionaryKeyIndex,
+    PreprocessPool,
+    find_dictionary_keys,
+)
+
+KEYS = [
+    "Iron Ingot",
+    "Iron Ore",
+    "Raw Iron",
+    "Golden Apple",
+    "Ender Pearl",
+    "Pearls of Wisdom",
+    "Block of Iron",
+    "Crafting Table",
+]
+TEXTS = [
+    "Smelt raw iron ore into an Iron Ingot",
+    "Throw ender pearls to teleport [P1]",
+    "A golden apple grants absorption",
+    "Nothing relevant here",
+]
+
+
+def test_key_index_matches_linear_search():
+    index = DictionaryKeyIndex(KEYS)
+    for text in TEXTS:
+        assert index.find(text) == find_dictionary_keys(text, KEYS)
+
+
+def test_process_pool_retrieval_sees_added_keys():
+    async def run():
+        pool = PreprocessPool("process", max_workers=2, snapshot_refresh=1)
+        try:
+            keys = list(KEYS)
+            first = await asyncio.gather(
+                *(pool.retrieve(text, keys, generation=1) for text in TEXTS)
+            )
+            keys.append("Teleport Pad")
+            added = await pool.retrieve(TEXTS[1], keys, generation=1)
+            # 추가 키가 많아 스냅샷을 다시 만든 뒤에도 같은 결과
+            keys.extend(["Absorption Heart", "Wisdom Tome"])
+            rebuilt = await pool.retrieve(TEXTS[2], keys, generation=1)
+            # 새 세대의 사전은 새 스냅샷으로 검색
+            reset = await pool.retrieve(TEXTS[0], KEYS[:3], generation=2)
+        finally:
+            pool.close()
+        return first, added, rebuilt, keys, reset
+
+    first, added, rebuilt, keys, reset = asyncio.run(run())
+    assert first == [find_dictionary_keys(text, KEYS) for text in TEXTS]
+    assert "Teleport Pad" in added
+    assert added == find_dictionary_keys(TEXTS[1], keys[: len(KEYS) + 1])
+    assert rebuilt == find_dictionary_keys(TEXTS[2], keys)
+    assert reset == find_dictionary_keys(TEXTS[0], KEYS[:3])